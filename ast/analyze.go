@@ -277,3 +277,34 @@ func collectAssignedNamesFromExpression(expr Expression, addName func(string)) {
 		}
 	}
 }
+
+// LoopAppendTarget returns the name of a list that a loop body appends to as
+// one of its top-level statements, out.append(x) or append(out, x), or "" if
+// there is none. Appends nested under if/while/try are ignored, since they may
+// not run on every iteration.
+func LoopAppendTarget(body *BlockStatement) string {
+	if body == nil {
+		return ""
+	}
+	for _, stmt := range body.Statements {
+		es, ok := stmt.(*ExpressionStatement)
+		if !ok {
+			continue
+		}
+		switch call := es.Expression.(type) {
+		case *MethodCallExpression:
+			if call.Method != nil && call.Method.Value() == "append" && len(call.Arguments) == 1 {
+				if receiver, ok := call.Receiver.(*Identifier); ok {
+					return receiver.Value()
+				}
+			}
+		case *CallExpression:
+			if fn, ok := call.Function.(*Identifier); ok && fn.Value() == "append" && len(call.Arguments) == 2 {
+				if target, ok := call.Arguments[0].(*Identifier); ok {
+					return target.Value()
+				}
+			}
+		}
+	}
+	return ""
+}
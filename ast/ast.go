@@ -330,8 +330,21 @@ type Identifier struct {
 	// Slot cache for fast local variable access.
 	// 0 = uncached (zero value), -1 = not a local slot, >0 = slot index + 1.
 	SlotCache atomic.Int32
+	// outerCache caches where a non-local name (a global, a closure variable or
+	// a nonlocal/global assignment target) lives in the environment chain, so
+	// repeat accesses skip the per-scope map lookups. Only consulted once
+	// SlotCache has recorded that the name is not a local slot. Uses the
+	// calleeCache encoding: 0 = uncached, -1 = uncacheable, >0 = packed
+	// (hops, slot index) location.
+	outerCache atomic.Int64
 }
 
+// OuterCache returns the raw cached outer location (see outerCache encoding).
+func (i *Identifier) OuterCache() int64 { return i.outerCache.Load() }
+
+// SetOuterCache stores a resolved outer location.
+func (i *Identifier) SetOuterCache(v int64) { i.outerCache.Store(v) }
+
 func NewIdentifier(tok token.Token, symbols *SymbolTable, value string) *Identifier {
 	return &Identifier{Token: NewLineInfo(tok), Symbols: symbols, Name: symbols.Intern(value)}
 }
@@ -389,6 +402,9 @@ func (sl *StringLiteral) Line() int            { return 0 }
 
 type FStringOverflow struct {
 	FormatSpecs []string
+	// parsed caches the evaluator's parsed form of FormatSpecs. Held as an
+	// atomic any for the same reasons as StringLiteral.boxed.
+	parsed atomic.Value
 }
 
 type FStringLiteral struct {
@@ -419,6 +435,23 @@ func (fsl *FStringLiteral) SetFormatSpecs(specs []string) {
 	fsl.overflow = &FStringOverflow{FormatSpecs: specs}
 }
 
+// ParsedSpecs returns the cached evaluator form of the format specs, or nil if
+// unset or the literal has no specs.
+func (fsl *FStringLiteral) ParsedSpecs() any {
+	if fsl.overflow == nil {
+		return nil
+	}
+	return fsl.overflow.parsed.Load()
+}
+
+// SetParsedSpecs caches the evaluator form of the format specs. It is a no-op
+// for literals without specs. Callers must always pass the same concrete type.
+func (fsl *FStringLiteral) SetParsedSpecs(v any) {
+	if fsl.overflow != nil {
+		fsl.overflow.parsed.Store(v)
+	}
+}
+
 func (fsl *FStringLiteral) expressionNode()      {}
 func (fsl *FStringLiteral) TokenLiteral() string { return fsl.Value }
 func (fsl *FStringLiteral) Line() int            { return 0 }
@@ -475,6 +508,10 @@ const (
 	IntFastArith
 	// IntFastCompare: integer-shaped operands, boolean result.
 	IntFastCompare
+	// NumFastArith: +, -, * or / over numeric-shaped operands that are not
+	// all integer-shaped (a float literal, an attribute read, or a true
+	// division is involved). The result may be an integer or a float.
+	NumFastArith
 )
 
 type InfixExpression struct {
@@ -502,6 +539,37 @@ func IsIntShaped(e Expression) bool {
 	return false
 }
 
+// IsNumShaped reports whether e can evaluate to a number using only
+// side-effect-free operations: anything IsIntShaped accepts, a float literal,
+// an attribute read chain such as self.top_left.x, or numeric arithmetic over
+// two such subtrees.
+func IsNumShaped(e Expression) bool {
+	switch n := e.(type) {
+	case *FloatLiteral:
+		return true
+	case *IndexExpression:
+		return IsAttrRead(n)
+	case *InfixExpression:
+		return n.IntFast == IntFastArith || n.IntFast == NumFastArith
+	}
+	return IsIntShaped(e)
+}
+
+// IsAttrRead reports whether e is an identifier or a chain of dot accesses
+// rooted at one (obj, obj.a, obj.a.b).
+func IsAttrRead(e Expression) bool {
+	switch n := e.(type) {
+	case *Identifier:
+		return true
+	case *IndexExpression:
+		if _, ok := n.Index.(*StringLiteral); !ok || !n.IsDotAccess {
+			return false
+		}
+		return IsAttrRead(n.Left)
+	}
+	return false
+}
+
 // IsIntResultOp reports whether op yields an integer when applied to two
 // integers. OpDiv is excluded because it always produces a float, and OpPow
 // because it promotes to float for large or negative exponents.
@@ -521,6 +589,9 @@ func IsIntResultOp(op Op) bool {
 func (ie *InfixExpression) SetIntFast() {
 	if !IsIntShaped(ie.Left) || !IsIntShaped(ie.Right) {
 		ie.IntFast = IntFastNone
+		if IsNumShaped(ie.Left) && IsNumShaped(ie.Right) && isNumFastOp(ie.Operator) {
+			ie.IntFast = NumFastArith
+		}
 		return
 	}
 	switch {
@@ -528,11 +599,23 @@ func (ie *InfixExpression) SetIntFast() {
 		ie.IntFast = IntFastArith
 	case ie.Operator >= OpLt && ie.Operator <= OpNeq:
 		ie.IntFast = IntFastCompare
+	case isNumFastOp(ie.Operator):
+		// Integer true division always yields a float.
+		ie.IntFast = NumFastArith
 	default:
 		ie.IntFast = IntFastNone
 	}
 }
 
+// isNumFastOp reports whether op is one of the operators NumFastArith covers.
+func isNumFastOp(op Op) bool {
+	switch op {
+	case OpAdd, OpSub, OpMul, OpDiv:
+		return true
+	}
+	return false
+}
+
 func (ie *InfixExpression) expressionNode()      {}
 func (ie *InfixExpression) TokenLiteral() string { return ie.Operator.String() }
 func (ie *InfixExpression) Line() int {
@@ -644,8 +727,21 @@ type IfStatement struct {
 	Consequence *BlockStatement
 	ElifClauses []*ElifClause
 	Alternative *BlockStatement
+	// dispatch caches what the evaluator learns about the shape of this
+	// statement's condition chain, such as an elif ladder over one integer
+	// variable that can pick its branch without evaluating every comparison.
+	// Held as an atomic any for the same reasons as StringLiteral.boxed.
+	dispatch atomic.Value
 }
 
+// Dispatch returns the cached evaluator dispatch for this statement, or nil if
+// unset.
+func (is *IfStatement) Dispatch() any { return is.dispatch.Load() }
+
+// SetDispatch caches the evaluator dispatch for this statement. Callers must
+// always pass the same concrete type.
+func (is *IfStatement) SetDispatch(v any) { is.dispatch.Store(v) }
+
 func (is *IfStatement) statementNode()       {}
 func (is *IfStatement) TokenLiteral() string { return "if" }
 func (is *IfStatement) Line() int            { return int(is.Token.Line) }
@@ -1089,6 +1185,10 @@ type ForStatement struct {
 	Iterable  Expression
 	Body      *BlockStatement
 	Else      *BlockStatement // optional else clause
+	// AppendTarget names a list the body appends to on every iteration (see
+	// LoopAppendTarget), or is empty. The evaluator reserves room in it for the
+	// whole loop up front.
+	AppendTarget string
 }
 
 func (fs *ForStatement) statementNode()       {}
@@ -1105,8 +1205,21 @@ func (ll *ListLiteral) Line() int            { return lineOfExprSlice(ll.Element
 
 type DictLiteral struct {
 	Pairs []DictPairLiteral
+	// template caches what the evaluator learns about this literal: for one
+	// whose keys and values are all constants, the prebuilt entries that each
+	// evaluation copies instead of evaluating and hashing every pair again.
+	// Held as an atomic any for the same reasons as StringLiteral.boxed.
+	template atomic.Value
 }
 
+// Template returns the cached evaluator template for this literal, or nil if
+// unset.
+func (dl *DictLiteral) Template() any { return dl.template.Load() }
+
+// SetTemplate caches the evaluator template for this literal. Callers must
+// always pass the same concrete type.
+func (dl *DictLiteral) SetTemplate(v any) { dl.template.Store(v) }
+
 func (dl *DictLiteral) expressionNode()      {}
 func (dl *DictLiteral) TokenLiteral() string { return "{" }
 func (dl *DictLiteral) Line() int {
@@ -1139,6 +1252,11 @@ type IndexExpression struct {
 	Left        Expression
 	Index       Expression
 	IsDotAccess bool // true when desugared from dot notation (obj.attr)
+	// FieldSlot caches which inline field slot of an Instance held the
+	// attribute at the last dot access through this node. Instances of a
+	// class assign their fields in the same order, so the slot is stable
+	// across instances. 0 = uncached, >0 = slot index + 1.
+	FieldSlot atomic.Int32
 }
 
 func (ie *IndexExpression) expressionNode() {}
@@ -1334,6 +1452,7 @@ type Lambda struct {
 	LocalSlots       map[string]int
 	LocalSlotNames   []string
 	ParamSlotIndexes []int
+	HasNestedFunc    bool // body creates a lambda, so the call env may be captured
 }
 
 func (l *Lambda) GetDefaultValues() map[string]Expression {
@@ -42,6 +42,7 @@ func foldStatement(stmt Statement) Statement {
 			foldBlock(clause.Consequence)
 		}
 		foldBlock(s.Alternative)
+		return pruneIfStatement(s)
 	case *WhileStatement:
 		s.Condition = foldExpression(s.Condition)
 		foldBlock(s.Body)
@@ -83,6 +84,10 @@ func foldStatement(stmt Statement) Statement {
 		}
 	case *AssertStatement:
 		s.Condition = foldExpression(s.Condition)
+		if truth, ok := constantTruth(s.Condition); ok && truth {
+			// assert True can never fail, and its message is never evaluated
+			return &PassStatement{Token: s.Token}
+		}
 		if s.Message != nil {
 			s.Message = foldExpression(s.Message)
 		}
@@ -172,6 +177,12 @@ func foldExpression(expr Expression) Expression {
 		e.TrueExpr = foldExpression(e.TrueExpr)
 		e.Condition = foldExpression(e.Condition)
 		e.FalseExpr = foldExpression(e.FalseExpr)
+		if truth, ok := constantTruth(e.Condition); ok {
+			if truth {
+				return e.TrueExpr
+			}
+			return e.FalseExpr
+		}
 
 	case *CallExpression:
 		e.Function = foldExpression(e.Function)
@@ -305,6 +316,78 @@ func foldExpression(expr Expression) Expression {
 	return expr
 }
 
+// constantTruth reports the truthiness of a literal condition, with ok=false
+// for anything that has to be evaluated at run time.
+func constantTruth(expr Expression) (truth bool, ok bool) {
+	switch e := expr.(type) {
+	case *Boolean:
+		return e.Value, true
+	case *None:
+		return false, true
+	case *IntegerLiteral:
+		return e.Value != 0, true
+	case *FloatLiteral:
+		return e.Value != 0, true
+	case *StringLiteral:
+		return e.Value != "", true
+	}
+	return false, false
+}
+
+// pruneIfStatement drops the branches of an if/elif chain that literal
+// conditions rule out. A clause whose condition is always false can never run;
+// one whose condition is always true ends the chain, becoming the else after
+// any clauses that still need testing, so everything after it is unreachable.
+// A chain that is left with no branch to run reduces to pass.
+func pruneIfStatement(s *IfStatement) Statement {
+	clauses := make([]*ElifClause, 0, len(s.ElifClauses)+1)
+	clauses = append(clauses, &ElifClause{Token: s.Token, Condition: s.Condition, Consequence: s.Consequence})
+	clauses = append(clauses, s.ElifClauses...)
+
+	kept := clauses[:0]
+	alternative := s.Alternative
+	changed := false
+	for _, clause := range clauses {
+		truth, ok := constantTruth(clause.Condition)
+		if !ok {
+			kept = append(kept, clause)
+			continue
+		}
+		if !truth {
+			changed = true
+			continue
+		}
+		if len(kept) == 0 {
+			// Always taken: keep it as `if True:` with nothing after it
+			kept = append(kept, clause)
+			changed = changed || len(s.ElifClauses) > 0 || s.Alternative != nil
+			alternative = nil
+		} else {
+			alternative = clause.Consequence
+			changed = true
+		}
+		break
+	}
+	if !changed {
+		return s
+	}
+	if len(kept) == 0 {
+		if alternative == nil {
+			return &PassStatement{Token: s.Token}
+		}
+		kept = append(kept, &ElifClause{Token: s.Token, Condition: BoolTrue, Consequence: alternative})
+		alternative = nil
+	}
+	s.Condition = kept[0].Condition
+	s.Consequence = kept[0].Consequence
+	s.ElifClauses = nil
+	if len(kept) > 1 {
+		s.ElifClauses = append([]*ElifClause(nil), kept[1:]...)
+	}
+	s.Alternative = alternative
+	return s
+}
+
 func tryFoldInfix(op Op, left, right Expression) Expression {
 	lint, lIsInt := left.(*IntegerLiteral)
 	lfloat, lIsFloat := left.(*FloatLiteral)
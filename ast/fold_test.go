@@ -1191,6 +1191,79 @@ func TestFoldIfStatement(t *testing.T) {
 	}
 }
 
+func TestFoldConditionalExpression(t *testing.T) {
+	// 1 if False else (2 if 3 > 1 else 4)
+	expr := &ConditionalExpression{
+		TrueExpr:  intLit(1),
+		Condition: BoolFalse,
+		FalseExpr: &ConditionalExpression{TrueExpr: intLit(2), Condition: infix(OpGt, intLit(3), intLit(1)), FalseExpr: intLit(4)},
+	}
+	lit, ok := foldExpression(expr).(*IntegerLiteral)
+	if !ok || lit.Value != 2 {
+		t.Errorf("expected folded value 2, got %v", lit)
+	}
+
+	dynamic := &ConditionalExpression{TrueExpr: intLit(1), Condition: testIdentifier("x"), FalseExpr: intLit(2)}
+	if foldExpression(dynamic) != dynamic {
+		t.Error("conditional with a run-time condition should be kept")
+	}
+}
+
+func TestFoldIfStatementPrunesConstantBranches(t *testing.T) {
+	block := func(v int64) *BlockStatement {
+		return &BlockStatement{Statements: []Statement{&ExpressionStatement{Expression: intLit(v)}}}
+	}
+	x := testIdentifier("x")
+
+	// if False: 1 / elif x: 2 / elif 1 < 2: 3 / elif x: 4 / else: 5
+	// -> if x: 2 / else: 3
+	stmt := &IfStatement{
+		Condition:   BoolFalse,
+		Consequence: block(1),
+		ElifClauses: []*ElifClause{
+			{Condition: x, Consequence: block(2)},
+			{Condition: infix(OpLt, intLit(1), intLit(2)), Consequence: block(3)},
+			{Condition: x, Consequence: block(4)},
+		},
+		Alternative: block(5),
+	}
+	ifStmt, ok := foldStatement(stmt).(*IfStatement)
+	if !ok {
+		t.Fatalf("expected IfStatement, got %T", ifStmt)
+	}
+	if ifStmt.Condition != x || len(ifStmt.ElifClauses) != 0 || ifStmt.Alternative == nil {
+		t.Fatalf("unexpected pruned chain: %+v", ifStmt)
+	}
+	if v := ifStmt.Alternative.Statements[0].(*ExpressionStatement).Expression.(*IntegerLiteral).Value; v != 3 {
+		t.Errorf("else branch = %d, want 3", v)
+	}
+
+	// if 0: 1 / elif "": 2 / else: 3 -> if True: 3
+	stmt = &IfStatement{
+		Condition:   intLit(0),
+		Consequence: block(1),
+		ElifClauses: []*ElifClause{{Condition: strLit(""), Consequence: block(2)}},
+		Alternative: block(3),
+	}
+	ifStmt = foldStatement(stmt).(*IfStatement)
+	if cond, ok := ifStmt.Condition.(*Boolean); !ok || !cond.Value || ifStmt.Alternative != nil || len(ifStmt.ElifClauses) != 0 {
+		t.Errorf("expected `if True:` with no other branches, got %+v", ifStmt)
+	}
+
+	// if None: 1 -> pass
+	if _, ok := foldStatement(&IfStatement{Condition: NoneLiteral, Consequence: block(1)}).(*PassStatement); !ok {
+		t.Error("expected an if that can never run to fold to pass")
+	}
+
+	// assert True -> pass; assert x is kept
+	if _, ok := foldStatement(&AssertStatement{Condition: infix(OpEq, intLit(1), intLit(1))}).(*PassStatement); !ok {
+		t.Error("expected assert of a true constant to fold to pass")
+	}
+	if _, ok := foldStatement(&AssertStatement{Condition: x}).(*AssertStatement); !ok {
+		t.Error("expected assert of a run-time condition to be kept")
+	}
+}
+
 func TestFoldAugmentedAssignStatement(t *testing.T) {
 	prog := &Program{
 		Statements: []Statement{
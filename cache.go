@@ -2,6 +2,7 @@ package scriptling
 
 import (
 	"container/list"
+	"errors"
 	"hash/maphash"
 	"sync"
 	"sync/atomic"
@@ -215,6 +216,47 @@ func hashScript(script string) cacheKey {
 	return cacheKey{length: len(script), h1: h1.Sum64(), h2: h2.Sum64()}
 }
 
+// parseCall is a parse in progress for one cache key; callers that miss on the
+// same key while it runs wait on done and share its result.
+type parseCall struct {
+	done    chan struct{}
+	program *ast.Program
+	err     error
+}
+
+var errParseAborted = errors.New("script parse aborted")
+
+var (
+	parsingMu sync.Mutex
+	parsing   = make(map[cacheKey]*parseCall)
+)
+
+// beginParse registers a parse for key. It returns leader=true if the caller
+// must do the parse (and later call endParse), or the in-progress call to wait
+// on otherwise.
+func beginParse(key cacheKey) (call *parseCall, leader bool) {
+	parsingMu.Lock()
+	defer parsingMu.Unlock()
+	if call, ok := parsing[key]; ok {
+		return call, false
+	}
+	call = &parseCall{done: make(chan struct{})}
+	parsing[key] = call
+	return call, true
+}
+
+// endParse publishes call's result to any waiters.
+func endParse(key cacheKey, call *parseCall) {
+	parsingMu.Lock()
+	delete(parsing, key)
+	parsingMu.Unlock()
+	if call.program == nil && call.err == nil {
+		// The leader panicked; waiters must not see a nil program.
+		call.err = errParseAborted
+	}
+	close(call.done)
+}
+
 func estimateCacheEntrySize(script string, program *ast.Program) int {
 	_ = script
 	const entryOverhead = 128
@@ -718,3 +718,34 @@ func TestCache_StressInterleavedOps(t *testing.T) {
 		}
 	}
 }
+
+func TestCache_ConcurrentMissesShareOneParse(t *testing.T) {
+	script := fmt.Sprintf("shared_parse_%d = 1 + 2\n", len(t.Name()))
+	const workers = 16
+	programs := make([]*ast.Program, workers)
+	var wg sync.WaitGroup
+	for i := range programs {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			program, err := parseProgramCached(script)
+			if err != nil {
+				t.Errorf("parse failed: %v", err)
+			}
+			programs[i] = program
+		}(i)
+	}
+	wg.Wait()
+	for i, program := range programs {
+		if program == nil || program != programs[0] {
+			t.Fatalf("worker %d got a different program", i)
+		}
+	}
+	if len(parsing) != 0 {
+		t.Errorf("in-flight parses left behind: %d", len(parsing))
+	}
+
+	if _, err := parseProgramCached("def broken(:\n"); err == nil {
+		t.Error("expected parse error")
+	}
+}
@@ -1,9 +1,12 @@
 package conversion
 
 import (
+	"bytes"
 	"encoding/json"
 	"fmt"
+	"io"
 	"strings"
+	"unsafe"
 
 	"github.com/paularlott/scriptling/errors"
 	"github.com/paularlott/scriptling/object"
@@ -12,12 +15,37 @@ import (
 // ParseJSON parses a JSON string and returns a Scriptling object.
 // It uses UseNumber() to preserve large integers.
 func ParseJSON(jsonStr string) (object.Object, error) {
+	// The parser only reads its input, so it can scan the string in place.
+	if result, ok := parseJSONFast(unsafe.Slice(unsafe.StringData(jsonStr), len(jsonStr))); ok {
+		return result, nil
+	}
+	return decodeJSON(strings.NewReader(jsonStr))
+}
+
+// ParseJSONBytes is ParseJSON for raw bytes, such as an HTTP response body,
+// avoiding a string copy of the whole document.
+func ParseJSONBytes(data []byte) (object.Object, error) {
+	if result, ok := parseJSONFast(data); ok {
+		return result, nil
+	}
+	return decodeJSON(bytes.NewReader(data))
+}
+
+func decodeJSON(r io.Reader) (object.Object, error) {
 	var result interface{}
-	decoder := json.NewDecoder(strings.NewReader(jsonStr))
+	decoder := json.NewDecoder(r)
 	decoder.UseNumber()
 	if err := decoder.Decode(&result); err != nil {
 		return nil, err
 	}
+	// Decode stops after the first value; anything but trailing whitespace
+	// (as in "01" or "[1] 2") makes the document invalid.
+	if _, err := decoder.Token(); err != io.EOF {
+		if err != nil {
+			return nil, err
+		}
+		return nil, fmt.Errorf("extra data after top-level value at offset %d", decoder.InputOffset())
+	}
 	return FromGo(result), nil
 }
 
@@ -31,6 +59,15 @@ func MustParseJSON(jsonStr string) object.Object {
 	return result
 }
 
+// MustParseJSONBytes is MustParseJSON for raw bytes.
+func MustParseJSONBytes(data []byte) object.Object {
+	result, err := ParseJSONBytes(data)
+	if err != nil {
+		return errors.NewError("JSONDecodeError: %s", err.Error())
+	}
+	return result
+}
+
 // FromGo converts a Go interface{} value to a scriptling Object.
 // It handles primitive types (nil, bool, int, float, string), nested structures
 // (maps, slices), and falls back to JSON marshaling for unknown types.
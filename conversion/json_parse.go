@@ -0,0 +1,286 @@
+package conversion
+
+import (
+	"encoding/json"
+	"strconv"
+	"unicode/utf8"
+
+	"github.com/paularlott/scriptling/object"
+)
+
+// maxJSONDepth matches encoding/json's nesting limit.
+const maxJSONDepth = 10000
+
+// jsonParser builds Scriptling objects directly from JSON text in one pass.
+// Decoding with encoding/json first produces interface{} values — a Go map per
+// object, boxed scalars and a json.Number string per number — which FromGo then
+// walks and converts a second time. Going straight to objects skips that
+// intermediate tree.
+//
+// The parser only accepts well-formed input. On any problem it reports failure
+// and the caller falls back to encoding/json, so error messages, and the
+// decoder's handling of trailing data, are exactly what they were before.
+type jsonParser struct {
+	data  []byte
+	pos   int
+	depth int
+}
+
+// parseJSONFast parses a complete JSON document. ok is false if the document
+// is not valid JSON (or has trailing data), in which case the caller should use
+// encoding/json instead.
+func parseJSONFast(data []byte) (result object.Object, ok bool) {
+	p := jsonParser{data: data}
+	if result, ok = p.value(); !ok {
+		return nil, false
+	}
+	p.skipSpace()
+	if p.pos != len(p.data) {
+		return nil, false
+	}
+	return result, true
+}
+
+func (p *jsonParser) skipSpace() {
+	for p.pos < len(p.data) {
+		switch p.data[p.pos] {
+		case ' ', '\t', '\n', '\r':
+			p.pos++
+		default:
+			return
+		}
+	}
+}
+
+func (p *jsonParser) value() (object.Object, bool) {
+	p.skipSpace()
+	if p.pos >= len(p.data) {
+		return nil, false
+	}
+	switch p.data[p.pos] {
+	case '{':
+		return p.object()
+	case '[':
+		return p.array()
+	case '"':
+		s, ok := p.str()
+		if !ok {
+			return nil, false
+		}
+		return object.NewString(s), true
+	case 't':
+		if p.literal("true") {
+			return object.NewBoolean(true), true
+		}
+	case 'f':
+		if p.literal("false") {
+			return object.NewBoolean(false), true
+		}
+	case 'n':
+		if p.literal("null") {
+			return &object.Null{}, true
+		}
+	default:
+		return p.number()
+	}
+	return nil, false
+}
+
+func (p *jsonParser) literal(word string) bool {
+	if len(p.data)-p.pos < len(word) || string(p.data[p.pos:p.pos+len(word)]) != word {
+		return false
+	}
+	p.pos += len(word)
+	return true
+}
+
+func (p *jsonParser) object() (object.Object, bool) {
+	if p.depth++; p.depth > maxJSONDepth {
+		return nil, false
+	}
+	p.pos++ // '{'
+	pairs := make(map[string]object.DictPair)
+	p.skipSpace()
+	if p.pos < len(p.data) && p.data[p.pos] == '}' {
+		p.pos++
+		p.depth--
+		return &object.Dict{Pairs: pairs}, true
+	}
+	for {
+		p.skipSpace()
+		if p.pos >= len(p.data) || p.data[p.pos] != '"' {
+			return nil, false
+		}
+		key, ok := p.str()
+		if !ok {
+			return nil, false
+		}
+		p.skipSpace()
+		if p.pos >= len(p.data) || p.data[p.pos] != ':' {
+			return nil, false
+		}
+		p.pos++
+		val, ok := p.value()
+		if !ok {
+			return nil, false
+		}
+		pairs[object.DictStringKey(key)] = object.DictPair{Key: object.NewString(key), Value: val}
+
+		p.skipSpace()
+		if p.pos >= len(p.data) {
+			return nil, false
+		}
+		switch p.data[p.pos] {
+		case ',':
+			p.pos++
+		case '}':
+			p.pos++
+			p.depth--
+			return &object.Dict{Pairs: pairs}, true
+		default:
+			return nil, false
+		}
+	}
+}
+
+func (p *jsonParser) array() (object.Object, bool) {
+	if p.depth++; p.depth > maxJSONDepth {
+		return nil, false
+	}
+	p.pos++ // '['
+	elements := make([]object.Object, 0, 4)
+	p.skipSpace()
+	if p.pos < len(p.data) && p.data[p.pos] == ']' {
+		p.pos++
+		p.depth--
+		return &object.List{Elements: elements}, true
+	}
+	for {
+		val, ok := p.value()
+		if !ok {
+			return nil, false
+		}
+		elements = append(elements, val)
+
+		p.skipSpace()
+		if p.pos >= len(p.data) {
+			return nil, false
+		}
+		switch p.data[p.pos] {
+		case ',':
+			p.pos++
+		case ']':
+			p.pos++
+			p.depth--
+			return &object.List{Elements: elements}, true
+		default:
+			return nil, false
+		}
+	}
+}
+
+// str reads the string starting at the opening quote at p.pos. Plain strings
+// are sliced straight out of the input; strings with escapes or invalid UTF-8
+// are rare and are handed to encoding/json so its rules (surrogate pairs,
+// U+FFFD replacement) apply unchanged.
+func (p *jsonParser) str() (string, bool) {
+	start := p.pos + 1
+	escaped, nonASCII := false, false
+	for i := start; i < len(p.data); i++ {
+		c := p.data[i]
+		switch {
+		case c == '"':
+			p.pos = i + 1
+			raw := p.data[start:i]
+			if !escaped && (!nonASCII || utf8.Valid(raw)) {
+				return string(raw), true
+			}
+			var s string
+			if err := json.Unmarshal(p.data[start-1:i+1], &s); err != nil {
+				return "", false
+			}
+			return s, true
+		case c == '\\':
+			escaped = true
+			i++ // the escaped character can never end the string
+		case c < 0x20:
+			return "", false
+		case c >= utf8.RuneSelf:
+			nonASCII = true
+		}
+	}
+	return "", false
+}
+
+// number reads a JSON number with the same result FromGo gives a json.Number:
+// an Integer when it is integral and fits in int64, otherwise a Float, or the
+// literal text if even a float cannot hold it.
+func (p *jsonParser) number() (object.Object, bool) {
+	d := p.data
+	start, i := p.pos, p.pos
+	neg := false
+	if i < len(d) && d[i] == '-' {
+		neg = true
+		i++
+	}
+	digitsStart := i
+	switch {
+	case i < len(d) && d[i] == '0':
+		i++
+	case i < len(d) && d[i] >= '1' && d[i] <= '9':
+		for i < len(d) && d[i] >= '0' && d[i] <= '9' {
+			i++
+		}
+	default:
+		return nil, false
+	}
+	digitsEnd := i
+	integral := true
+	if i < len(d) && d[i] == '.' {
+		integral = false
+		i++
+		if i >= len(d) || d[i] < '0' || d[i] > '9' {
+			return nil, false
+		}
+		for i < len(d) && d[i] >= '0' && d[i] <= '9' {
+			i++
+		}
+	}
+	if i < len(d) && (d[i] == 'e' || d[i] == 'E') {
+		integral = false
+		i++
+		if i < len(d) && (d[i] == '+' || d[i] == '-') {
+			i++
+		}
+		if i >= len(d) || d[i] < '0' || d[i] > '9' {
+			return nil, false
+		}
+		for i < len(d) && d[i] >= '0' && d[i] <= '9' {
+			i++
+		}
+	}
+	p.pos = i
+
+	// Up to 18 digits always fits in int64, so accumulate without strconv.
+	if integral && digitsEnd-digitsStart <= 18 {
+		var n int64
+		for _, c := range d[digitsStart:digitsEnd] {
+			n = n*10 + int64(c-'0')
+		}
+		if neg {
+			n = -n
+		}
+		return object.NewInteger(n), true
+	}
+
+	text := string(d[start:i])
+	if integral {
+		if n, err := strconv.ParseInt(text, 10, 64); err == nil {
+			return object.NewInteger(n), true
+		}
+	}
+	if f, err := strconv.ParseFloat(text, 64); err == nil {
+		return object.NewFloat(f), true
+	}
+	return object.NewString(text), true
+}
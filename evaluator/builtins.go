@@ -33,6 +33,9 @@ var (
 	// hashInstanceFn calls __hash__ on an instance; set in init() to break init cycle
 	hashInstanceFn func(ctx context.Context, inst *object.Instance) object.Object
 
+	// callPropertyFn calls a property getter on an instance; set in init() to break init cycle
+	callPropertyFn func(ctx context.Context, inst *object.Instance, prop *object.Property) object.Object
+
 	// typeBuiltins maps type-related builtin pointers to their names for isinstance()
 	typeBuiltins map[*object.Builtin]string
 )
@@ -242,14 +245,19 @@ Returns a string representing the type of the object.`,
 			if err := errors.ExactArgs(args, 1); err != nil {
 				return err
 			}
-			// For exceptions, return just the message (like Python)
-			if exc, ok := args[0].(*object.Exception); ok {
-				return object.NewString(exc.Message)
-			}
-			// Call __str__ dunder method on instances
-			if inst, ok := args[0].(*object.Instance); ok {
+			switch arg := args[0].(type) {
+			case *object.String:
+				// Strings are immutable, so str(s) can hand back s itself.
+				return arg
+			case *object.Integer:
+				return object.NewIntegerString(arg.IntValue())
+			case *object.Exception:
+				// For exceptions, return just the message (like Python)
+				return object.NewString(arg.Message)
+			case *object.Instance:
+				// Call __str__ dunder method on instances
 				env := GetEnvFromContext(ctx)
-				if result := callDunderMethodFn(ctx, inst, "__str__", nil, env); result != nil {
+				if result := callDunderMethodFn(ctx, arg, "__str__", nil, env); result != nil {
 					return result
 				}
 			}
@@ -839,10 +847,7 @@ Returns an integer if ndigits is omitted or 0.`,
 			if err != nil {
 				return errors.ParameterError("x", err)
 			}
-			if num >= 0 {
-				return object.NewString(fmt.Sprintf("0x%x", num))
-			}
-			return object.NewString(fmt.Sprintf("-0x%x", -num))
+			return radixString(num, 16, "0x")
 		},
 		HelpText: `hex(x) - Convert an integer to a lowercase hexadecimal string prefixed with "0x"`,
 	},
@@ -855,10 +860,7 @@ Returns an integer if ndigits is omitted or 0.`,
 			if err != nil {
 				return errors.ParameterError("x", err)
 			}
-			if num >= 0 {
-				return object.NewString(fmt.Sprintf("0b%b", num))
-			}
-			return object.NewString(fmt.Sprintf("-0b%b", -num))
+			return radixString(num, 2, "0b")
 		},
 		HelpText: `bin(x) - Convert an integer to a binary string prefixed with "0b"`,
 	},
@@ -871,10 +873,7 @@ Returns an integer if ndigits is omitted or 0.`,
 			if err != nil {
 				return errors.ParameterError("x", err)
 			}
-			if num >= 0 {
-				return object.NewString(fmt.Sprintf("0o%o", num))
-			}
-			return object.NewString(fmt.Sprintf("-0o%o", -num))
+			return radixString(num, 8, "0o")
 		},
 		HelpText: `oct(x) - Convert an integer to an octal string prefixed with "0o"`,
 	},
@@ -1197,24 +1196,33 @@ Otherwise, returns a list containing the items of the iterable.`,
 	},
 	"dict": {
 		Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
-			result := &object.Dict{Pairs: make(map[string]object.DictPair)}
+			if len(args) > 1 {
+				return errors.NewArgumentError(len(args), 1)
+			}
+			// Size the map for every entry up front; a plain copy of another
+			// dict clones it whole
+			size := kwargs.Len()
+			if len(args) == 1 {
+				switch iter := args[0].(type) {
+				case *object.Dict:
+					if size == 0 {
+						return iter.Copy()
+					}
+					size += len(iter.Pairs)
+				case *object.List:
+					size += len(iter.Elements)
+				}
+			}
+			result := &object.Dict{Pairs: make(map[string]object.DictPair, size)}
 			// Handle kwargs
 			for _, key := range kwargs.Keys() {
-				val := kwargs.Get(key)
-				result.Pairs[object.DictKey(object.NewString(key))] = object.DictPair{
-					Key:   object.NewString(key),
-					Value: val,
-				}
+				result.SetByString(key, kwargs.Get(key))
 			}
 			if len(args) == 0 {
 				return result
 			}
-			if err := errors.ExactArgs(args, 1); err != nil {
-				return err
-			}
 			switch iter := args[0].(type) {
 			case *object.Dict:
-				// Copy existing dict
 				for k, v := range iter.Pairs {
 					result.Pairs[k] = v
 				}
@@ -1519,6 +1527,9 @@ Returns True if the object has the named attribute.`,
 					return val
 				}
 				if method, ok := obj.Class.LookupMember(name); ok {
+					if prop, ok := method.(*object.Property); ok {
+						return callPropertyFn(ctx, obj, prop)
+					}
 					return method
 				}
 			case *object.Dict:
@@ -1760,22 +1771,13 @@ Checks the full inheritance chain. issubclass(C, C) is True.`,
 				copy(newElems, o.Elements)
 				return &object.List{Elements: newElems}
 			case *object.Dict:
-				newPairs := make(map[string]object.DictPair, len(o.Pairs))
-				for k, v := range o.Pairs {
-					newPairs[k] = v
-				}
-				return &object.Dict{Pairs: newPairs}
+				return o.Copy()
 			case *object.Set:
 				return o.Copy()
 			case *object.Tuple:
 				return o // immutable, safe to return same object
 			case *object.Instance:
-				clone := &object.Instance{Class: o.Class}
-				o.RangeFields(func(k string, v object.Object) bool {
-					clone.SetField(k, v)
-					return true
-				})
-				return clone
+				return o.Clone()
 			default:
 				return args[0] // scalars are immutable
 			}
@@ -2088,6 +2090,9 @@ func init() {
 		hashFn := inst.Class.Methods["__hash__"]
 		return applyFunctionWithContext(ctx, hashFn, []object.Object{inst}, nil, nil)
 	}
+	callPropertyFn = func(ctx context.Context, inst *object.Instance, prop *object.Property) object.Object {
+		return applyFunctionWithContext(ctx, prop.Getter, []object.Object{inst}, nil, nil)
+	}
 
 	// Build reverse lookup for isinstance() to support bare type names
 	typeBuiltins = map[*object.Builtin]string{
@@ -2306,10 +2311,12 @@ func mapFunctionImpl(ctx context.Context, kwargs object.Kwargs, args ...object.O
 	}
 
 	// Eagerly evaluate all results
+	// The function never keeps its argument slice, so one buffer serves
+	// every call.
 	results := make([]object.Object, minLen)
 	env := GetEnvFromContext(ctx)
+	callArgs := make([]object.Object, len(iterables))
 	for i := 0; i < minLen; i++ {
-		callArgs := make([]object.Object, len(iterables))
 		for j := range iterables {
 			callArgs[j] = iterables[j][i]
 		}
@@ -2320,16 +2327,25 @@ func mapFunctionImpl(ctx context.Context, kwargs object.Kwargs, args ...object.O
 		results[i] = res
 	}
 
-	// Return as iterator
-	index := 0
-	return object.NewIterator(func() (object.Object, bool) {
-		if index >= len(results) {
-			return nil, false
-		}
-		val := results[index]
-		index++
-		return val, true
-	})
+	return object.NewSliceIterator(results)
+}
+
+// radixString formats num in a power-of-two base the way hex(), bin() and
+// oct() do: sign, then prefix, then digits. The digits come from
+// strconv.AppendUint, which shifts and masks for these bases rather than
+// dividing, into a stack buffer big enough for the longest case (-0b plus 64
+// binary digits). Negating as uint64 keeps math.MinInt64 correct.
+func radixString(num int64, base int, prefix string) *object.String {
+	var buf [67]byte
+	b := buf[:0]
+	u := uint64(num)
+	if num < 0 {
+		b = append(b, '-')
+		u = -u
+	}
+	b = append(b, prefix...)
+	b = strconv.AppendUint(b, u, base)
+	return object.NewString(string(b))
 }
 
 func filterFunctionImpl(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
@@ -2344,34 +2360,30 @@ func filterFunctionImpl(ctx context.Context, kwargs object.Kwargs, args ...objec
 
 	// Eagerly evaluate and filter
 	results := []object.Object{}
-	env := GetEnvFromContext(ctx)
-	for _, elem := range iterable {
+	if fn.Type() == object.NULL_OBJ {
 		// If function is None, use truthiness
-		if fn.Type() == object.NULL_OBJ {
+		for _, elem := range iterable {
 			if isTruthy(elem) {
 				results = append(results, elem)
 			}
-		} else {
-			res := applyFunctionWithContext(ctx, fn, []object.Object{elem}, nil, env)
-			if object.IsError(res) {
-				return res
-			}
-			if isTruthy(res) {
-				results = append(results, elem)
-			}
 		}
+		return object.NewSliceIterator(results)
 	}
 
-	// Return as iterator
-	index := 0
-	return object.NewIterator(func() (object.Object, bool) {
-		if index >= len(results) {
-			return nil, false
+	env := GetEnvFromContext(ctx)
+	callArgs := make([]object.Object, 1)
+	for _, elem := range iterable {
+		callArgs[0] = elem
+		res := applyFunctionWithContext(ctx, fn, callArgs, nil, env)
+		if object.IsError(res) {
+			return res
+		}
+		if isTruthy(res) {
+			results = append(results, elem)
 		}
-		val := results[index]
-		index++
-		return val, true
-	})
+	}
+
+	return object.NewSliceIterator(results)
 }
 
 func helpFunctionImpl(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
@@ -2,6 +2,9 @@ package evaluator
 
 import (
 	"context"
+	"math"
+	"strconv"
+	"strings"
 	"testing"
 
 	"github.com/paularlott/scriptling/object"
@@ -31,6 +34,25 @@ func TestBuiltinLen(t *testing.T) {
 	}
 }
 
+func TestBuiltinStrCachedAndShared(t *testing.T) {
+	str := builtins["str"].Fn
+	for _, v := range []int64{0, 7, 200, 1023, 1024, -1, -5, 123456789} {
+		result := str(context.Background(), object.NewKwargs(nil), object.NewInteger(v))
+		s, ok := result.(*object.String)
+		if !ok {
+			t.Fatalf("str(%d) returned %T, want String", v, result)
+		}
+		if want := strconv.FormatInt(v, 10); s.StringValue() != want {
+			t.Errorf("str(%d) = %q, want %q", v, s.StringValue(), want)
+		}
+	}
+
+	in := object.NewString("hello")
+	if result := str(context.Background(), object.NewKwargs(nil), in); result != in {
+		t.Errorf("str(s) = %v, want the same string object", result)
+	}
+}
+
 func TestBuiltinLenError(t *testing.T) {
 	result := builtins["len"].Fn(context.Background(), object.NewKwargs(nil), object.NewInteger(1))
 	if !object.IsError(result) {
@@ -412,3 +434,27 @@ r`, expected: `1`},
 		})
 	}
 }
+
+func TestBuiltinRadixExtremes(t *testing.T) {
+	tests := []struct {
+		fn       string
+		input    int64
+		expected string
+	}{
+		{"hex", math.MaxInt64, "0x7fffffffffffffff"},
+		{"hex", math.MinInt64, "-0x8000000000000000"},
+		{"bin", math.MinInt64, "-0b1" + strings.Repeat("0", 63)},
+		{"oct", math.MinInt64, "-0o1000000000000000000000"},
+		{"oct", -1, "-0o1"},
+	}
+	for _, tt := range tests {
+		result := builtins[tt.fn].Fn(context.Background(), object.NewKwargs(nil), object.NewInteger(tt.input))
+		s, ok := result.(*object.String)
+		if !ok {
+			t.Fatalf("%s(%d) is not String. got=%T (%+v)", tt.fn, tt.input, result, result)
+		}
+		if s.StringValue() != tt.expected {
+			t.Errorf("%s(%d) = %q, want %q", tt.fn, tt.input, s.StringValue(), tt.expected)
+		}
+	}
+}
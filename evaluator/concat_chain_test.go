@@ -52,6 +52,8 @@ func TestConcatChainStringRunThenNonString(t *testing.T) {
 		{"a=5\nresult = str(a) + \"-\" + str(a) + \"-\" + str(a)\n", "5-5-5"},
 		// Numbers first, strings later: must raise rather than silently join.
 		{"a=1\nb=2\nresult = str(a + b) + \"x\" + \"y\"\n", "3xy"},
+		// A run longer than the queued parts.
+		{"result = \"a\" + \"b\" + \"c\" + \"d\" + \"e\" + \"f\" + \"g\" + \"h\" + \"i\" + \"j\"\n", "abcdefghij"},
 	}
 	for _, c := range cases {
 		if got := evalSrc(t, c.src).Inspect(); got != c.want {
@@ -68,6 +70,7 @@ func TestConcatChainTypeErrorsPropagate(t *testing.T) {
 		"a=1\nb=\"x\"\nc=2\nresult = a + b + c\n",
 		"a=[1]\nb=\"x\"\nc=2\nresult = a + b + c\n",
 		"a=\"x\"\nb=\"y\"\nc=[1]\nresult = a + b + c\n",
+		"a=\"x\"\nresult = a + a + a + a + a + a + a + a + a + a + 1\n",
 	} {
 		got := evalSrc(t, src)
 		if !object.IsError(got) && got.Type() != object.EXCEPTION_OBJ {
@@ -110,7 +113,7 @@ result = joined + "|" + ",".join(order)
 }
 
 func TestConcatChainLongRun(t *testing.T) {
-	// Long runs exercise the buffer's growth path, which no longer pre-sizes.
+	// Long runs overflow the queued parts and flush into the buffer repeatedly.
 	var sb strings.Builder
 	terms := make([]string, 0, 40)
 	for i := 0; i < 40; i++ {
@@ -3,6 +3,7 @@ package evaluator
 import (
 	"context"
 	"fmt"
+	"maps"
 	"strings"
 
 	"github.com/paularlott/scriptling/ast"
@@ -38,9 +39,28 @@ func evalDictLiteralWithContext(ctx context.Context, node *ast.DictLiteral, env
 	if len(node.Pairs) == 0 {
 		return &object.Dict{Pairs: make(map[string]object.DictPair)}
 	}
+	if template := constDictTemplate(ctx, node); template != nil {
+		return &object.Dict{Pairs: maps.Clone(template)}
+	}
 	pairs := make(map[string]object.DictPair, len(node.Pairs))
 
 	for _, pairNode := range node.Pairs {
+		if pairNode.Key == nil {
+			// {**other}: copy the other dict's entries straight into this one.
+			value := evalNode(ctx, pairNode.Value, env)
+			if object.IsError(value) {
+				return value
+			}
+			other, ok := value.(*object.Dict)
+			if !ok {
+				return &object.Exception{Message: "'" + getTypeName(value) + "' object is not a mapping", ExceptionType: object.ExceptionTypeTypeError}
+			}
+			for k, v := range other.Pairs {
+				pairs[k] = v
+			}
+			continue
+		}
+
 		key := evalNode(ctx, pairNode.Key, env)
 		if object.IsError(key) {
 			return key
@@ -57,6 +77,50 @@ func evalDictLiteralWithContext(ctx context.Context, node *ast.DictLiteral, env
 	return &object.Dict{Pairs: pairs}
 }
 
+// dictLiteralTemplate is what constDictTemplate caches on a DictLiteral node.
+// pairs is nil when the literal has to be evaluated pair by pair.
+type dictLiteralTemplate struct {
+	pairs map[string]object.DictPair
+}
+
+// constDictTemplate returns the entries of a dict literal whose keys and values
+// are all constants, such as {"timeout": 5}, or nil for any other literal. The
+// entries are built once per node; the boxed constants are immutable, so every
+// evaluation can clone the map and share them.
+func constDictTemplate(ctx context.Context, node *ast.DictLiteral) map[string]object.DictPair {
+	if t, ok := node.Template().(*dictLiteralTemplate); ok {
+		return t.pairs
+	}
+	t := &dictLiteralTemplate{}
+	if isConstDictLiteral(node) {
+		t.pairs = make(map[string]object.DictPair, len(node.Pairs))
+		for _, pairNode := range node.Pairs {
+			key := evalNode(ctx, pairNode.Key, nil)
+			value := evalNode(ctx, pairNode.Value, nil)
+			t.pairs[object.DictKey(key)] = object.DictPair{Key: key, Value: value}
+		}
+	}
+	node.SetTemplate(t)
+	return t.pairs
+}
+
+func isConstDictLiteral(node *ast.DictLiteral) bool {
+	for _, pairNode := range node.Pairs {
+		if pairNode.Key == nil || !isConstScalarLiteral(pairNode.Key) || !isConstScalarLiteral(pairNode.Value) {
+			return false
+		}
+	}
+	return true
+}
+
+func isConstScalarLiteral(expr ast.Expression) bool {
+	switch expr.(type) {
+	case *ast.IntegerLiteral, *ast.FloatLiteral, *ast.StringLiteral, *ast.Boolean, *ast.None:
+		return true
+	}
+	return false
+}
+
 func evalIndexExpression(ctx context.Context, left, index object.Object, isDotAccess bool) object.Object {
 	switch {
 	case left.Type() == object.LIST_OBJ && index.Type() == object.INTEGER_OBJ:
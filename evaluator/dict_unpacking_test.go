@@ -0,0 +1,76 @@
+package evaluator
+
+import (
+	"strings"
+	"testing"
+
+	"github.com/paularlott/scriptling/object"
+)
+
+func TestDictLiteralUnpacking(t *testing.T) {
+	tests := []struct {
+		input    string
+		expected int64
+	}{
+		{`d = {"a": 1, **{"b": 2, "c": 3}}
+d["a"] + d["b"] * 10 + d["c"] * 100`, 321},
+		// Later entries override earlier ones, in either direction
+		{`base = {"a": 1, "b": 2}
+d = {**base, "b": 5}
+d["a"] + d["b"] * 10`, 51},
+		{`extra = {"a": 9}
+d = {"a": 1, **extra}
+d["a"]`, 9},
+		// The source dict is copied, not shared
+		{`base = {"a": 1}
+d = {**base}
+d["a"] = 2
+base["a"]`, 1},
+		{`def build(**kwargs):
+    return {"x": 1, **kwargs}
+len(build()) * 10 + len(build(y=2, z=3))`, 13},
+	}
+
+	for _, tt := range tests {
+		testIntegerObject(t, testEval(tt.input), tt.expected)
+	}
+}
+
+func TestDictLiteralUnpackingNonMapping(t *testing.T) {
+	// Uncaught, the TypeError reaches the top level as an error.
+	evaluated := testEval(`{**[1, 2]}`)
+	errObj, ok := evaluated.(*object.Error)
+	if !ok {
+		t.Fatalf("expected error, got %T (%+v)", evaluated, evaluated)
+	}
+	if !strings.Contains(errObj.Message, "'list' object is not a mapping") {
+		t.Errorf("Message = %q, want it to mention 'list' object is not a mapping", errObj.Message)
+	}
+
+	caught := testEval(`
+msg = None
+try:
+    {**[1, 2]}
+except TypeError as e:
+    msg = str(e)
+msg
+`)
+	str, ok := caught.(*object.String)
+	if !ok {
+		t.Fatalf("expected the TypeError to be caught, got %T (%+v)", caught, caught)
+	}
+	if str.StringValue() != "'list' object is not a mapping" {
+		t.Errorf("str(e) = %q, want %q", str.StringValue(), "'list' object is not a mapping")
+	}
+}
+
+func TestMatchDictPatternRest(t *testing.T) {
+	input := `
+result = None
+match {"kind": "msg", "a": 1, "b": 2}:
+    case {"kind": "msg", **rest}:
+        result = len(rest) * 10 + rest["a"] + rest["b"]
+result
+`
+	testIntegerObject(t, testEval(input), 23)
+}
@@ -6,6 +6,7 @@ import (
 	"fmt"
 	"math"
 	"runtime"
+	"sort"
 	"strconv"
 	"strings"
 
@@ -246,6 +247,11 @@ func evalNode(ctx context.Context, node ast.Node, env *object.Environment) objec
 				return result
 			}
 		}
+		if node.Operator == ast.OpIn || node.Operator == ast.OpNotIn {
+			if elements, ok := constLiteralElements(node.Right); ok {
+				return evalInConstLiteral(ctx, node, elements, env)
+			}
+		}
 		if node.Operator == ast.OpAdd {
 			if left, ok := node.Left.(*ast.InfixExpression); ok && left.Operator == ast.OpAdd {
 				if result, ok := tryEvalStringConcatChain(ctx, node, env); ok {
@@ -376,6 +382,33 @@ func evalNode(ctx context.Context, node ast.Node, env *object.Environment) objec
 		if object.IsError(left) {
 			return left
 		}
+		// A constant string key on a dict (resp["status"], user["name"]) is
+		// looked up directly, skipping the index evaluation and the generic
+		// type dispatch in evalIndexExpression.
+		if dict, ok := left.(*object.Dict); ok {
+			if lit, ok := node.Index.(*ast.StringLiteral); ok {
+				if pair, ok := dict.Pairs[object.DictStringKey(lit.Value)]; ok {
+					return pair.Value
+				}
+				return NULL
+			}
+		}
+		// obj.attr on an instance field: try the inline slot this site hit
+		// last time before scanning. Properties and misses (methods, class
+		// attributes) take the general path below.
+		if inst, ok := left.(*object.Instance); ok && node.IsDotAccess {
+			if lit, ok := node.Index.(*ast.StringLiteral); ok {
+				hint := int(node.FieldSlot.Load()) - 1
+				if val, slot, ok := inst.GetFieldHint(lit.Value, hint); ok {
+					if slot != hint {
+						node.FieldSlot.Store(int32(slot + 1))
+					}
+					if _, isProp := val.(*object.Property); !isProp {
+						return val
+					}
+				}
+			}
+		}
 		index := evalNode(ctx, node.Index, env)
 		if object.IsError(index) {
 			return index
@@ -1128,8 +1161,9 @@ func tryEvalStringConcatChain(ctx context.Context, expr *ast.InfixExpression, en
 
 // concatFolder folds the operands of a `+` chain in evaluation order.
 //
-// While every operand so far has been a string they are appended to buf, so a
-// run of strings costs one result allocation rather than one per operator. On the
+// While every operand so far has been a string they are queued in parts and
+// copied into buf in one go once the run ends, so buf is sized exactly and a run
+// of strings costs one result allocation rather than one per operator. On the
 // first non-string operand the run is materialised and folding continues through
 // evalInfixExpression, which keeps the semantics identical to evaluating the
 // chain one operator at a time (string concatenation is associative, so grouping
@@ -1138,7 +1172,9 @@ type concatFolder struct {
 	ctx    context.Context
 	env    *object.Environment
 	buf    strings.Builder
-	buffed bool          // buf holds at least one operand
+	parts  [8]string // string operands not yet copied into buf
+	nparts int
+	plen   int           // total length of parts[:nparts]
 	acc    object.Object // folded result, once a non-string operand has appeared
 	failed object.Object // first error, if any
 }
@@ -1160,21 +1196,47 @@ func (f *concatFolder) add(val object.Object) bool {
 		return f.fold(val)
 	}
 	if s, ok := val.(*object.String); ok {
-		f.buf.WriteString(s.StringValue())
-		f.buffed = true
+		if f.nparts == len(f.parts) {
+			f.flush()
+		}
+		f.parts[f.nparts] = s.StringValue()
+		f.nparts++
+		f.plen += len(s.StringValue())
 		return true
 	}
 	// First non-string operand: close off the string run, then fold normally.
-	if f.buffed {
-		f.acc = object.NewString(f.buf.String())
-		f.buf.Reset()
-		f.buffed = false
+	if f.nparts > 0 || f.buf.Len() > 0 {
+		f.acc = object.NewString(f.joined())
 		return f.fold(val)
 	}
 	f.acc = val
 	return true
 }
 
+// flush copies the queued parts into buf, growing it once for all of them.
+func (f *concatFolder) flush() {
+	f.buf.Grow(f.plen)
+	for _, part := range f.parts[:f.nparts] {
+		f.buf.WriteString(part)
+	}
+	clear(f.parts[:f.nparts])
+	f.nparts, f.plen = 0, 0
+}
+
+// joined returns the string run folded so far. A run of a single operand is
+// returned as-is without copying.
+func (f *concatFolder) joined() string {
+	if f.nparts == 1 && f.buf.Len() == 0 {
+		s := f.parts[0]
+		f.parts[0], f.nparts, f.plen = "", 0, 0
+		return s
+	}
+	f.flush()
+	s := f.buf.String()
+	f.buf.Reset()
+	return s
+}
+
 func (f *concatFolder) fold(val object.Object) bool {
 	f.acc = evalInfixExpression(f.ctx, ast.OpAdd, f.acc, val, f.env)
 	if object.IsError(f.acc) {
@@ -1188,7 +1250,7 @@ func (f *concatFolder) result() object.Object {
 	if f.acc != nil {
 		return f.acc
 	}
-	return object.NewString(f.buf.String())
+	return object.NewString(f.joined())
 }
 
 func evalStringInfixExpression(operator ast.Op, leftVal, rightVal string) object.Object {
@@ -1218,6 +1280,13 @@ func evalStringInfixExpression(operator ast.Op, leftVal, rightVal string) object
 	}
 }
 
+// PercentFormat applies Python-style % formatting to format using args as the
+// positional values, for library functions that take printf-style arguments
+// (e.g. logging.info("user %s", name)).
+func PercentFormat(format string, args []object.Object) object.Object {
+	return evalStringPercentFormat(format, &object.Tuple{Elements: args})
+}
+
 // evalStringPercentFormat implements Python-style % string formatting.
 // Supports: %s, %d, %i, %f, %e, %g, %x, %X, %o, %c, %r, %%
 // With width/precision: %10s, %-10s, %.2f, %05d, etc.
@@ -1303,6 +1372,10 @@ func evalStringPercentFormat(format string, right object.Object) object.Object {
 func formatPercentValue(spec string, conversion byte, val object.Object) (string, object.Object) {
 	switch conversion {
 	case 's':
+		// Match str(): an exception formats as its message.
+		if ex, ok := val.(*object.Exception); ok {
+			return ex.Message, nil
+		}
 		return val.Inspect(), nil
 	case 'r':
 		return fmt.Sprintf("%#v", val.Inspect()), nil
@@ -1486,6 +1559,15 @@ func evalInstanceInfixExpression(ctx context.Context, operator ast.Op, left *obj
 }
 
 func evalIfStatementWithContext(ctx context.Context, ie *ast.IfStatement, env *object.Environment) object.Object {
+	if ladder := ifThresholdLadder(ie); ladder.subject != nil {
+		if v, ok := evalIdentifier(ladder.subject, env).(*object.Integer); ok {
+			if block := ladder.branch(ie, v.IntValue()); block != nil {
+				return evalBlockStatementWithContext(ctx, block, env)
+			}
+			return NULL
+		}
+	}
+
 	condition := evalNode(ctx, ie.Condition, env)
 	if object.IsError(condition) {
 		return condition
@@ -1514,6 +1596,112 @@ func evalIfStatementWithContext(ctx context.Context, ie *ast.IfStatement, env *o
 	return NULL
 }
 
+// thresholdLadder is what ifThresholdLadder caches on an IfStatement. For an
+// if/elif chain whose conditions all compare one variable against decreasing
+// integer constants, as in
+//
+//	if score >= 90: ... elif score >= 80: ... elif score >= 70: ... else: ...
+//
+// subject is that variable and thresholds holds the constants in branch order,
+// with `x > c` normalised to `x >= c+1`. subject is nil for any other chain.
+type thresholdLadder struct {
+	subject    *ast.Identifier
+	thresholds []int64
+}
+
+// linearLadderMax is the longest ladder scanned compare by compare; longer ones
+// are binary searched.
+const linearLadderMax = 8
+
+// branch returns the block the chain would run for the integer x, or nil if no
+// condition holds and there is no else. It matches evaluating the conditions
+// in order: the thresholds are strictly decreasing, so the first one x reaches
+// is the branch taken.
+func (l *thresholdLadder) branch(ie *ast.IfStatement, x int64) *ast.BlockStatement {
+	n := len(l.thresholds)
+	i := n
+	if n <= linearLadderMax {
+		for j, t := range l.thresholds {
+			if x >= t {
+				i = j
+				break
+			}
+		}
+	} else {
+		i = sort.Search(n, func(j int) bool { return x >= l.thresholds[j] })
+	}
+	switch {
+	case i == 0:
+		return ie.Consequence
+	case i < n:
+		return ie.ElifClauses[i-1].Consequence
+	default:
+		return ie.Alternative
+	}
+}
+
+// ifThresholdLadder returns the threshold ladder for ie, working it out once per
+// node. The subject is only read, never called or indexed, so evaluating it
+// once in place of once per condition cannot change what the script observes;
+// anything other than an Integer at run time takes the ordinary path.
+func ifThresholdLadder(ie *ast.IfStatement) *thresholdLadder {
+	if l, ok := ie.Dispatch().(*thresholdLadder); ok {
+		return l
+	}
+	l := &thresholdLadder{}
+	if len(ie.ElifClauses) > 0 {
+		subject, thresholds := ladderStep(ie.Condition, nil, nil)
+		for _, clause := range ie.ElifClauses {
+			if subject == nil {
+				break
+			}
+			subject, thresholds = ladderStep(clause.Condition, subject, thresholds)
+		}
+		if subject != nil {
+			l.subject = subject
+			l.thresholds = thresholds
+		}
+	}
+	ie.SetDispatch(l)
+	return l
+}
+
+// ladderStep checks that cond is `subject >= c` or `subject > c` with a
+// threshold below the previous one and appends it, returning a nil subject when
+// the chain does not fit.
+func ladderStep(cond ast.Expression, subject *ast.Identifier, thresholds []int64) (*ast.Identifier, []int64) {
+	infix, ok := cond.(*ast.InfixExpression)
+	if !ok {
+		return nil, nil
+	}
+	ident, ok := infix.Left.(*ast.Identifier)
+	if !ok || (subject != nil && ident.Name != subject.Name) {
+		return nil, nil
+	}
+	lit, ok := infix.Right.(*ast.IntegerLiteral)
+	if !ok {
+		return nil, nil
+	}
+	t := lit.Value
+	switch infix.Operator {
+	case ast.OpGte:
+	case ast.OpGt:
+		if t == math.MaxInt64 {
+			return nil, nil
+		}
+		t++
+	default:
+		return nil, nil
+	}
+	if len(thresholds) > 0 && t >= thresholds[len(thresholds)-1] {
+		return nil, nil
+	}
+	if subject == nil {
+		subject = ident
+	}
+	return subject, append(thresholds, t)
+}
+
 func evalWhileStatementWithContext(ctx context.Context, ws *ast.WhileStatement, env *object.Environment) object.Object {
 	var result object.Object = NULL
 	cc := newContextChecker(ctx)
@@ -1563,6 +1751,16 @@ func evalIdentifier(node *ast.Identifier, env *object.Environment) object.Object
 		}
 		// Cache miss (wrong scope or stale index), fall through to full lookup.
 		node.SlotCache.Store(0)
+	} else if cached < 0 {
+		// Not a local: globals and closure variables resolve through the cached
+		// outer location, skipping a map lookup per scope on the way out.
+		if c := node.OuterCache(); c > 0 {
+			hops, slotIdx := ast.DecodeCalleeLocation(c)
+			if val, ok := env.GetAtOuterLocation(hops, slotIdx, node.Value()); ok {
+				return val
+			}
+			node.SetOuterCache(0)
+		}
 	}
 
 	if val, ok := env.Get(node.Value()); ok {
@@ -1571,8 +1769,13 @@ func evalIdentifier(node *ast.Identifier, env *object.Environment) object.Object
 			if slotVal, slotOK := env.GetSlotByIndex(idx); slotOK && slotVal == val {
 				node.SlotCache.Store(int32(idx + 1))
 			}
-		} else if node.SlotCache.Load() == 0 {
-			node.SlotCache.Store(-1) // not a local slot
+		} else {
+			if node.SlotCache.Load() == 0 {
+				node.SlotCache.Store(-1) // not a local slot
+			}
+			if node.OuterCache() == 0 {
+				cacheOuterLocation(node, env)
+			}
 		}
 		return val
 	}
@@ -1582,6 +1785,55 @@ func evalIdentifier(node *ast.Identifier, env *object.Environment) object.Object
 	return errors.NewIdentifierError(node.Value())
 }
 
+// cacheOuterLocation records where a non-local identifier resolves, or marks it
+// uncacheable if that location could change (see object.OuterLocation).
+func cacheOuterLocation(node *ast.Identifier, env *object.Environment) {
+	if hops, slotIdx, ok := env.OuterLocation(node.Value()); ok {
+		node.SetOuterCache(ast.EncodeCalleeLocation(hops, slotIdx))
+	} else {
+		node.SetOuterCache(-1)
+	}
+}
+
+// setIdentifierOuter handles assignment to a name declared global or nonlocal
+// in this scope via its cached outer location. Returns false when the name is
+// an ordinary local or the location is unknown, leaving the caller to use Set.
+//
+// The declaration check matters because augmented assignment reads and writes
+// through the same node: a read in a class body caches the outer location of
+// the name, but the write must still land in the class's own store.
+func setIdentifierOuter(target *ast.Identifier, value object.Object, env *object.Environment) bool {
+	c := target.OuterCache()
+	if c <= 0 {
+		return false
+	}
+	name := target.Value()
+	if !env.IsGlobal(name) && !env.IsNonlocal(name) {
+		return false
+	}
+	hops, slotIdx := ast.DecodeCalleeLocation(c)
+	if env.SetAtOuterLocation(hops, slotIdx, name, value) {
+		return true
+	}
+	target.SetOuterCache(0)
+	return false
+}
+
+// noteIdentifierTarget caches how an assignment to target resolves after a full
+// Set: its local slot, or for global/nonlocal names the outer location.
+func noteIdentifierTarget(target *ast.Identifier, env *object.Environment) {
+	if target.SlotCache.Load() != 0 {
+		return
+	}
+	name := target.Value()
+	if idx, ok := env.GetSlotIndex(name); ok {
+		target.SlotCache.Store(int32(idx + 1))
+	} else if env.IsGlobal(name) || env.IsNonlocal(name) {
+		target.SlotCache.Store(-1)
+		cacheOuterLocation(target, env)
+	}
+}
+
 func evalFunctionStatement(ctx context.Context, stmt *ast.FunctionStatement, env *object.Environment) object.Object {
 	localSlots, localSlotNames := analyzeFunctionLocals(stmt)
 	fn := &object.Function{
@@ -1598,6 +1850,9 @@ func evalFunctionStatement(ctx context.Context, stmt *ast.FunctionStatement, env
 		ParamSlotIndexes: stmt.Function.ParamSlotIndexes,
 		ReuseCallEnv:     !stmt.Function.HasNestedFunc,
 	}
+	if fn.Name == "__init__" {
+		fn.FieldInits = trivialInitFields(stmt.Function)
+	}
 	var result object.Object = fn
 	for i := len(stmt.GetDecorators()) - 1; i >= 0; i-- {
 		dec := evalNode(ctx, stmt.GetDecorators()[i], env)
@@ -1843,6 +2098,19 @@ func evalCallExpression(ctx context.Context, node *ast.CallExpression, env *obje
 				// Use the existing fast builtin path
 				return applyBuiltinFast(ctx, node, env, fn)
 			case *object.LambdaFunction:
+				// Fast path for plain positional lambdas: evaluate into a stack
+				// buffer and bind straight into the parameter slots.
+				if nargs := len(node.Arguments); nargs <= 3 && fn.IsPositionalOnly(nargs) {
+					var buf [3]object.Object
+					for i, arg := range node.Arguments {
+						val := evalNode(ctx, arg, env)
+						if object.IsError(val) {
+							return val
+						}
+						buf[i] = val
+					}
+					return applyLambdaFunctionN(ctx, fn, buf[:nargs])
+				}
 				args := evalCallArgs(ctx, node.Arguments, env)
 				if len(args) == 1 && object.IsError(args[0]) {
 					return args[0]
@@ -1971,8 +2239,86 @@ func applyBuiltinFast(ctx context.Context, node *ast.CallExpression, env *object
 //     envFn holds the resolved value so the caller can skip a redundant lookup.
 //   - ok=false, envFn==nil: not applicable, caller should use normal resolution.
 
+// trivialInitFields returns the field assignments of an __init__ whose body is
+// nothing but `self.<name> = <parameter>` statements (and a docstring), as in
+//
+//	def __init__(self, x, y):
+//	    self.x = x
+//	    self.y = y
+//
+// or nil for any other body or for a signature with defaults, *args, **kwargs
+// or keyword-only parameters.
+func trivialInitFields(fl *ast.FunctionLiteral) []object.FieldInit {
+	if len(fl.Parameters) < 2 || len(fl.Body.Statements) == 0 ||
+		len(fl.GetDefaultValues()) > 0 || fl.GetVariadic() != nil || fl.GetKwargs() != nil || fl.GetKeywordOnlyStart() >= 0 {
+		return nil
+	}
+	self := fl.Parameters[0].Value()
+	params := make(map[string]int, len(fl.Parameters)-1)
+	for i, p := range fl.Parameters[1:] {
+		params[p.Value()] = i
+	}
+	inits := make([]object.FieldInit, 0, len(fl.Body.Statements))
+	for _, stmt := range fl.Body.Statements {
+		if doc, ok := stmt.(*ast.ExpressionStatement); ok {
+			if _, isStr := doc.Expression.(*ast.StringLiteral); isStr {
+				continue
+			}
+			return nil
+		}
+		assign, ok := stmt.(*ast.AssignStatement)
+		if !ok || assign.Chained != nil {
+			return nil
+		}
+		target, ok := assign.Left.(*ast.IndexExpression)
+		if !ok || !target.IsDotAccess {
+			return nil
+		}
+		obj, ok := target.Left.(*ast.Identifier)
+		if !ok || obj.Value() != self {
+			return nil
+		}
+		field, ok := target.Index.(*ast.StringLiteral)
+		if !ok {
+			return nil
+		}
+		value, ok := assign.Value.(*ast.Identifier)
+		if !ok {
+			return nil
+		}
+		param, ok := params[value.Value()]
+		if !ok {
+			return nil
+		}
+		inits = append(inits, object.FieldInit{Field: field.Value, Param: param})
+	}
+	if len(inits) == 0 {
+		return nil
+	}
+	return inits
+}
+
+// applyTrivialInit fills instance's fields straight from args for an __init__
+// recognised by trivialInitFields, reporting false when the call does not fit
+// (keywords, a wrong argument count, or a property that must see the write)
+// and the body has to run as usual.
+func applyTrivialInit(fn *object.Function, instance *object.Instance, args []object.Object, keywords map[string]object.Object) bool {
+	if fn.FieldInits == nil || len(keywords) > 0 || len(args) != len(fn.Parameters)-1 {
+		return false
+	}
+	for _, init := range fn.FieldInits {
+		if findPropertyInClass(init.Field, instance.Class) != nil {
+			return false
+		}
+	}
+	for _, init := range fn.FieldInits {
+		instance.SetField(init.Field, args[init.Param])
+	}
+	return true
+}
+
 func createInstance(ctx context.Context, class *object.Class, args []object.Object, keywords map[string]object.Object, env *object.Environment) object.Object {
-	instance := object.NewInstanceWithFields(class, make(map[string]object.Object))
+	instance := object.NewInstance(class)
 
 	// Call __init__ if it exists, walking the base class chain
 	var initMethod object.Object
@@ -1982,6 +2328,9 @@ func createInstance(ctx context.Context, class *object.Class, args []object.Obje
 			break
 		}
 	}
+	if fn, ok := initMethod.(*object.Function); ok && applyTrivialInit(fn, instance, args, keywords) {
+		initMethod = nil
+	}
 	if initMethod != nil {
 		// Bind 'self' to the instance
 		n := len(args) + 1
@@ -2245,6 +2594,33 @@ func applyLambdaFunctionWithContext(ctx context.Context, fn *object.LambdaFuncti
 	return evaluated // No unwrapping needed for lambda expressions
 }
 
+// applyLambdaFunctionN calls a lambda that IsPositionalOnly for len(args),
+// skipping the general parameter binding in extendEnvWithParams.
+func applyLambdaFunctionN(ctx context.Context, fn *object.LambdaFunction, args []object.Object) object.Object {
+	if cd := GetCallDepthFromContext(ctx); cd != nil {
+		if !cd.Enter() {
+			return errors.NewCallDepthExceededError(int(cd.max))
+		}
+		defer cd.Exit()
+	}
+
+	var extendedEnv *object.Environment
+	if fn.ReuseCallEnv {
+		extendedEnv = object.AcquireCallEnvironment(fn.Env, fn.LocalSlots, fn.LocalSlotNames)
+	} else {
+		extendedEnv = object.NewEnclosedEnvironmentWithSlots(fn.Env, fn.LocalSlots, fn.LocalSlotNames)
+	}
+	defer object.ReleaseCallEnvironment(extendedEnv)
+
+	for i, slotIdx := range fn.ParamSlotIndexes {
+		if !extendedEnv.SetSlotByIndex(slotIdx, args[i]) {
+			extendedEnv.Set(fn.Parameters[i].Value(), args[i])
+		}
+	}
+
+	return evalWithContext(ctx, fn.Body, extendedEnv)
+}
+
 // funcParams abstracts the common parts of Function and LambdaFunction for parameter handling
 type funcParams struct {
 	parameters       []*ast.Identifier
@@ -2346,7 +2722,9 @@ func extendEnvWithParams(ctx context.Context, fp funcParams, args []object.Objec
 			}
 		}
 
-		var extraKwargs map[string]object.Object
+		// Extra keywords go straight into the **kwargs dict; there is no
+		// intermediate map to copy from.
+		var kwargsDict *object.Dict
 
 		for key, value := range keywords {
 			// Check if parameter exists
@@ -2361,10 +2739,13 @@ func extendEnvWithParams(ctx context.Context, fp funcParams, args []object.Objec
 			if paramIdx == -1 {
 				// If **kwargs is defined, collect extra keyword arguments
 				if fp.kwargs != nil {
-					if extraKwargs == nil {
-						extraKwargs = make(map[string]object.Object, len(keywords))
+					if kwargsDict == nil {
+						kwargsDict = &object.Dict{Pairs: make(map[string]object.DictPair, len(keywords))}
+					}
+					kwargsDict.Pairs[object.DictStringKey(key)] = object.DictPair{
+						Key:   object.NewString(key),
+						Value: value,
 					}
-					extraKwargs[key] = value
 					continue
 				}
 				return nil, errors.NewError("got an unexpected keyword argument '%s'", key)
@@ -2380,12 +2761,8 @@ func extendEnvWithParams(ctx context.Context, fp funcParams, args []object.Objec
 
 		// Set **kwargs dict if defined
 		if fp.kwargs != nil {
-			kwargsDict := &object.Dict{Pairs: make(map[string]object.DictPair, len(extraKwargs))}
-			for key, value := range extraKwargs {
-				kwargsDict.Pairs[object.DictKey(object.NewString(key))] = object.DictPair{
-					Key:   object.NewString(key),
-					Value: value,
-				}
+			if kwargsDict == nil {
+				kwargsDict = &object.Dict{Pairs: make(map[string]object.DictPair)}
 			}
 			env.Set(fp.kwargs.Value(), kwargsDict)
 		}
@@ -2452,7 +2829,7 @@ func extendLambdaEnv(ctx context.Context, fn *object.LambdaFunction, args []obje
 		localSlots:       fn.LocalSlots,
 		localSlotNames:   fn.LocalSlotNames,
 		paramSlotIndexes: fn.ParamSlotIndexes,
-		reuseCallEnv:     true,
+		reuseCallEnv:     fn.ReuseCallEnv,
 	}, args, keywords)
 }
 
@@ -2922,6 +3299,68 @@ func evalFromImportStandard(fis *ast.FromImportStatement, moduleName string, env
 	return NULL
 }
 
+// constLiteralElements returns the elements of a list, tuple or set literal
+// made up only of integer and string literals, as in `status in [200, 201]`.
+func constLiteralElements(expr ast.Expression) ([]ast.Expression, bool) {
+	var elements []ast.Expression
+	switch lit := expr.(type) {
+	case *ast.ListLiteral:
+		elements = lit.Elements
+	case *ast.TupleLiteral:
+		elements = lit.Elements
+	case *ast.SetLiteral:
+		elements = lit.Elements
+	default:
+		return nil, false
+	}
+	for _, elem := range elements {
+		switch elem.(type) {
+		case *ast.IntegerLiteral, *ast.StringLiteral:
+		default:
+			return nil, false
+		}
+	}
+	return elements, true
+}
+
+// evalInConstLiteral evaluates `x in <literal>` / `x not in <literal>` where the
+// literal holds only integer and string constants. An integer or string x is
+// compared against the literals directly, so the container is never built.
+// With only those element types list, tuple and set membership agree. Any
+// other x falls back to building the container as usual.
+func evalInConstLiteral(ctx context.Context, node *ast.InfixExpression, elements []ast.Expression, env *object.Environment) object.Object {
+	left := evalNode(ctx, node.Left, env)
+	if object.IsError(left) {
+		return left
+	}
+	found := false
+	switch l := left.(type) {
+	case *object.Integer:
+		v := l.IntValue()
+		for _, elem := range elements {
+			if lit, ok := elem.(*ast.IntegerLiteral); ok && lit.Value == v {
+				found = true
+				break
+			}
+		}
+	case *object.String:
+		v := l.StringValue()
+		for _, elem := range elements {
+			if lit, ok := elem.(*ast.StringLiteral); ok && lit.Value == v {
+				found = true
+				break
+			}
+		}
+	default:
+		right := evalNode(ctx, node.Right, env)
+		if object.IsError(right) {
+			return right
+		}
+		return evalInfixExpression(ctx, node.Operator, left, right, env)
+	}
+	return nativeBoolToBooleanObject(found == (node.Operator == ast.OpIn))
+}
+
 func evalInOperator(ctx context.Context, left, right object.Object) object.Object {
 	switch container := right.(type) {
 	case *object.List:
@@ -3075,6 +3514,27 @@ func evalIsOperator(left, right object.Object) object.Object {
 }
 
 func evalMultipleAssignStatementWithContext(ctx context.Context, node *ast.MultipleAssignStatement, env *object.Environment) object.Object {
+	// Fast path: key, value = item[0], item[1] — evaluate the right-hand side
+	// into a stack buffer and bind it directly instead of building a Tuple only
+	// to unpack it. Every value is evaluated before any name is bound, so
+	// swaps like a, b = b, a behave as before.
+	if tl, ok := node.Value.(*ast.TupleLiteral); ok && node.StarredIndex < 0 &&
+		len(tl.Elements) == len(node.Names) && len(tl.Elements) <= 4 {
+		var buf [4]object.Object
+		values := buf[:len(tl.Elements)]
+		for i, e := range tl.Elements {
+			v := evalNode(ctx, e, env)
+			if object.IsError(v) {
+				return v
+			}
+			values[i] = v
+		}
+		for i, name := range node.Names {
+			env.Set(name.Value(), values[i])
+		}
+		return NULL
+	}
+
 	val := evalNode(ctx, node.Value, env)
 	if object.IsError(val) {
 		return val
@@ -3403,9 +3863,7 @@ func matchesExceptionTypeExpr(exceptionType string, exceptTypeExpr ast.Expressio
 		return matchesNamedExceptionType(exceptionType, expr.Value())
 	case *ast.IndexExpression:
 		// Handle dotted names like requests.HTTPError — match on the last component
-		dotted := buildDottedName(expr)
-		parts := strings.Split(dotted, ".")
-		return matchesNamedExceptionType(exceptionType, parts[len(parts)-1])
+		return matchesNamedExceptionType(exceptionType, lastDottedName(expr))
 	case *ast.TupleLiteral:
 		for _, elem := range expr.Elements {
 			if matchesExceptionTypeExpr(exceptionType, elem) {
@@ -3429,33 +3887,36 @@ func matchesNamedExceptionType(exceptionType, expectedType string) bool {
 	if expectedType == "Exception" {
 		return true
 	}
-	return exceptionType == expectedType
+	// Walk the registered base types so `except Base:` catches subclasses. The
+	// depth bound guards against a misregistered cycle.
+	for depth := 0; exceptionType != "" && depth < 16; depth++ {
+		if exceptionType == expectedType {
+			return true
+		}
+		exceptionType = object.ExceptionParent(exceptionType)
+	}
+	return false
 }
 
-// buildDottedName constructs a dotted name from nested IndexExpression nodes
-// e.g., requests.HTTPError becomes "requests.HTTPError"
-func buildDottedName(expr *ast.IndexExpression) string {
-	parts := []string{}
-
-	// Walk the chain of index expressions
+// lastDottedName returns the last component of a dotted name built from nested
+// IndexExpression nodes, e.g. "HTTPError" for requests.HTTPError. It is read
+// straight off the AST; except clauses are matched every time an exception
+// reaches them, so this avoids building and splitting the full name each time.
+func lastDottedName(expr *ast.IndexExpression) string {
 	current := ast.Expression(expr)
 	for {
-		if idx, ok := current.(*ast.IndexExpression); ok {
-			// Get the rightmost part
-			if str, ok := idx.Index.(*ast.StringLiteral); ok {
-				parts = append([]string{str.Value}, parts...)
-			}
-			current = idx.Left
-		} else if ident, ok := current.(*ast.Identifier); ok {
-			// Base identifier
-			parts = append([]string{ident.Value()}, parts...)
-			break
-		} else {
-			break
+		switch node := current.(type) {
+		case *ast.IndexExpression:
+			if str, ok := node.Index.(*ast.StringLiteral); ok {
+				return str.Value
+			}
+			current = node.Left
+		case *ast.Identifier:
+			return node.Value()
+		default:
+			return ""
 		}
 	}
-
-	return strings.Join(parts, ".")
 }
 
 // assignmentExceptionError wraps an object.Exception so it can travel through
@@ -3763,14 +4224,12 @@ func assignToExpression(ctx context.Context, expr ast.Expression, value object.O
 			if env.SetCachedSlot(int(cached-1), left.Value(), value) {
 				return nil
 			}
+		} else if cached < 0 && setIdentifierOuter(left, value, env) {
+			return nil
 		}
 		env.Set(left.Value(), value)
-		// Cache the slot index for future writes.
-		if left.SlotCache.Load() == 0 {
-			if idx, ok := env.GetSlotIndex(left.Value()); ok {
-				left.SlotCache.Store(int32(idx + 1))
-			}
-		}
+		// Cache the slot index (or global/nonlocal location) for future writes.
+		noteIdentifierTarget(left, env)
 		return nil
 	case *ast.IndexExpression:
 		if err := assignToNestedFloatArrayIndex(ctx, left, value, env); err != nil {
@@ -4033,13 +4492,11 @@ func setIdentifierFast(target *ast.Identifier, value object.Object, env *object.
 		if env.SetCachedSlot(int(cached-1), target.Value(), value) {
 			return
 		}
+	} else if cached < 0 && setIdentifierOuter(target, value, env) {
+		return
 	}
 	env.Set(target.Value(), value)
-	if target.SlotCache.Load() == 0 {
-		if idx, ok := env.GetSlotIndex(target.Value()); ok {
-			target.SlotCache.Store(int32(idx + 1))
-		}
-	}
+	noteIdentifierTarget(target, env)
 }
 
 // instanceToIterator wraps an instance with __next__ as an object.Iterator
@@ -4069,6 +4526,9 @@ func evalForStatementWithContext(ctx context.Context, fs *ast.ForStatement, env
 	if object.IsError(iterable) {
 		return iterable
 	}
+	if fs.AppendTarget != "" {
+		reserveLoopAppend(fs, iterableLen(iterable), env)
+	}
 
 	var result object.Object = NULL
 	broke := false
@@ -4350,6 +4810,48 @@ forDone:
 	return result
 }
 
+// maxLoopAppendReserve caps the capacity reserveLoopAppend sets aside, so a
+// long loop that breaks early does not hold on to a huge empty backing array.
+const maxLoopAppendReserve = 1 << 16
+
+// reserveLoopAppend gives the list a loop appends to on every iteration (see
+// ast.LoopAppendTarget) room for n elements before the loop starts, so it is
+// allocated once instead of regrown as it fills. Only an empty list is touched,
+// and only its capacity changes.
+func reserveLoopAppend(fs *ast.ForStatement, n int, env *object.Environment) {
+	if fs.AppendTarget == "" || n <= 1 {
+		return
+	}
+	n = min(n, maxLoopAppendReserve)
+	if val, ok := env.Get(fs.AppendTarget); ok {
+		if list, ok := val.(*object.List); ok && len(list.Elements) == 0 && cap(list.Elements) < n {
+			list.Elements = make([]object.Object, 0, n)
+		}
+	}
+}
+
+// iterableLen returns how many items a for loop over obj will see, or -1 when
+// that is not known without iterating.
+func iterableLen(obj object.Object) int {
+	switch o := obj.(type) {
+	case *object.List:
+		return len(o.Elements)
+	case *object.Tuple:
+		return len(o.Elements)
+	case *object.Dict:
+		return len(o.Pairs)
+	case *object.DictKeys:
+		return len(o.Dict.Pairs)
+	case *object.DictValues:
+		return len(o.Dict.Pairs)
+	case *object.DictItems:
+		return len(o.Dict.Pairs)
+	case *object.Iterator:
+		return o.LenHint()
+	}
+	return -1
+}
+
 func evalFastRangeForStatement(ctx context.Context, fs *ast.ForStatement, env *object.Environment) (object.Object, bool) {
 	if len(fs.Variables) != 1 || fs.Else != nil {
 		return nil, false
@@ -4379,6 +4881,8 @@ func evalFastRangeForStatement(ctx context.Context, fs *ast.ForStatement, env *o
 		return errObj, true
 	}
 
+	reserveLoopAppend(fs, object.RangeLen(start, stop, step), env)
+
 	var result object.Object = NULL
 	cc := newContextChecker(ctx)
 	for i := start; ; i += step {
@@ -4623,7 +5127,15 @@ func evalListComprehension(ctx context.Context, lc *ast.ListComprehension, env *
 	if result, ok := tryEvalFastListComprehension(ctx, lc, iterable, env); ok {
 		return result
 	}
-	result := []object.Object{}
+	// With no filter and a single for clause, every element produces one
+	// value (e.g. [k if v else d for k, v in pairs]), so size the result up
+	// front like the single-variable fast path does.
+	var result []object.Object
+	if lc.Condition == nil && len(lc.AdditionalClauses) == 0 {
+		if n := iterableLen(iterable); n > 0 {
+			result = make([]object.Object, 0, min(n, maxLoopAppendReserve))
+		}
+	}
 	compEnv := object.NewEnclosedEnvironment(env)
 	emit := func() object.Object {
 		v := evalNode(ctx, lc.Expression, compEnv)
@@ -4654,6 +5166,9 @@ func evalListComprehension(ctx context.Context, lc *ast.ListComprehension, env *
 	if err := iterateObject(ctx, iterable, runBody); err != nil {
 		return err
 	}
+	if result == nil {
+		result = []object.Object{}
+	}
 	return &object.List{Elements: result}
 }
 
@@ -4710,6 +5225,11 @@ func tryEvalFastListComprehension(ctx context.Context, lc *ast.ListComprehension
 			}
 		}
 	case *object.Iterator:
+		// Without a filter every value produces an element, so an iterator
+		// that knows its length (range) can size the result up front.
+		if lc.Condition == nil {
+			result = make([]object.Object, 0, it.PreallocHint())
+		}
 		for {
 			element, ok := it.Next()
 			if !ok {
@@ -4842,77 +5362,90 @@ func evalLambda(lambda *ast.Lambda, env *object.Environment) object.Object {
 		LocalSlots:       localSlots,
 		LocalSlotNames:   localSlotNames,
 		ParamSlotIndexes: lambda.ParamSlotIndexes,
+		ReuseCallEnv:     !lambda.HasNestedFunc,
 	}
 }
 
 func evalFStringLiteral(ctx context.Context, fstr *ast.FStringLiteral, env *object.Environment) object.Object {
-	var builder strings.Builder
-
-	// Pre-allocate capacity to reduce reallocations
-	// Estimate base size from static parts plus some buffer for expressions
-	estimatedSize := 0
+	// Format every expression first, then copy the pieces into a buffer of
+	// exactly the final length: one allocation regardless of how long the
+	// interpolated values turn out to be.
+	var formattedBuf [8]string
+	formatted := formattedBuf[:0]
+	size := 0
 	for _, part := range fstr.Parts {
-		estimatedSize += len(part)
+		size += len(part)
 	}
-	// Add buffer for formatted expressions (rough estimate)
-	estimatedSize += len(fstr.Expressions) * 16
-	builder.Grow(estimatedSize)
-
-	for i, part := range fstr.Parts {
-		builder.WriteString(part)
-		if i < len(fstr.Expressions) {
-			exprResult := evalNode(ctx, fstr.Expressions[i], env)
-			if object.IsError(exprResult) {
-				return exprResult
-			}
+	var specs []*formatSpec
+	if raw := fstr.GetFormatSpecs(); raw != nil {
+		specs = parsedFStringSpecs(fstr, raw)
+	}
+	var single *object.String
+	for i, expr := range fstr.Expressions {
+		exprResult := evalNode(ctx, expr, env)
+		if object.IsError(exprResult) {
+			return exprResult
+		}
+		var spec *formatSpec
+		if specs != nil {
+			spec = specs[i]
+		}
+		var f string
+		if spec != nil {
+			f = formatWithParsedSpec(exprResult, spec)
+		} else {
 			// Call __str__ on instances for f-string formatting
-			specs := fstr.GetFormatSpecs()
-			specEmpty := specs == nil || specs[i] == ""
-			if inst, ok := exprResult.(*object.Instance); ok && specEmpty {
+			if inst, ok := exprResult.(*object.Instance); ok {
 				if result := callDunderMethod(ctx, inst, "__str__", nil, env); result != nil {
 					exprResult = result
 				}
 			}
-			spec := ""
-			if specs != nil {
-				spec = specs[i]
+			if str, ok := exprResult.(*object.String); ok {
+				single = str
 			}
-			formatted := formatWithSpec(exprResult, spec)
-			builder.WriteString(formatted)
+			f = formatPlain(exprResult)
 		}
+		size += len(f)
+		formatted = append(formatted, f)
 	}
 
-	return object.NewString(builder.String())
-}
+	// f"{s}" of a string is that string; strings are immutable, so reuse it
+	if single != nil && len(formatted) == 1 && size == len(formatted[0]) {
+		return single
+	}
 
-func formatWithSpec(obj object.Object, spec string) string {
-	if spec == "" {
-		switch v := obj.(type) {
-		case *object.Integer:
-			return strconv.FormatInt(v.IntValue(), 10)
-		case *object.Float:
-			if v.FloatValue() == float64(int64(v.FloatValue())) {
-				return strconv.FormatFloat(v.FloatValue(), 'f', 1, 64)
-			}
-			return strconv.FormatFloat(v.FloatValue(), 'g', -1, 64)
+	var builder strings.Builder
+	builder.Grow(size)
+	for i, part := range fstr.Parts {
+		builder.WriteString(part)
+		if i < len(formatted) {
+			builder.WriteString(formatted[i])
 		}
-		return obj.Inspect()
 	}
 
-	// Parse the format spec: [[fill]align][sign][#][0][width][grouping][.precision][type]
-	// We support: [fill]align, 0width, width, .precision, type
-	// Types: d, f, e, E, g, G, x, X, o, b, s, %
-	// Align: <, >, ^, = (with optional fill char)
-	// Grouping: ,
+	return object.NewString(builder.String())
+}
+
+// formatSpec is a parsed format spec:
+// [[fill]align][sign][#][0][width][grouping][.precision][type].
+type formatSpec struct {
+	fill      rune
+	align     rune
+	sign      rune // '+', '-', or ' '
+	zero      bool
+	width     int
+	precision int
+	grouping  bool
+	typeChar  byte
+}
 
-	var fill rune = ' '
-	var align rune
-	var sign rune // '+', '-', or ' '
-	var zero bool
-	var width int
-	var precision int = -1
-	var grouping bool
-	var typeChar byte
+// parseFormatSpec parses a non-empty format spec.
+// We support: [fill]align, 0width, width, .precision, type
+// Types: d, f, e, E, g, G, x, X, o, b, s, %
+// Align: <, >, ^, = (with optional fill char)
+// Grouping: ,
+func parseFormatSpec(spec string) formatSpec {
+	fs := formatSpec{fill: ' ', precision: -1}
 
 	i := 0
 	runes := []rune(spec)
@@ -4920,17 +5453,17 @@ func formatWithSpec(obj object.Object, spec string) string {
 
 	// Check for fill+align (2 chars: fill then align)
 	if n >= 2 && (runes[1] == '<' || runes[1] == '>' || runes[1] == '^' || runes[1] == '=') {
-		fill = runes[0]
-		align = runes[1]
+		fs.fill = runes[0]
+		fs.align = runes[1]
 		i = 2
 	} else if n >= 1 && (runes[0] == '<' || runes[0] == '>' || runes[0] == '^' || runes[0] == '=') {
-		align = runes[0]
+		fs.align = runes[0]
 		i = 1
 	}
 
 	// Sign (+, -, space)
 	if i < n && (runes[i] == '+' || runes[i] == '-' || runes[i] == ' ') {
-		sign = runes[i]
+		fs.sign = runes[i]
 		i++
 	}
 
@@ -4940,36 +5473,90 @@ func formatWithSpec(obj object.Object, spec string) string {
 	}
 
 	// Zero padding
-	if i < n && runes[i] == '0' && align == 0 {
-		zero = true
+	if i < n && runes[i] == '0' && fs.align == 0 {
+		fs.zero = true
 		i++
 	}
 
 	// Width
 	for i < n && runes[i] >= '0' && runes[i] <= '9' {
-		width = width*10 + int(runes[i]-'0')
+		fs.width = fs.width*10 + int(runes[i]-'0')
 		i++
 	}
 
 	// Grouping
 	if i < n && runes[i] == ',' {
-		grouping = true
+		fs.grouping = true
 		i++
 	}
 
 	// Precision
 	if i < n && runes[i] == '.' {
 		i++
-		precision = 0
+		fs.precision = 0
 		for i < n && runes[i] >= '0' && runes[i] <= '9' {
-			precision = precision*10 + int(runes[i]-'0')
+			fs.precision = fs.precision*10 + int(runes[i]-'0')
 			i++
 		}
 	}
 
 	// Type
 	if i < n {
-		typeChar = byte(runes[i])
+		fs.typeChar = byte(runes[i])
+	}
+	return fs
+}
+
+// parsedFStringSpecs returns fstr's format specs parsed once and cached on the
+// node; entries for expressions without a spec are nil.
+func parsedFStringSpecs(fstr *ast.FStringLiteral, specs []string) []*formatSpec {
+	if cached, ok := fstr.ParsedSpecs().([]*formatSpec); ok {
+		return cached
+	}
+	parsed := make([]*formatSpec, len(specs))
+	for i, spec := range specs {
+		if spec != "" {
+			fs := parseFormatSpec(spec)
+			parsed[i] = &fs
+		}
+	}
+	fstr.SetParsedSpecs(parsed)
+	return parsed
+}
+
+// formatPlain formats obj as an f-string replacement field with no spec.
+func formatPlain(obj object.Object) string {
+	switch v := obj.(type) {
+	case *object.Integer:
+		return v.Inspect()
+	case *object.Float:
+		if v.FloatValue() == float64(int64(v.FloatValue())) {
+			return strconv.FormatFloat(v.FloatValue(), 'f', 1, 64)
+		}
+		return strconv.FormatFloat(v.FloatValue(), 'g', -1, 64)
+	}
+	return obj.Inspect()
+}
+
+func formatWithParsedSpec(obj object.Object, fs *formatSpec) string {
+	fill, align, sign, zero := fs.fill, fs.align, fs.sign, fs.zero
+	width, precision, grouping, typeChar := fs.width, fs.precision, fs.grouping, fs.typeChar
+
+	// Under a spec a bool formats as the int it is: f"{True:03d}" is "001".
+	if b, ok := obj.(*object.Boolean); ok && typeChar != 's' {
+		if b.BoolValue() {
+			obj = object.NewInteger(1)
+		} else {
+			obj = object.NewInteger(0)
+		}
+	}
+
+	// {n:02d} and friends on a plain integer: zero padding only, so nothing
+	// below can change the digits.
+	if typeChar == 'd' && zero && sign == 0 && !grouping {
+		if i, ok := obj.(*object.Integer); ok {
+			return formatZeroPaddedInt(i.IntValue(), width)
+		}
 	}
 
 	// Format the value
@@ -5213,21 +5800,26 @@ func formatWithCommas(n int64) string {
 }
 
 func formatZeroPaddedInt(n int64, width int) string {
-	if width <= 0 {
-		return strconv.FormatInt(n, 10)
+	var buf [20]byte
+	u := uint64(n)
+	if n < 0 {
+		u = -u
 	}
+	digits := strconv.AppendUint(buf[:0], u, 10)
+	size := len(digits)
 	if n < 0 {
-		digits := strconv.FormatInt(-n, 10)
-		if len(digits)+1 >= width {
-			return "-" + digits
-		}
-		return "-" + strings.Repeat("0", width-len(digits)-1) + digits
+		size++
 	}
-	digits := strconv.FormatInt(n, 10)
-	if len(digits) >= width {
-		return digits
+	var out strings.Builder
+	out.Grow(max(size, width))
+	if n < 0 {
+		out.WriteByte('-')
+	}
+	for pad := width - size; pad > 0; pad-- {
+		out.WriteByte('0')
 	}
-	return strings.Repeat("0", width-len(digits)) + digits
+	out.Write(digits)
+	return out.String()
 }
 
 func formatBaseInt(n int64, base int, upper bool, width int, zero bool) string {
@@ -5376,7 +5968,13 @@ func matchPattern(ctx context.Context, subject object.Object, pattern ast.Expres
 		}
 
 		// Match all keys in pattern
+		var rest ast.Expression
 		for _, patternPair := range p.Pairs {
+			if patternPair.Key == nil {
+				// {**rest} captures the keys the pattern does not name.
+				rest = patternPair.Value
+				continue
+			}
 			keyObj := evalNode(ctx, patternPair.Key, object.NewEnvironment())
 			if object.IsError(keyObj) {
 				return keyObj, NULL
@@ -5401,6 +5999,19 @@ func matchPattern(ctx context.Context, subject object.Object, pattern ast.Expres
 			}
 		}
 
+		if ident, ok := rest.(*ast.Identifier); ok && ident.Value() != "_" {
+			restPairs := make(map[string]object.DictPair, len(dictObj.Pairs))
+			for k, v := range dictObj.Pairs {
+				restPairs[k] = v
+			}
+			for _, patternPair := range p.Pairs {
+				if patternPair.Key != nil {
+					delete(restPairs, evalHashKey(ctx, evalNode(ctx, patternPair.Key, object.NewEnvironment())))
+				}
+			}
+			capturedVars[ident.Value()] = &object.Dict{Pairs: restPairs}
+		}
+
 		return TRUE, subject
 
 	case *ast.ListLiteral:
@@ -36,6 +36,11 @@ func TestInOperator(t *testing.T) {
 		{`result = "hello" in "hello world"`, true},
 		{`result = "foo" in "hello world"`, false},
 		{`result = "world" in "hello world"`, true},
+		{`result = "" in "hello world"`, true},
+		{`result = "d" in "hello world"`, true},
+		{`result = "hello world!" in "hello world"`, false},
+		{`result = "é日" in "café日本"`, true},
+		{`result = "needle-longer-than-thirty-two-bytes" in "a haystack holding a needle-longer-than-thirty-two-bytes"`, true},
 
 		// not in operator
 		{`result = 6 not in [1, 2, 3, 4, 5]`, true},
@@ -221,3 +226,70 @@ result = "key" in data or data["nonexistent"]["nested"]
 		})
 	}
 }
+
+// Membership against a literal of integer and string constants is answered
+// without building the container; every other shape must behave as before.
+func TestInOperatorConstLiteral(t *testing.T) {
+	tests := []struct {
+		input    string
+		expected bool
+	}{
+		{"s = 201\nresult = s in [200, 201, 204]", true},
+		{"s = 404\nresult = s in (200, 201, 204)", false},
+		{"s = 204\nresult = s not in {200, 201, 204}", false},
+		{"s = \"b\"\nresult = s in [\"a\", \"b\"]", true},
+		{"s = \"200\"\nresult = s in [200, 201]", false},
+		{"s = 200\nresult = s in [\"200\", 1]", false},
+		{"result = 1 in []", false},
+		// Types the fast path does not handle keep the usual semantics.
+		{"result = 1.0 in {1, 2}", true},
+		{"result = [1] in [1, 2]", false},
+		{"result = None not in [1, 2]", true},
+	}
+
+	for _, tt := range tests {
+		_, env := testEvalWithEnv(tt.input)
+		result, ok := env.Get("result")
+		if !ok {
+			t.Errorf("%q: variable result not found in environment", tt.input)
+			continue
+		}
+		testBooleanObject(t, result, tt.expected)
+	}
+}
+
+// Whatever the general path answers for a value the fast path declines, a
+// literal container must give the same answer as the same container held in
+// a variable.
+func TestInOperatorConstLiteralMatchesVariable(t *testing.T) {
+	tests := []struct {
+		needle    string
+		container string
+	}{
+		{"1.0", "[1, 2]"},
+		{"2.0", "(1, 2)"},
+		{"True", "[1, 2]"},
+		{"[1]", "[1, 2]"},
+		{"None", "[1, 2]"},
+	}
+
+	for _, tt := range tests {
+		literal := "result = " + tt.needle + " in " + tt.container
+		variable := "xs = " + tt.container + "\nresult = " + tt.needle + " in xs"
+		_, litEnv := testEvalWithEnv(literal)
+		_, varEnv := testEvalWithEnv(variable)
+		litResult, ok := litEnv.Get("result")
+		if !ok {
+			t.Errorf("%q: variable result not found in environment", literal)
+			continue
+		}
+		varResult, ok := varEnv.Get("result")
+		if !ok {
+			t.Errorf("%q: variable result not found in environment", variable)
+			continue
+		}
+		if litResult.Inspect() != varResult.Inspect() {
+			t.Errorf("%q = %s, but %q = %s", literal, litResult.Inspect(), variable, varResult.Inspect())
+		}
+	}
+}
@@ -110,9 +110,14 @@ func applyIntFastOp(op ast.Op, l, r int64) (int64, bool) {
 // comparisons). Returns ok=false when a variable turns out to hold something
 // other than an integer, in which case the caller uses the general path.
 //
+// NumFastArith nodes are handed on to tryEvalNumInfix (numfast.go).
+//
 // Callers must check node.IntFast != ast.IntFastNone first so that ineligible
 // nodes never reach this function.
 func tryEvalIntInfix(node *ast.InfixExpression, env *object.Environment) (object.Object, bool) {
+	if node.IntFast == ast.NumFastArith {
+		return tryEvalNumInfix(node, env)
+	}
 	if node.IntFast == ast.IntFastArith {
 		if v, ok := evalIntOperand(node, env); ok {
 			return object.NewInteger(v), true
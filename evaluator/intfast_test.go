@@ -200,14 +200,18 @@ func TestIntFastKindSetByParser(t *testing.T) {
 		{"a < b", ast.IntFastCompare},
 		{"a == 0", ast.IntFastCompare},
 		{"a % 3 == 0", ast.IntFastCompare},
-		{"a / b", ast.IntFastNone},     // always float
-		{"a ** b", ast.IntFastNone},    // may promote to float
-		{"a + f(b)", ast.IntFastNone},  // call
-		{"a + b.c", ast.IntFastNone},   // attribute access
-		{"a + b[0]", ast.IntFastNone},  // index
-		{"a + 1.5", ast.IntFastNone},   // float literal
-		{"a < f(b)", ast.IntFastNone},  // comparison against a call
-		{"a / b + 1", ast.IntFastNone}, // float-producing subtree
+		{"a / b", ast.NumFastArith},               // always float
+		{"a ** b", ast.IntFastNone},               // may promote to float
+		{"a + f(b)", ast.IntFastNone},             // call
+		{"a + b.c", ast.NumFastArith},             // attribute read
+		{"(a.b.x - a.c.x) * 2", ast.NumFastArith}, // attribute chain
+		{"a + b[0]", ast.IntFastNone},             // index
+		{"a + f(b).c", ast.IntFastNone},           // attribute of a call
+		{"a + 1.5", ast.NumFastArith},             // float literal
+		{"a % 1.5", ast.IntFastNone},              // not a NumFastArith operator
+		{"a.b < a.c", ast.IntFastNone},            // attribute comparison
+		{"a < f(b)", ast.IntFastNone},             // comparison against a call
+		{"a / b + 1", ast.NumFastArith},           // float-producing subtree
 	}
 	for _, c := range cases {
 		src := "result = " + c.expr + "\n"
@@ -230,3 +234,59 @@ func TestIntFastKindSetByParser(t *testing.T) {
 		}
 	}
 }
+
+func TestNumFastAttributeArithmeticMatchesGeneralPath(t *testing.T) {
+	input := `
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+class Rectangle:
+    def __init__(self, top_left, bottom_right):
+        self.top_left = top_left
+        self.bottom_right = bottom_right
+    def area(self):
+        return (self.bottom_right.x - self.top_left.x) * (self.bottom_right.y - self.top_left.y)
+    def center(self):
+        return ((self.top_left.x + self.bottom_right.x) / 2, (self.top_left.y + self.bottom_right.y) / 2)
+
+class Scaled:
+    def __init__(self, v):
+        self.v = v
+    @property
+    def double(self):
+        return self.v * 2
+
+r = Rectangle(Point(0, 0), Point(4, 3))
+f = Rectangle(Point(0.5, 1), Point(2, 3.5))
+s = Scaled(1.5)
+flag = Point(True, 2)
+[r.area(), r.center(), f.area(), f.center(), s.double + 0.25, flag.x + 1.5, 7 / 2, 2 * 3.0]
+`
+	evaluated := testEval(input)
+	list, ok := evaluated.(*object.List)
+	if !ok {
+		t.Fatalf("object is not List. got=%T (%+v)", evaluated, evaluated)
+	}
+	want := "[12, (2, 1.5), 3.75, (1.25, 2.25), 3.25, 2.5, 3.5, 6]"
+	if got := list.Inspect(); got != want {
+		t.Errorf("got %s, want %s", got, want)
+	}
+	if _, ok := list.Elements[0].(*object.Integer); !ok {
+		t.Errorf("integer area should stay an Integer, got %T", list.Elements[0])
+	}
+	if _, ok := list.Elements[7].(*object.Float); !ok {
+		t.Errorf("2 * 3.0 should be a Float, got %T", list.Elements[7])
+	}
+
+	for _, src := range []string{
+		"p = Point(1.0, 0.0)\np.x / p.y",
+		"p = Point(1, 2)\np.x + p.z",
+		"p = Point(1, 2)\np.x + missing",
+	} {
+		if got := testEval(input + "\n" + src); !object.IsError(got) && got.Type() != object.EXCEPTION_OBJ {
+			t.Errorf("%q: expected error, got %s", src, got.Inspect())
+		}
+	}
+}
@@ -114,6 +114,41 @@ result = p.x + p.y
 	}
 }
 
+func TestStringLiteralDictKeyLookup(t *testing.T) {
+	// Dict reads with a literal key take a direct lookup. Keys containing a
+	// colon are stored with a prefix, and a literal key must still find a
+	// value stored under a computed one (and the other way round).
+	src := `
+d = {"status": 200, "a:b": "colon", 1: "int"}
+k = "na" + "me"
+d[k] = "bob"
+missing = d["nope"]
+result = str(d["status"]) + "|" + d["a:b"] + "|" + d["name"] + "|" + d[1] + "|" + str(missing)
+`
+	if got := litResult(t, src); got != "200|colon|bob|int|None" {
+		t.Errorf("got %q want %q", got, "200|colon|bob|int|None")
+	}
+}
+
+func TestConstDictLiteralEvaluationsAreIndependent(t *testing.T) {
+	// A dict literal of constants is built from a cached template; every
+	// evaluation must still produce a separate dict.
+	src := `
+def options():
+    return {"timeout": 5, "verify": True, 1: None, "a:b": 2.5}
+
+a = options()
+a["timeout"] = 10
+del a["verify"]
+b = options()
+result = [a["timeout"], "verify" in a, b["timeout"], b["verify"], b[1], b["a:b"], len(b), a is b]
+`
+	want := "[10, false, 5, true, None, 2.5, 4, false]"
+	if got := litResult(t, src); got != want {
+		t.Errorf("got %q want %q", got, want)
+	}
+}
+
 func TestStringLiteralBoxedIsStableAndShared(t *testing.T) {
 	// The same AST node must hand back one pointer, and it must carry the right
 	// value. Two distinct literals must not collide.
@@ -187,3 +222,19 @@ func TestStringLiteralConcurrentEvaluationIsSafe(t *testing.T) {
 		}
 	}
 }
+
+func TestStringMethodNoOpReturnsSameString(t *testing.T) {
+	// Methods that leave the text unchanged hand back the receiver; ones that
+	// change it must still produce a new value and leave the original alone.
+	src := `
+s = "hello world"
+same = [s.lower() is s, s.replace("xyz", "abc") is s, s.strip() is s, s.rstrip("!") is s]
+t = "Hello World"
+chained = t.lower().replace("world", "scriptling")
+result = str(same) + "|" + chained + "|" + t + "|" + t.upper() + "|" + "  pad ".strip()
+`
+	want := "[true, true, true, true]|hello scriptling|Hello World|HELLO WORLD|pad"
+	if got := litResult(t, src); got != want {
+		t.Errorf("got %q want %q", got, want)
+	}
+}
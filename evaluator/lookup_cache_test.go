@@ -31,3 +31,48 @@ second = counter.value()
 	testIntegerObject(t, list.Elements[0], 1)
 	testIntegerObject(t, list.Elements[1], 2)
 }
+
+func TestFieldSlotCacheFollowsFieldLayout(t *testing.T) {
+	// One attribute site sees instances whose fields sit in different
+	// slots, a field that moves after a delete, and a method reached via
+	// dot access; each must still resolve by name.
+	input := `
+class P:
+    def __init__(self, first, x):
+        if first:
+            self.x = x
+            self.y = 0
+        else:
+            self.y = 0
+            self.x = x
+    def double(self):
+        return self.x * 2
+
+def get_x(p):
+    return p.x
+
+a = P(True, 1)
+b = P(False, 2)
+c = P(True, 3)
+c.z = 9
+del c.x
+c.x = 4
+total = 0
+for p in [a, b, a, b, c]:
+    total = total * 10 + get_x(p)
+m = b.double
+[total, m(), get_x(a)]
+`
+
+	evaluated := testEval(input)
+	list, ok := evaluated.(*object.List)
+	if !ok {
+		t.Fatalf("result is not a list. got=%T (%+v)", evaluated, evaluated)
+	}
+	if len(list.Elements) != 3 {
+		t.Fatalf("expected 3 results, got %d", len(list.Elements))
+	}
+	testIntegerObject(t, list.Elements[0], 12124)
+	testIntegerObject(t, list.Elements[1], 4)
+	testIntegerObject(t, list.Elements[2], 1)
+}
@@ -5,9 +5,11 @@ import (
 	"encoding/base64"
 	"encoding/hex"
 	"fmt"
+	"maps"
 	"sort"
 	"strings"
 	"unicode"
+	"unicode/utf8"
 
 	"github.com/paularlott/scriptling/ast"
 	"github.com/paularlott/scriptling/errors"
@@ -25,7 +27,7 @@ func evalMethodCallExpression(ctx context.Context, mce *ast.MethodCallExpression
 	// Fast path for the hottest production payload access pattern:
 	// dict.get(key) and dict.get(key, default) without kwargs or unpacking.
 	if dict, ok := obj.(*object.Dict); ok && mce.Method.Value() == "get" &&
-		!dictCallableMethodExists(dict, "get") &&
+		(len(dict.Pairs) == 0 || !dictCallableMethodExists(dict, "get")) &&
 		!mce.HasOverflow() &&
 		(len(mce.Arguments) == 1 || len(mce.Arguments) == 2) {
 		return evalFastDictGet(ctx, dict, mce.Arguments, env)
@@ -42,9 +44,9 @@ func evalMethodCallExpression(ctx context.Context, mce *ast.MethodCallExpression
 		if str, ok := obj.(*object.String); ok {
 			switch mce.Method.Value() {
 			case "upper":
-				return object.NewString(fastStringUpper(str.StringValue()))
+				return sameOrNewString(str, fastStringUpper(str.StringValue()))
 			case "lower":
-				return object.NewString(fastStringLower(str.StringValue()))
+				return sameOrNewString(str, fastStringLower(str.StringValue()))
 			}
 		}
 	}
@@ -118,9 +120,15 @@ func evalMethodCallExpression(ctx context.Context, mce *ast.MethodCallExpression
 }
 
 func evalFastDictGet(ctx context.Context, dict *object.Dict, arguments []ast.Expression, env *object.Environment) object.Object {
-	keyObj := evalNode(ctx, arguments[0], env)
-	if object.IsError(keyObj) {
-		return keyObj
+	// A literal key (kwargs.get("greeting", "Hello")) is looked up by its
+	// source text without evaluating or boxing it.
+	lit, isLit := arguments[0].(*ast.StringLiteral)
+	var keyObj object.Object
+	if !isLit {
+		keyObj = evalNode(ctx, arguments[0], env)
+		if object.IsError(keyObj) {
+			return keyObj
+		}
 	}
 
 	var defaultObj object.Object = NULL
@@ -131,6 +139,18 @@ func evalFastDictGet(ctx context.Context, dict *object.Dict, arguments []ast.Exp
 		}
 	}
 
+	// An empty dict, typically **kwargs with nothing passed, cannot hold the key.
+	if len(dict.Pairs) == 0 {
+		return defaultObj
+	}
+
+	if isLit {
+		if pair, exists := dict.Pairs[object.DictStringKey(lit.Value)]; exists {
+			return pair.Value
+		}
+		return defaultObj
+	}
+
 	if keyStr, ok := keyObj.(*object.String); ok {
 		if pair, exists := dict.Pairs[object.DictStringKey(keyStr.StringValue())]; exists {
 			return pair.Value
@@ -186,6 +206,16 @@ func evalFastDictCallableMethod(ctx context.Context, dict *object.Dict, method s
 	}
 }
 
+// sameOrNewString returns str itself when a method left its text unchanged,
+// as lower() on lowercase text, replace() with no match and strip() with
+// nothing to trim do, so chained calls do not allocate a copy per no-op step.
+func sameOrNewString(str *object.String, s string) *object.String {
+	if s == str.StringValue() {
+		return str
+	}
+	return object.NewString(s)
+}
+
 func fastStringUpper(s string) string {
 	// First pass: check for any non-ASCII byte. If present, defer to the
 	// Unicode-aware implementation so characters like "é" are uppercased
@@ -246,6 +276,30 @@ func fastStringLower(s string) string {
 	return s
 }
 
+// splitWhitespaceN implements str.split(None, maxsplit): fields are separated
+// by runs of whitespace and, once maxsplit splits are made, the remainder is
+// returned as-is apart from its leading whitespace. A negative maxsplit means
+// no limit.
+func splitWhitespaceN(s string, maxsplit int64) []string {
+	if maxsplit < 0 {
+		return strings.Fields(s)
+	}
+	var parts []string
+	s = strings.TrimLeftFunc(s, unicode.IsSpace)
+	for int64(len(parts)) < maxsplit && s != "" {
+		end := strings.IndexFunc(s, unicode.IsSpace)
+		if end < 0 {
+			break
+		}
+		parts = append(parts, s[:end])
+		s = strings.TrimLeftFunc(s[end:], unicode.IsSpace)
+	}
+	if s != "" {
+		parts = append(parts, s)
+	}
+	return parts
+}
+
 func callStringMethodWithKeywords(ctx context.Context, obj object.Object, method string, args []object.Object, keywords map[string]object.Object, env *object.Environment) object.Object {
 	// Handle universal methods
 	switch method {
@@ -567,6 +621,15 @@ func callDictMethod(ctx context.Context, dict *object.Dict, method string, args
 		if len(args) == 1 {
 			switch other := args[0].(type) {
 			case *object.Dict:
+				// Filling an empty dict clones the other map in one go
+				// instead of growing this one entry by entry
+				if len(dict.Pairs) == 0 && other != dict {
+					dict.Pairs = maps.Clone(other.Pairs)
+					if dict.Pairs == nil {
+						dict.Pairs = make(map[string]object.DictPair)
+					}
+					break
+				}
 				for k, v := range other.Pairs {
 					dict.Pairs[k] = v
 				}
@@ -607,11 +670,7 @@ func callDictMethod(ctx context.Context, dict *object.Dict, method string, args
 		if len(keywords) > 0 {
 			return errors.NewError("copy() does not accept keyword arguments")
 		}
-		newPairs := make(map[string]object.DictPair, len(dict.Pairs))
-		for k, v := range dict.Pairs {
-			newPairs[k] = v
-		}
-		return &object.Dict{Pairs: newPairs}
+		return dict.Copy()
 	case "setdefault":
 		if len(args) < 1 || len(args) > 2 {
 			return errors.NewError("setdefault() takes 1-2 arguments (%d given)", len(args))
@@ -641,23 +700,27 @@ func callDictMethod(ctx context.Context, dict *object.Dict, method string, args
 		if len(args) == 2 {
 			defaultVal = args[1]
 		}
-		newPairs := make(map[string]object.DictPair)
+		// The key count is known up front, so the map is sized once
+		var newPairs map[string]object.DictPair
 		switch iter := args[0].(type) {
 		case *object.List:
+			newPairs = make(map[string]object.DictPair, len(iter.Elements))
 			for _, elem := range iter.Elements {
 				key := evalHashKey(ctx, elem)
 				newPairs[key] = object.DictPair{Key: elem, Value: defaultVal}
 			}
 		case *object.Tuple:
+			newPairs = make(map[string]object.DictPair, len(iter.Elements))
 			for _, elem := range iter.Elements {
 				key := evalHashKey(ctx, elem)
 				newPairs[key] = object.DictPair{Key: elem, Value: defaultVal}
 			}
 		case *object.String:
-			for _, ch := range iter.StringValue() {
+			str := iter.StringValue()
+			newPairs = make(map[string]object.DictPair, utf8.RuneCountInString(str))
+			for _, ch := range str {
 				s := string(ch)
-				key := object.DictKey(object.NewString(s))
-				newPairs[key] = object.DictPair{Key: object.NewString(s), Value: defaultVal}
+				newPairs[object.DictStringKey(s)] = object.DictPair{Key: object.NewString(s), Value: defaultVal}
 			}
 		default:
 			return errors.NewTypeError("iterable (LIST, TUPLE, STRING)", args[0].Type().String())
@@ -940,12 +1003,12 @@ func callStringMethod(ctx context.Context, str *object.String, method string, ar
 		if err := errors.ExactArgs(args, 0); err != nil {
 			return err
 		}
-		return object.NewString(fastStringUpper(str.StringValue()))
+		return sameOrNewString(str, fastStringUpper(str.StringValue()))
 	case "lower":
 		if err := errors.ExactArgs(args, 0); err != nil {
 			return err
 		}
-		return object.NewString(fastStringLower(str.StringValue()))
+		return sameOrNewString(str, fastStringLower(str.StringValue()))
 	case "split":
 		if err := errors.MaxArgs(args, 2); err != nil {
 			return err
@@ -959,14 +1022,22 @@ func callStringMethod(ctx context.Context, str *object.String, method string, ar
 			}
 			return &object.List{Elements: elements}
 		}
-		// With separator argument
-		sep, errObj := args[0].AsString()
-		if errObj != nil {
-			return errors.ParameterError("sep", errObj)
-		}
 
 		var parts []string
-		if len(args) == 1 {
+		if args[0].Type() == object.NULL_OBJ {
+			// sep=None splits on runs of whitespace, like no argument
+			maxsplit := int64(-1)
+			if len(args) == 2 {
+				var err object.Object
+				maxsplit, err = args[1].AsInt()
+				if err != nil {
+					return errors.ParameterError("maxsplit", err)
+				}
+			}
+			parts = splitWhitespaceN(str.StringValue(), maxsplit)
+		} else if sep, errObj := args[0].AsString(); errObj != nil {
+			return errors.ParameterError("sep", errObj)
+		} else if len(args) == 1 {
 			parts = strings.Split(str.StringValue(), sep)
 		} else {
 			maxsplitObj := args[1]
@@ -998,7 +1069,7 @@ func callStringMethod(ctx context.Context, str *object.String, method string, ar
 		if err != nil {
 			return err
 		}
-		return object.NewString(strings.ReplaceAll(str.StringValue(), old, newVal))
+		return sameOrNewString(str, strings.ReplaceAll(str.StringValue(), old, newVal))
 	case "join":
 		if err := errors.ExactArgs(args, 1); err != nil {
 			return err
@@ -1048,9 +1119,9 @@ func callStringMethod(ctx context.Context, str *object.String, method string, ar
 			if errObj != nil {
 				return errors.ParameterError("chars", errObj)
 			}
-			return object.NewString(strings.Trim(str.StringValue(), chars))
+			return sameOrNewString(str, strings.Trim(str.StringValue(), chars))
 		}
-		return object.NewString(strings.TrimSpace(str.StringValue()))
+		return sameOrNewString(str, strings.TrimSpace(str.StringValue()))
 	case "lstrip":
 		if len(args) > 1 {
 			return errors.NewError("lstrip() takes at most 1 argument (%d given)", len(args))
@@ -1060,9 +1131,9 @@ func callStringMethod(ctx context.Context, str *object.String, method string, ar
 			if errObj != nil {
 				return errors.ParameterError("chars", errObj)
 			}
-			return object.NewString(strings.TrimLeft(str.StringValue(), chars))
+			return sameOrNewString(str, strings.TrimLeft(str.StringValue(), chars))
 		}
-		return object.NewString(strings.TrimLeft(str.StringValue(), " \t\n\r\v\f"))
+		return sameOrNewString(str, strings.TrimLeft(str.StringValue(), " \t\n\r\v\f"))
 	case "rstrip":
 		if len(args) > 1 {
 			return errors.NewError("rstrip() takes at most 1 argument (%d given)", len(args))
@@ -1072,9 +1143,9 @@ func callStringMethod(ctx context.Context, str *object.String, method string, ar
 			if errObj != nil {
 				return errors.ParameterError("chars", errObj)
 			}
-			return object.NewString(strings.TrimRight(str.StringValue(), chars))
+			return sameOrNewString(str, strings.TrimRight(str.StringValue(), chars))
 		}
-		return object.NewString(strings.TrimRight(str.StringValue(), " \t\n\r\v\f"))
+		return sameOrNewString(str, strings.TrimRight(str.StringValue(), " \t\n\r\v\f"))
 	case "startswith":
 		if err := errors.ExactArgs(args, 1); err != nil {
 			return err
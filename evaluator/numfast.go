@@ -0,0 +1,148 @@
+package evaluator
+
+import (
+	"github.com/paularlott/scriptling/ast"
+	"github.com/paularlott/scriptling/object"
+)
+
+// Unboxed mixed int/float arithmetic.
+//
+// Geometry-style methods such as
+//
+//	(self.bottom_right.x - self.top_left.x) * (self.bottom_right.y - self.top_left.y)
+//
+// never reach the integer fast path: their operands are attribute reads and
+// their values are often floats, so every operator boxes a *object.Float that
+// is immediately thrown away.
+//
+// evalNumOperand extends the intfast walk to float literals, float-valued
+// identifiers and plain instance-field reads, carrying each intermediate as a
+// numValue. Only the caller's final result is boxed.
+//
+// SAFETY: an attribute read is only taken when the object is an Instance and
+// the name is one of its own fields holding something other than a Property,
+// which is exactly what the IndexExpression fast path in evalNode returns
+// without running script code. Every other case (properties, methods, class
+// attributes, dicts, modules, booleans, float // or %) returns ok=false and
+// the general path redoes the work, so the result is always identical.
+
+// numValue is an unboxed integer or float.
+type numValue struct {
+	i       int64
+	f       float64
+	isFloat bool
+}
+
+func (n numValue) float() float64 {
+	if n.isFloat {
+		return n.f
+	}
+	return float64(n.i)
+}
+
+// evalNumOperand evaluates node to an unboxed number, reporting ok=false if the
+// subtree is not a side-effect-free numeric expression.
+func evalNumOperand(node ast.Expression, env *object.Environment) (numValue, bool) {
+	switch n := node.(type) {
+	case *ast.IntegerLiteral:
+		return numValue{i: n.Value}, true
+	case *ast.FloatLiteral:
+		return numValue{f: n.Value, isFloat: true}, true
+	case *ast.Identifier, *ast.IndexExpression:
+		switch v := readAttrChain(n, env).(type) {
+		case *object.Integer:
+			return numValue{i: v.IntValue()}, true
+		case *object.Float:
+			return numValue{f: v.FloatValue(), isFloat: true}, true
+		}
+	case *ast.InfixExpression:
+		if n.IntFast != ast.IntFastArith && n.IntFast != ast.NumFastArith {
+			return numValue{}, false
+		}
+		l, ok := evalNumOperand(n.Left, env)
+		if !ok {
+			return numValue{}, false
+		}
+		r, ok := evalNumOperand(n.Right, env)
+		if !ok {
+			return numValue{}, false
+		}
+		return applyNumFastOp(n.Operator, l, r)
+	}
+	return numValue{}, false
+}
+
+// readAttrChain resolves an identifier or a chain of instance-field reads
+// (self.top_left.x), returning nil when any step would need the general path.
+func readAttrChain(node ast.Expression, env *object.Environment) object.Object {
+	switch n := node.(type) {
+	case *ast.Identifier:
+		return evalIdentifier(n, env)
+	case *ast.IndexExpression:
+		lit, ok := n.Index.(*ast.StringLiteral)
+		if !ok || !n.IsDotAccess {
+			return nil
+		}
+		inst, ok := readAttrChain(n.Left, env).(*object.Instance)
+		if !ok {
+			return nil
+		}
+		hint := int(n.FieldSlot.Load()) - 1
+		val, slot, ok := inst.GetFieldHint(lit.Value, hint)
+		if !ok {
+			return nil
+		}
+		if slot != hint {
+			n.FieldSlot.Store(int32(slot + 1))
+		}
+		if _, isProp := val.(*object.Property); isProp {
+			return nil
+		}
+		return val
+	}
+	return nil
+}
+
+// applyNumFastOp mirrors evalIntegerInfixExpression for two integers and
+// evalFloatInfixValues otherwise. Float operands are limited to the
+// NumFastArith operators; division by zero returns ok=false so the normal path
+// raises the error.
+func applyNumFastOp(op ast.Op, l, r numValue) (numValue, bool) {
+	if !l.isFloat && !r.isFloat {
+		if op == ast.OpDiv {
+			if r.i == 0 {
+				return numValue{}, false
+			}
+			return numValue{f: float64(l.i) / float64(r.i), isFloat: true}, true
+		}
+		v, ok := applyIntFastOp(op, l.i, r.i)
+		return numValue{i: v}, ok
+	}
+	lf, rf := l.float(), r.float()
+	switch op {
+	case ast.OpAdd:
+		return numValue{f: lf + rf, isFloat: true}, true
+	case ast.OpSub:
+		return numValue{f: lf - rf, isFloat: true}, true
+	case ast.OpMul:
+		return numValue{f: lf * rf, isFloat: true}, true
+	case ast.OpDiv:
+		if rf == 0 {
+			return numValue{}, false
+		}
+		return numValue{f: lf / rf, isFloat: true}, true
+	}
+	return numValue{}, false
+}
+
+// tryEvalNumInfix handles a NumFastArith node, boxing only its result.
+func tryEvalNumInfix(node *ast.InfixExpression, env *object.Environment) (object.Object, bool) {
+	v, ok := evalNumOperand(node, env)
+	if !ok {
+		return nil, false
+	}
+	if v.isFloat {
+		return object.NewFloat(v.f), true
+	}
+	return object.NewInteger(v.i), true
+}
@@ -0,0 +1,91 @@
+package evaluator
+
+import (
+	"testing"
+
+	"github.com/paularlott/scriptling/object"
+)
+
+func TestOuterCacheGlobalReadModifyWrite(t *testing.T) {
+	input := `
+total = 0
+
+def add(n):
+    global total
+    total += n
+    total = total + 0
+
+for i in range(10):
+    add(i)
+
+total
+`
+
+	testIntegerObject(t, testEval(input), 45)
+}
+
+func TestOuterCacheGlobalReadReflectsRebinding(t *testing.T) {
+	input := `
+limit = 1
+
+def get():
+    return limit
+
+a = get()
+limit = 2
+b = get()
+a * 10 + b
+`
+
+	testIntegerObject(t, testEval(input), 12)
+}
+
+func TestOuterCacheNonlocalPerClosure(t *testing.T) {
+	input := `
+def make_counter():
+    count = 0
+    def increment():
+        nonlocal count
+        count += 1
+        return count
+    return increment
+
+c1 = make_counter()
+c2 = make_counter()
+c1()
+c1()
+c1()
+c2()
+[c1(), c2()]
+`
+
+	evaluated := testEval(input)
+	list, ok := evaluated.(*object.List)
+	if !ok {
+		t.Fatalf("result is not a list. got=%T (%+v)", evaluated, evaluated)
+	}
+	if len(list.Elements) != 2 {
+		t.Fatalf("expected 2 results, got %d", len(list.Elements))
+	}
+	testIntegerObject(t, list.Elements[0], 4)
+	testIntegerObject(t, list.Elements[1], 2)
+}
+
+// A cached location must never hide a binding that appears later in a nearer
+// scope.
+func TestOuterCacheNearerBindingWins(t *testing.T) {
+	input := `
+x = 1
+
+def outer():
+    def inner():
+        return x
+    first = inner()
+    x = 5
+    return first * 10 + inner()
+
+outer()
+`
+
+	testIntegerObject(t, testEval(input), 15)
+}
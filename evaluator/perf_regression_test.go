@@ -141,3 +141,304 @@ results
 		testIntegerObject(t, elem, 14)
 	}
 }
+
+func TestLambdaReturningLambdaKeepsCapturedEnv(t *testing.T) {
+	input := `
+multiply = lambda x: lambda y: x * y
+double = multiply(2)
+triple = multiply(3)
+[double(7), triple(7), multiply(4)(5), (lambda a, b, c: a + b * c)(1, 2, 3)]
+`
+
+	evaluated := testEval(input)
+	list, ok := evaluated.(*object.List)
+	if !ok {
+		t.Fatalf("object is not List. got=%T (%+v)", evaluated, evaluated)
+	}
+	if len(list.Elements) != 4 {
+		t.Fatalf("list has wrong length. got=%d, want=4", len(list.Elements))
+	}
+	testIntegerObject(t, list.Elements[0], 14)
+	testIntegerObject(t, list.Elements[1], 21)
+	testIntegerObject(t, list.Elements[2], 20)
+	testIntegerObject(t, list.Elements[3], 7)
+}
+
+func TestMultipleAssignFromTupleLiteral(t *testing.T) {
+	input := `
+params = {"q": "go"}
+out = []
+for item in items(params):
+    key, value = item[0], item[1]
+    out.append(key + "=" + value)
+a, b = 1, 2
+a, b = b, a
+x, y, z = a * 10, b * 10, a + b
+[out[0], a, b, x, y, z]
+`
+
+	evaluated := testEval(input)
+	list, ok := evaluated.(*object.List)
+	if !ok {
+		t.Fatalf("object is not List. got=%T (%+v)", evaluated, evaluated)
+	}
+	if got := list.Inspect(); got != "[q=go, 2, 1, 20, 10, 3]" {
+		t.Errorf("got %s, want [q=go, 2, 1, 20, 10, 3]", got)
+	}
+
+	if evaluated := testEval("a, b = 1, undefined_name"); !object.IsError(evaluated) {
+		t.Errorf("expected error for undefined right-hand value, got %T", evaluated)
+	}
+}
+
+func TestForLoopReservesAppendTarget(t *testing.T) {
+	input := `
+squares = []
+for i in range(5):
+    squares.append(i * i)
+names = []
+for u in [1, 2, 999]:
+    append(names, "user" + str(u))
+evens = []
+for i in range(10):
+    if i % 2 == 0:
+        evens.append(i)
+`
+	result, env := testEvalWithEnv(input)
+	if object.IsError(result) {
+		t.Fatalf("unexpected error: %s", result.Inspect())
+	}
+
+	tests := []struct {
+		name    string
+		inspect string
+		cap     int
+	}{
+		{"squares", "[0, 1, 4, 9, 16]", 5},
+		{"names", "[user1, user2, user999]", 3},
+		{"evens", "[0, 2, 4, 6, 8]", -1},
+	}
+	for _, tt := range tests {
+		val, ok := env.Get(tt.name)
+		if !ok {
+			t.Fatalf("%s not set", tt.name)
+		}
+		list := val.(*object.List)
+		if got := list.Inspect(); got != tt.inspect {
+			t.Errorf("%s = %s, want %s", tt.name, got, tt.inspect)
+		}
+		if tt.cap >= 0 && cap(list.Elements) != tt.cap {
+			t.Errorf("cap(%s) = %d, want %d", tt.name, cap(list.Elements), tt.cap)
+		}
+	}
+}
+
+func TestGlobalDeclarationDoesNotLeakAcrossReusedFrames(t *testing.T) {
+	// f and g have the same frame shape, so g can run in the frame f released.
+	// f's global declaration must not make g's assignment global.
+	input := `
+x = 1
+def f():
+    global x
+    x = x + 1
+def g():
+    x = 100
+    return x
+f()
+f()
+r = g()
+[x, r]
+`
+	evaluated := testEval(input)
+	list, ok := evaluated.(*object.List)
+	if !ok {
+		t.Fatalf("object is not List. got=%T (%+v)", evaluated, evaluated)
+	}
+	if got := list.Inspect(); got != "[3, 100]" {
+		t.Errorf("got %s, want [3, 100]", got)
+	}
+}
+
+func TestKwargsDictCollectsOnlyExtraKeywords(t *testing.T) {
+	input := `
+def f(a, b=2, **kwargs):
+    return [a, b, len(kwargs), kwargs.get("x", 0), kwargs["y"], "b" in kwargs]
+def g(**opts):
+    return len(opts)
+f(1, x=10, y=20, b=5) + [g(), g(p=1)]
+`
+	evaluated := testEval(input)
+	list, ok := evaluated.(*object.List)
+	if !ok {
+		t.Fatalf("object is not List. got=%T (%+v)", evaluated, evaluated)
+	}
+	if got, want := list.Inspect(), "[1, 5, 2, 10, 20, false, 0, 1]"; got != want {
+		t.Errorf("got %s, want %s", got, want)
+	}
+}
+
+func TestUnpackingComprehensionPresizesResult(t *testing.T) {
+	input := `
+pairs = [(1, True), (2, False), (3, True), (4, False), (5, True)]
+[a if ok else -a for a, ok in pairs]
+`
+	evaluated := testEval(input)
+	list, ok := evaluated.(*object.List)
+	if !ok {
+		t.Fatalf("object is not List. got=%T (%+v)", evaluated, evaluated)
+	}
+	if got, want := list.Inspect(), "[1, -2, 3, -4, 5]"; got != want {
+		t.Errorf("got %s, want %s", got, want)
+	}
+	if cap(list.Elements) != 5 {
+		t.Errorf("cap = %d, want 5", cap(list.Elements))
+	}
+
+	empty := testEval(`[a for a, b in []]`)
+	if l, ok := empty.(*object.List); !ok || l.Elements == nil {
+		t.Errorf("empty comprehension should be a non-nil empty list, got %#v", empty)
+	}
+}
+
+func TestThresholdLadderPicksSameBranchAsChain(t *testing.T) {
+	input := `
+def grade(score):
+    if score >= 90:
+        return "A"
+    elif score >= 80:
+        return "B"
+    elif score > 69:
+        return "C"
+    else:
+        return "F"
+
+def band(n):
+    if n >= 100:
+        return 10
+    elif n >= 90:
+        return 9
+    elif n >= 80:
+        return 8
+    elif n >= 70:
+        return 7
+    elif n >= 60:
+        return 6
+    elif n >= 50:
+        return 5
+    elif n >= 40:
+        return 4
+    elif n >= 30:
+        return 3
+    elif n >= 20:
+        return 2
+    elif n >= 10:
+        return 1
+
+def unordered(n):
+    if n >= 10:
+        return "big"
+    elif n >= 20:
+        return "never"
+    return "small"
+
+[grade(95), grade(90), grade(89), grade(70), grade(69), grade(-5), grade(85.5),
+ band(100), band(55), band(10), band(9), band(-1000), band(42.0),
+ unordered(25), unordered(5)]
+`
+	evaluated := testEval(input)
+	list, ok := evaluated.(*object.List)
+	if !ok {
+		t.Fatalf("object is not List. got=%T (%+v)", evaluated, evaluated)
+	}
+	want := "[A, A, B, C, F, F, B, 10, 5, 1, None, None, 4, big, small]"
+	if got := list.Inspect(); got != want {
+		t.Errorf("got %s, want %s", got, want)
+	}
+}
+
+func TestTrivialInitFillsFieldsDirectly(t *testing.T) {
+	input := `
+class Point:
+    def __init__(self, x, y):
+        """A point."""
+        self.x = x
+        self.y = y
+
+class Point3(Point):
+    pass
+
+class Celsius:
+    def __init__(self, degrees):
+        self.degrees = degrees
+    @property
+    def degrees(self):
+        return self._d
+    @degrees.setter
+    def degrees(self, value):
+        self._d = value * 10
+
+class Swapped:
+    def __init__(self, a, b):
+        self.first = b
+        self.second = a
+
+p = Point(1, 2)
+q = Point(y=4, x=3)
+r = Point3(5, 6)
+c = Celsius(7)
+s = Swapped("a", "b")
+[p.x, p.y, q.x, q.y, r.x, r.y, c.degrees, s.first, s.second]
+`
+	result, env := testEvalWithEnv(input)
+	list, ok := result.(*object.List)
+	if !ok {
+		t.Fatalf("object is not List. got=%T (%+v)", result, result)
+	}
+	if got, want := list.Inspect(), "[1, 2, 3, 4, 5, 6, 70, b, a]"; got != want {
+		t.Errorf("got %s, want %s", got, want)
+	}
+
+	point, _ := env.Get("Point")
+	init := point.(*object.Class).Methods["__init__"].(*object.Function)
+	if len(init.FieldInits) != 2 {
+		t.Errorf("Point.__init__ FieldInits = %v, want two entries", init.FieldInits)
+	}
+
+	if evaluated := testEval(input + "\nPoint(1)"); !object.IsError(evaluated) {
+		t.Errorf("expected error for missing argument, got %T", evaluated)
+	}
+
+	notTrivial := testEval(`
+class Scaled:
+    def __init__(self, x, factor=2):
+        self.x = x * factor
+Scaled(4).x
+`)
+	testIntegerObject(t, notTrivial, 8)
+}
+
+func TestDictGetLiteralKeyMatchesGeneralLookup(t *testing.T) {
+	input := `
+calls = []
+def fallback(tag):
+    calls.append(tag)
+    return tag
+
+def greet(name, **kwargs):
+    return kwargs.get('greeting', fallback('Hello')) + ', ' + name
+
+d = {"a:b": 1, "plain": 2, 3: "three"}
+lib = {"get": lambda k: "custom " + k}
+[greet('Alice'), greet('Bob', greeting='Hi'), d.get("a:b"), d.get("plain"),
+ d.get("missing", 0), d.get(3.0), {}.get("x"), lib.get("k"), calls]
+`
+	evaluated := testEval(input)
+	list, ok := evaluated.(*object.List)
+	if !ok {
+		t.Fatalf("object is not List. got=%T (%+v)", evaluated, evaluated)
+	}
+	want := "[Hello, Alice, Hi, Bob, 1, 2, 0, three, None, custom k, [Hello, Hello]]"
+	if got := list.Inspect(); got != want {
+		t.Errorf("got %s, want %s", got, want)
+	}
+}
@@ -93,6 +93,23 @@ func TestStringPercentFormat(t *testing.T) {
 	}
 }
 
+func TestStringPercentFormatException(t *testing.T) {
+	input := `
+try:
+    raise ValueError("boom")
+except ValueError as e:
+    msg = "error: %s" % e
+msg
+`
+	str, ok := testEval(input).(*object.String)
+	if !ok {
+		t.Fatalf("expected String")
+	}
+	if str.StringValue() != "error: boom" {
+		t.Errorf("got %q, want %q", str.StringValue(), "error: boom")
+	}
+}
+
 func TestStringPercentFormatErrors(t *testing.T) {
 	tests := []struct {
 		input       string
@@ -121,3 +138,31 @@ func TestStringPercentFormatErrors(t *testing.T) {
 		})
 	}
 }
+
+func TestFStringAssembly(t *testing.T) {
+	tests := []struct {
+		input    string
+		expected string
+	}{
+		{`s = "abc"` + "\n" + `f"{s}"`, "abc"},
+		{`n = 7` + "\n" + `f"{n}"`, "7"},
+		{`f""`, ""},
+		{`f"plain"`, "plain"},
+		{`s = "x" * 40` + "\n" + `f"<{s}|{s}>"`, "<" + strings.Repeat("x", 40) + "|" + strings.Repeat("x", 40) + ">"},
+		{`a = 1` + "\n" + `b = 2.5` + "\n" + `f"{a}+{b}={a + b:.1f}!"`, "1+2.5=3.5!"},
+		{`s = "hi"` + "\n" + `f"{s:>4}"`, "  hi"},
+		{`vals = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]` + "\n" +
+			`f"{vals[0]}{vals[1]}{vals[2]}{vals[3]}{vals[4]}{vals[5]}{vals[6]}{vals[7]}{vals[8]}{vals[9]}"`, "12345678910"},
+	}
+	for _, tt := range tests {
+		result := testEval(tt.input)
+		str, ok := result.(*object.String)
+		if !ok {
+			t.Errorf("%q: expected String, got %T (%+v)", tt.input, result, result)
+			continue
+		}
+		if str.StringValue() != tt.expected {
+			t.Errorf("%q: got %q, want %q", tt.input, str.StringValue(), tt.expected)
+		}
+	}
+}
@@ -34,19 +34,22 @@ def handle_me(cmd):
     user = cmd.get_user()
     chat_id = cmd.get_chat_id()
 
-    text = "*Your Details:*\n\n"
-    text = text + "User ID: `" + str(user.get("id", "unknown")) + "`\n"
-    text = text + "Chat ID: `" + str(chat_id) + "`\n"
-    text = text + "First Name: " + user.get("first_name", "unknown") + "\n"
+    lines = [
+        "*Your Details:*",
+        "",
+        f"User ID: `{user.get('id', 'unknown')}`",
+        f"Chat ID: `{chat_id}`",
+        f"First Name: {user.get('first_name', 'unknown')}",
+    ]
 
     if user.get("last_name"):
-        text = text + "Last Name: " + user.get("last_name") + "\n"
+        lines.append(f"Last Name: {user['last_name']}")
     if user.get("username"):
-        text = text + "Username: @" + user.get("username") + "\n"
+        lines.append(f"Username: @{user['username']}")
     if user.get("language_code"):
-        text = text + "Language: " + user.get("language_code") + "\n"
+        lines.append(f"Language: {user['language_code']}")
 
-    cmd.reply_markdown(text)
+    cmd.reply_markdown("\n".join(lines) + "\n")
 
 
 def handle_buttons(cmd):
@@ -68,13 +71,18 @@ def handle_buttons_callback(bot, callback_query):
     data = callback_query["data"]
     chat_id = callback_query["message"]["chat"]["id"]
 
-    # Map callback data to actions
+    # Map callback data to actions; the answer and the reply are independent,
+    # so send them together
     if data == "buttons_next":
-        bot.answer_callback_query(callback_query["id"], text="Going next!")
-        bot.send_message(chat_id, "You selected: Next")
+        bot.call_many([
+            ("answerCallbackQuery", {"callback_query_id": callback_query["id"], "text": "Going next!"}),
+            ("sendMessage", {"chat_id": chat_id, "text": "You selected: Next"}),
+        ])
     elif data == "buttons_prev":
-        bot.answer_callback_query(callback_query["id"], text="Going back!")
-        bot.send_message(chat_id, "You selected: Previous")
+        bot.call_many([
+            ("answerCallbackQuery", {"callback_query_id": callback_query["id"], "text": "Going back!"}),
+            ("sendMessage", {"chat_id": chat_id, "text": "You selected: Previous"}),
+        ])
 
 
 def handle_actions(cmd):
@@ -99,8 +107,10 @@ def handle_actions_callback(bot, callback_query):
 
     # Map callback data to actions
     action = data.replace("actions_", "")
-    bot.answer_callback_query(callback_query["id"], text=f"Action: {action}")
-    bot.send_message(chat_id, f"You selected: {action.capitalize()}")
+    bot.call_many([
+        ("answerCallbackQuery", {"callback_query_id": callback_query["id"], "text": f"Action: {action}"}),
+        ("sendMessage", {"chat_id": chat_id, "text": f"You selected: {action.capitalize()}"}),
+    ])
 
 
 def handle_count(cmd):
@@ -144,9 +154,9 @@ def main():
                 try:
                     allowed_users.append(int(part))
                 except ValueError:
-                    logging.warning(f"Invalid user ID in TELEGRAM_ALLOWED_USERS: {part}")
+                    logging.warning("Invalid user ID in TELEGRAM_ALLOWED_USERS: %s", part)
         if allowed_users:
-            logging.info(f"Allowed users filter: {len(allowed_users)} user(s)")
+            logging.info("Allowed users filter: %d user(s)", len(allowed_users))
 
     # Create bot instance using the command framework
     bot = telegram.bot.New(token, allowed_users=allowed_users)
@@ -36,7 +36,19 @@ Example usage:
 """
 
 import logging
+import random
 import requests
+import time
+
+
+# Upper bound in seconds for the poll error backoff.
+_MAX_BACKOFF = 60
+
+# Times send_message_many retries a chat that hit flood control.
+_MAX_SEND_RETRIES = 3
+
+# Update fields that can carry the sending user, in priority order.
+_UPDATE_USER_KEYS = ("message", "callback_query", "edited_message", "channel_post")
 
 
 class Bot:
@@ -47,7 +59,7 @@ class Bot:
     Creating a Bot instance per request is cheap - it's just a token wrapper.
     """
 
-    def __init__(self, token, allowed_users=None):
+    def __init__(self, token, allowed_users=None, session=None):
         """
         Initialize a new Bot instance.
 
@@ -55,10 +67,18 @@ class Bot:
             token (str): Your Telegram bot token from @BotFather
             allowed_users (list, optional): List of allowed user IDs.
                                             If None or empty, all users are allowed.
+            session (requests.Session, optional): Session to send API calls
+                                                  through. One is created on the first
+                                                  API call if omitted.
         """
         self.token = token
         self.base_url = f"https://api.telegram.org/bot{token}"
-        self.allowed_users = allowed_users if allowed_users else []
+        self._url_cache = {}
+        # A set makes the per-update membership check a hash lookup.
+        self.allowed_users = set(allowed_users) if allowed_users else set()
+        # Created lazily so a webhook handler that builds a Bot per request
+        # but makes no API call does not pay for a session.
+        self._session = session
 
     def is_user_allowed(self, user_id):
         """
@@ -70,9 +90,44 @@ class Bot:
         Returns:
             bool: True if allowed (or no filter set), False otherwise
         """
-        if not self.allowed_users:
-            return True
-        return user_id in self.allowed_users
+        return not self.allowed_users or user_id in self.allowed_users
+
+    def _extract_user(self, update):
+        """
+        Find the user who sent an update in a single pass.
+
+        Parameters:
+            update (dict): The update object
+
+        Returns:
+            dict or None: The sender's user object, or None if not found
+        """
+        for key in _UPDATE_USER_KEYS:
+            src = update.get(key)
+            if src:
+                user = src.get("from")
+                if user:
+                    return user
+        return None
+
+    def _display_name(self, user):
+        """
+        Build a display name for a user object.
+
+        Parameters:
+            user (dict): A Telegram user object
+
+        Returns:
+            str: First/last name and @username, or the user ID if none are set
+        """
+        name_parts = []
+        if user.get("first_name"):
+            name_parts.append(user["first_name"])
+        if user.get("last_name"):
+            name_parts.append(user["last_name"])
+        if user.get("username"):
+            name_parts.append("@" + user["username"])
+        return " ".join(name_parts) if name_parts else str(user.get("id"))
 
     def _get_user_id_from_update(self, update):
         """
@@ -84,19 +139,8 @@ class Bot:
         Returns:
             int or None: The user ID, or None if not found
         """
-        # Check message
-        if "message" in update and update["message"]:
-            return update["message"].get("from", {}).get("id")
-        # Check callback query
-        if "callback_query" in update and update["callback_query"]:
-            return update["callback_query"].get("from", {}).get("id")
-        # Check edited message
-        if "edited_message" in update and update["edited_message"]:
-            return update["edited_message"].get("from", {}).get("id")
-        # Check channel post
-        if "channel_post" in update and update["channel_post"]:
-            return update["channel_post"].get("from", {}).get("id")
-        return None
+        user = self._extract_user(update)
+        return user.get("id") if user else None
 
     def _get_user_info_from_update(self, update):
         """
@@ -108,43 +152,27 @@ class Bot:
         Returns:
             dict: {"id": user_id, "name": display_name} or None if not found
         """
-        user = None
-        # Check message
-        if "message" in update and update["message"]:
-            user = update["message"].get("from", {})
-        # Check callback query
-        elif "callback_query" in update and update["callback_query"]:
-            user = update["callback_query"].get("from", {})
-        # Check edited message
-        elif "edited_message" in update and update["edited_message"]:
-            user = update["edited_message"].get("from", {})
-        # Check channel post
-        elif "channel_post" in update and update["channel_post"]:
-            user = update["channel_post"].get("from", {})
-
+        user = self._extract_user(update)
         if not user:
             return None
+        return {"id": user.get("id"), "name": self._display_name(user)}
 
-        user_id = user.get("id")
-        # Build display name
-        name_parts = []
-        if user.get("first_name"):
-            name_parts.append(user.get("first_name"))
-        if user.get("last_name"):
-            name_parts.append(user.get("last_name"))
-        if user.get("username"):
-            name_parts.append("@" + user.get("username"))
-
-        display_name = " ".join(name_parts) if name_parts else str(user_id)
-        return {"id": user_id, "name": display_name}
+    def _method_url(self, method):
+        """Return the endpoint URL for an API method, building it once."""
+        url = self._url_cache.get(method)
+        if url is None:
+            url = f"{self.base_url}/{method}"
+            self._url_cache[method] = url
+        return url
 
-    def _api_call(self, method, params=None):
+    def _api_call(self, method, params=None, timeout=30):
         """
         Make an API call to Telegram.
 
         Parameters:
             method (str): The API method name
             params (dict): Parameters for the API call
+            timeout (int): HTTP timeout in seconds
 
         Returns:
             dict: The API response
@@ -152,14 +180,63 @@ class Bot:
         if params is None:
             params = {}
 
-        response = requests.post(
-            f"{self.base_url}/{method}",
+        session = self._session
+        if session is None:
+            session = requests.Session()
+            session.headers["Content-Type"] = "application/json"
+            self._session = session
+
+        response = session.post(
+            self._method_url(method),
             json=params,
-            timeout=30
+            timeout=timeout
         )
 
         return response.json()
 
+    def close(self):
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def call_many(self, calls):
+        """
+        Make several independent API calls concurrently.
+
+        The requests share the pooled HTTP client and are sent in parallel,
+        so back-to-back calls (e.g. answering a callback query and sending a
+        reply) cost roughly one round-trip instead of one each.
+
+        Parameters:
+            calls (list): List of (method, params) pairs
+
+        Returns:
+            list: The API responses, in the same order as calls
+
+        Example:
+            bot.call_many([
+                ("answerCallbackQuery", {"callback_query_id": query_id}),
+                ("sendMessage", {"chat_id": chat_id, "text": "Done"}),
+            ])
+        """
+        batch = []
+        for method, params in calls:
+            batch.append({
+                "method": "POST",
+                "url": self._method_url(method),
+                "json": params if params is not None else {},
+                "timeout": 30,
+            })
+
+        results = []
+        for response in requests.parallel(batch, max_parallel=len(batch)):
+            if response.status_code == 0:
+                results.append({"ok": False, "description": response.text})
+            else:
+                results.append(response.json())
+        return results
+
     def get_me(self):
         """
         Get information about the bot.
@@ -193,9 +270,60 @@ class Bot:
             bot.send_message(chat_id, "Hello, World!")
             bot.send_message(chat_id, "*Bold*", parse_mode="Markdown")
         """
-        params = {"chat_id": chat_id, "text": text}
-        params.update(kwargs)
-        return self._api_call("sendMessage", params)
+        return self._api_call("sendMessage", {"chat_id": chat_id, "text": text, **kwargs})
+
+    def send_message_many(self, chat_ids, text, rate=30, **kwargs):
+        """
+        Send the same text message to many chats.
+
+        Messages go out in parallel batches of at most rate per second, since
+        Telegram limits a bot to about 30 messages per second overall. Chats
+        that hit flood control (429) are retried after the retry_after delay
+        Telegram reports, up to _MAX_SEND_RETRIES times.
+
+        Parameters:
+            chat_ids (list): Identifiers of the target chats
+            text (str): Text of the message to send
+            rate (int): Maximum messages sent per second (default 30). Must be
+                        at least 1; ValueError is raised otherwise.
+            **kwargs: Optional parameters, as for send_message
+
+        Returns:
+            list: The API responses, in the same order as chat_ids
+
+        Example:
+            results = bot.send_message_many(subscribers, "Maintenance at 22:00")
+            failed = [r for r in results if not r.get("ok")]
+        """
+        if rate < 1:
+            raise ValueError(f"rate must be at least 1, got {rate}")
+        chat_ids = list(chat_ids)
+        results = [None] * len(chat_ids)
+        pending = list(range(len(chat_ids)))
+        attempt = 0
+        while pending:
+            retry = []
+            wait = 0
+            for start in range(0, len(pending), rate):
+                started = time.time()
+                batch = pending[start:start + rate]
+                responses = self.call_many([("sendMessage", {"chat_id": chat_ids[i], "text": text, **kwargs}) for i in batch])
+                for i, response in zip(batch, responses):
+                    results[i] = response
+                    if not response.get("ok"):
+                        retry_after = response.get("parameters", {}).get("retry_after", 0)
+                        if retry_after and attempt < _MAX_SEND_RETRIES:
+                            retry.append(i)
+                            wait = max(wait, retry_after)
+                # Keep the next batch inside the per-second limit
+                elapsed = time.time() - started
+                if start + rate < len(pending) and elapsed < 1:
+                    time.sleep(1 - elapsed)
+            if retry:
+                time.sleep(wait)
+            pending = retry
+            attempt += 1
+        return results
 
     def edit_message_text(self, chat_id, message_id, text, **kwargs):
         """
@@ -213,9 +341,7 @@ class Bot:
         Example:
             bot.edit_message_text(chat_id, msg_id, "Updated text")
         """
-        params = {"chat_id": chat_id, "message_id": message_id, "text": text}
-        params.update(kwargs)
-        return self._api_call("editMessageText", params)
+        return self._api_call("editMessageText", {"chat_id": chat_id, "message_id": message_id, "text": text, **kwargs})
 
     def delete_message(self, chat_id, message_id):
         """
@@ -251,10 +377,9 @@ class Bot:
             bot.send_photo(chat_id, "https://example.com/photo.jpg")
             bot.send_photo(chat_id, file_id, caption="My photo")
         """
-        params = {"chat_id": chat_id, "photo": photo}
+        params = {"chat_id": chat_id, "photo": photo, **kwargs}
         if caption:
             params["caption"] = caption
-        params.update(kwargs)
         return self._api_call("sendPhoto", params)
 
     def send_document(self, chat_id, document, caption=None, **kwargs):
@@ -273,10 +398,9 @@ class Bot:
         Example:
             bot.send_document(chat_id, "https://example.com/file.pdf")
         """
-        params = {"chat_id": chat_id, "document": document}
+        params = {"chat_id": chat_id, "document": document, **kwargs}
         if caption:
             params["caption"] = caption
-        params.update(kwargs)
         return self._api_call("sendDocument", params)
 
     def send_chat_action(self, chat_id, action):
@@ -355,10 +479,9 @@ class Bot:
         Example:
             bot.set_webhook("https://example.com/webhook", secret_token="my_secret")
         """
-        params = {"url": url}
+        params = {"url": url, **kwargs}
         if secret_token:
             params["secret_token"] = secret_token
-        params.update(kwargs)
         return self._api_call("setWebhook", params)
 
     def delete_webhook(self):
@@ -401,13 +524,53 @@ class Bot:
         Example:
             updates = bot.get_updates(offset=update_id + 1)
         """
-        params = {"timeout": timeout}
+        params = {"timeout": timeout, **kwargs}
         if offset:
             params["offset"] = offset
-        params.update(kwargs)
-        return self._api_call("getUpdates", params)
+        # Allow the server the full long-poll window before the HTTP request
+        # itself gives up.
+        return self._api_call("getUpdates", params, timeout=timeout + 10)
 
-    def poll_updates(self, handler, timeout=30):
+    def _run_handler(self, handler, update):
+        """Call handler for one update, logging any exception it raises."""
+        try:
+            handler(self, update)
+        except Exception as e:
+            logging.error("Handler error: %s", e)
+
+    def _start_workers(self, handler, workers):
+        """
+        Start background workers that run handler for queued updates.
+
+        Parameters:
+            handler (callable): Update handler, as passed to poll_updates
+            workers (int): Number of workers to start
+
+        Returns:
+            callable: Function that queues an update for the workers
+        """
+        import scriptling.runtime as runtime
+
+        limit = workers * 4
+        queue = runtime.sync.Queue(f"telegram-updates-{id(self)}", maxsize=limit)
+
+        def worker():
+            while True:
+                self._run_handler(handler, queue.get())
+
+        for i in range(workers):
+            runtime.background(f"telegram-worker-{id(self)}-{i}", "worker", shared=True)
+
+        def dispatch(update):
+            if queue.size() >= limit:
+                logging.warning("Handler queue full, dropping update %s", update["update_id"])
+                return
+            queue.put(update)
+
+        return dispatch
+
+    def poll_updates(self, handler, timeout=30, workers=0, limit=100, allowed_updates=None,
+                     offset_store=None):
         """
         Start polling for updates and call handler for each one.
 
@@ -418,6 +581,22 @@ class Bot:
             handler (callable): Function to call for each update.
                                Signature: handler(bot, update)
             timeout (int): Long polling timeout in seconds
+            workers (int): Number of background handler workers. With 0 (the
+                           default) handlers run inline in the polling loop.
+                           Otherwise updates are queued to that many workers,
+                           so a slow handler does not delay the next poll.
+                           Requires the scriptling.runtime library.
+            limit (int): Maximum number of updates fetched per poll (1-100)
+            allowed_updates (list, optional): Update types to receive, e.g.
+                           ["message", "callback_query"]. Narrowing this avoids
+                           downloading and parsing updates the handler ignores.
+                           None keeps Telegram's current setting.
+            offset_store (str or object, optional): Where to keep the update
+                           offset between runs, so a restart does not fetch
+                           and dispatch updates that were already handled.
+                           A path is stored with FileOffsetStore; any object
+                           with load() and save(offset) methods also works.
+                           None (the default) starts from Telegram's backlog.
 
         Example:
             def handle_update(bot, update):
@@ -426,29 +605,110 @@ class Bot:
 
             bot.poll_updates(handle_update)
         """
-        offset = 0
+        dispatch = None
+        if workers > 0:
+            dispatch = self._start_workers(handler, workers)
+
+        poll_args = {"limit": limit}
+        if allowed_updates is not None:
+            poll_args["allowed_updates"] = list(allowed_updates)
+
+        if isinstance(offset_store, str):
+            offset_store = FileOffsetStore(offset_store)
+        offset = offset_store.load() if offset_store is not None else 0
+
+        backoff = 1.0
         while True:
+            failed = False
+            retry_after = 0
             try:
-                result = self.get_updates(offset=offset, timeout=timeout)
+                result = self.get_updates(offset=offset, timeout=timeout, **poll_args)
                 if result.get("ok"):
+                    backoff = 1.0
                     updates = result.get("result", [])
+                    # Only the last update_id decides the next offset. Advance it
+                    # before dispatching so an unexpected error part way through
+                    # cannot make the whole batch be fetched again.
+                    if updates:
+                        offset = updates[-1]["update_id"] + 1
+                    allowed = self.allowed_users
                     for update in updates:
-                        offset = update["update_id"] + 1
-                        # Check if user is allowed (skip if not)
-                        user_info = self._get_user_info_from_update(update)
-                        if user_info is not None and not self.is_user_allowed(user_info["id"]):
-                            logging.warning(f"Rejected update from unauthorized user: {user_info['name']} ({user_info['id']})")
-                            continue
-                        try:
-                            handler(self, update)
-                        except Exception as e:
-                            logging.error(f"Handler error: {e}")
+                        # Without an allowlist there is no need to look at the sender
+                        if allowed:
+                            user = self._extract_user(update)
+                            if user is not None and user.get("id") not in allowed:
+                                logging.warning("Rejected update from unauthorized user: %s (%s)", self._display_name(user), user.get("id"))
+                                continue
+                        if dispatch is None:
+                            self._run_handler(handler, update)
+                        else:
+                            dispatch(update)
+                    # Persist once per batch rather than once per update
+                    if updates and offset_store is not None:
+                        offset_store.save(offset)
+                else:
+                    # Telegram reports flood control (429) with the number of
+                    # seconds to wait in parameters.retry_after.
+                    failed = True
+                    retry_after = result.get("parameters", {}).get("retry_after", 0)
+                    logging.error("Poll error: %s", result.get("description"))
+            except (requests.ReadTimeout, requests.ConnectTimeout):
+                # Timeouts are normal for long polling
+                pass
+            except requests.RequestException as e:
+                failed = True
+                logging.error("Poll error: %s", e)
             except Exception as e:
-                # Silently ignore timeouts - this is normal for long polling
-                if "timeout" in str(e).lower():
-                    pass
+                failed = True
+                logging.error("Unexpected poll error: %s", e)
+
+            if failed:
+                # Back off exponentially with jitter rather than hammering the
+                # API while it is unreachable or rate limiting us.
+                if retry_after:
+                    time.sleep(retry_after)
                 else:
-                    logging.error(f"Poll error: {e}")
+                    time.sleep(backoff * (0.5 + random.random()))
+                backoff = min(backoff * 2, _MAX_BACKOFF)
+
+
+class FileOffsetStore:
+    """
+    Keeps the getUpdates offset in a small JSON file.
+
+    Writes go to a temporary file that is then renamed over the target, so a
+    crash mid-write never leaves a truncated offset behind. Requires the os
+    library.
+
+    Example:
+        bot.poll_updates(handle_update, offset_store=telegram.FileOffsetStore(".telegram-offset.json"))
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        """Return the stored offset, or 0 if there is none."""
+        import json
+        import os
+        import os.path
+
+        if not os.path.exists(self.path):
+            return 0
+        try:
+            return json.loads(os.read_file(self.path)).get("offset", 0)
+        except Exception as e:
+            logging.warning("Ignoring unreadable offset file %s: %s", self.path, e)
+            return 0
+
+    def save(self, offset):
+        """Atomically replace the stored offset."""
+        import json
+        import os
+
+        tmp = self.path + ".tmp"
+        os.write_file(tmp, json.dumps({"offset": offset}))
+        os.rename(tmp, self.path)
 
 
 # Helper functions for building inline keyboards
@@ -473,6 +733,13 @@ def inline_keyboard(buttons):
     return {"inline_keyboard": buttons}
 
 
+# Reply keyboards built by reply_keyboard, keyed by (buttons, resize, one_time).
+# Bots tend to send the same few menus, so the button rows are reused rather
+# than rebuilt on every message.
+_REPLY_KEYBOARD_CACHE_SIZE = 128
+_reply_keyboard_cache = {}
+
+
 def reply_keyboard(buttons, resize=True, one_time=False):
     """
     Build a reply keyboard markup.
@@ -489,12 +756,19 @@ def reply_keyboard(buttons, resize=True, one_time=False):
         keyboard = telegram.reply_keyboard([["Option 1", "Option 2"]])
         bot.send_message(chat_id, "Choose:", reply_markup=keyboard)
     """
-    keyboard = [[{"text": btn} for btn in row] for row in buttons]
-    return {
-        "keyboard": keyboard,
-        "resize_keyboard": resize,
-        "one_time_keyboard": one_time
-    }
+    key = (tuple([tuple(row) for row in buttons]), resize, one_time)
+    markup = _reply_keyboard_cache.get(key)
+    if markup is None:
+        if len(_reply_keyboard_cache) >= _REPLY_KEYBOARD_CACHE_SIZE:
+            _reply_keyboard_cache.clear()
+        markup = {
+            "keyboard": [[{"text": btn} for btn in row] for row in buttons],
+            "resize_keyboard": resize,
+            "one_time_keyboard": one_time
+        }
+        _reply_keyboard_cache[key] = markup
+    # Copy the wrapper so a caller changing it does not alter the cached entry
+    return {**markup}
 
 
 def remove_reply_keyboard():
@@ -38,6 +38,16 @@ Example:
 """
 
 import logging
+import re
+import telegram
+
+
+# Update types handle_update acts on; anything else is not fetched.
+_HANDLED_UPDATES = ["message", "edited_message", "callback_query"]
+
+# Shared stand-in for a missing "from" field, so Command does not allocate an
+# empty dict per update. Treat it as read-only.
+_EMPTY = {}
 
 
 class Command:
@@ -52,67 +62,61 @@ class Command:
         self.update = update
         self.command = command
         self.args = args
-        self.cached_chat_id = None
-        self.cached_message = None
-        self.cached_user = None
+
+        # Resolve the message, chat and sender once; the accessors below are
+        # then plain attribute reads.
+        msg = update.get("message") or update.get("edited_message")
+        cq = update.get("callback_query")
+        self.message = msg
+        if msg:
+            self.chat_id = msg["chat"]["id"]
+            self.user = msg.get("from") or _EMPTY
+        elif cq:
+            self.chat_id = cq["message"]["chat"]["id"]
+            self.user = cq.get("from") or _EMPTY
+        else:
+            self.chat_id = None
+            self.user = None
 
     def get_chat_id(self):
         """Get the chat ID from the update."""
-        if self.cached_chat_id is None:
-            if "message" in self.update and self.update["message"]:
-                self.cached_chat_id = self.update["message"]["chat"]["id"]
-            elif "callback_query" in self.update and self.update["callback_query"]:
-                self.cached_chat_id = self.update["callback_query"]["message"]["chat"]["id"]
-            elif "edited_message" in self.update and self.update["edited_message"]:
-                self.cached_chat_id = self.update["edited_message"]["chat"]["id"]
-        return self.cached_chat_id
+        return self.chat_id
 
     def get_message(self):
         """Get the message from the update."""
-        if self.cached_message is None:
-            if "message" in self.update:
-                self.cached_message = self.update["message"]
-            elif "edited_message" in self.update:
-                self.cached_message = self.update["edited_message"]
-        return self.cached_message
+        return self.message
 
     def get_user(self):
         """Get the user from the update."""
-        if self.cached_user is None:
-            msg = self.get_message()
-            if msg:
-                self.cached_user = msg.get("from", {})
-            elif "callback_query" in self.update:
-                self.cached_user = self.update["callback_query"].get("from", {})
-        return self.cached_user
+        return self.user
 
     def get_user_id(self):
         """Get the user ID."""
-        u = self.get_user()
+        u = self.user
         return u.get("id") if u else None
 
     def get_user_name(self):
         """Get the user's first name."""
-        u = self.get_user()
+        u = self.user
         return u.get("first_name", "there") if u else "there"
 
     def get_text(self):
         """Get the message text."""
-        msg = self.get_message()
+        msg = self.message
         return msg.get("text", "") if msg else ""
 
     def reply(self, text, **kwargs):
         """Send a reply to the chat."""
-        return self.bot.send_message(self.get_chat_id(), text, **kwargs)
+        return self.bot.send_message(self.chat_id, text, **kwargs)
 
     def reply_markdown(self, text, **kwargs):
         """Send a markdown reply to the chat."""
         kwargs["parse_mode"] = "Markdown"
-        return self.bot.send_message(self.get_chat_id(), text, **kwargs)
+        return self.bot.send_message(self.chat_id, text, **kwargs)
 
     def typing(self):
         """Send typing indicator."""
-        return self.bot.send_chat_action(self.get_chat_id(), "typing")
+        return self.bot.send_chat_action(self.chat_id, "typing")
 
 
 class CommandBot:
@@ -130,12 +134,21 @@ class CommandBot:
             token (str): Telegram bot token
             allowed_users (list, optional): List of allowed user IDs
         """
-        import telegram
         self.bot = telegram.Bot(token, allowed_users=allowed_users)
         self.commands = {}
+        # Help entries for every command except /help itself, kept in
+        # registration order so the help text is a straight walk.
+        self._public_commands = {}
         self.callbacks = {}
+        # Callback dispatch indexes: every prefix is kept longest-first so the
+        # most specific registration wins; "<token>_" prefixes that no longer
+        # prefix extends are also keyed on the token for a single dict lookup.
+        self._callback_index = {}
+        self._callback_prefixes = []
+        self._prefix_re = None
         self.default_handler = None
         self.help_enabled = True
+        self._help_cache = None
 
     def command(self, name, handler, help_text=None, button_handler=None):
         """
@@ -150,14 +163,17 @@ class CommandBot:
         Returns:
             CommandBot: self for chaining
         """
-        self.commands[name.lower()] = {
+        key = name.lower()
+        self.commands[key] = {
             "handler": handler,
             "help": help_text or name
         }
+        if key != "/help":
+            self._public_commands[key] = help_text or name
+        self._help_cache = None
 
         if button_handler:
-            prefix = name.lstrip("/") + "_"
-            self.callbacks[prefix] = button_handler
+            self._register_callback(name.lstrip("/") + "_", button_handler)
 
         return self
 
@@ -172,9 +188,54 @@ class CommandBot:
         Returns:
             CommandBot: self for chaining
         """
-        self.callbacks[data_prefix] = handler
+        self._register_callback(data_prefix, handler)
         return self
 
+    def _register_callback(self, prefix, handler):
+        """Store a callback handler and add it to the dispatch indexes."""
+        self.callbacks[prefix] = handler
+        if prefix not in self._callback_prefixes:
+            self._callback_prefixes.append(prefix)
+            self._callback_prefixes = sorted(self._callback_prefixes, key=len, reverse=True)
+            self._prefix_re = None
+        self._rebuild_callback_index()
+
+    def _rebuild_callback_index(self):
+        """Key "<token>_" prefixes on their token unless a longer prefix extends them."""
+        index = {}
+        for prefix in self._callback_prefixes:
+            token = prefix[:-1]
+            if not prefix.endswith("_") or not token or "_" in token:
+                continue
+            shadowed = False
+            for other in self._callback_prefixes:
+                if len(other) > len(prefix) and other.startswith(prefix):
+                    shadowed = True
+                    break
+            if not shadowed:
+                index[token] = self.callbacks[prefix]
+        self._callback_index = index
+
+    def _find_callback(self, data):
+        """Find the handler for callback data, or None if nothing matches."""
+        parts = data.split("_", 1)
+        if len(parts) == 2:
+            handler = self._callback_index.get(parts[0])
+            if handler is not None:
+                return handler
+
+        if not self._callback_prefixes:
+            return None
+        # Match all prefixes in one anchored alternation; longest prefixes
+        # come first so the most specific registration wins.
+        if self._prefix_re is None:
+            escaped = [re.escape(p) for p in self._callback_prefixes]
+            self._prefix_re = re.compile("^(?:" + "|".join(escaped) + ")")
+        m = self._prefix_re.match(data)
+        if m:
+            return self.callbacks[m.group(0)]
+        return None
+
     def default(self, handler):
         """
         Register a default handler for non-command messages.
@@ -196,6 +257,7 @@ class CommandBot:
             CommandBot: self for chaining
         """
         self.help_enabled = False
+        self._help_cache = None
         return self
 
     def handle_update(self, update):
@@ -204,38 +266,41 @@ class CommandBot:
             callback = update["callback_query"]
             data = callback.get("data", "")
 
-            for prefix, handler in self.callbacks.items():
-                if data.startswith(prefix):
-                    try:
-                        handler(self, callback)
-                    except Exception as e:
-                        logging.error(f"Callback handler error: {e}")
-                    return
+            handler = self._find_callback(data)
+            if handler is not None:
+                try:
+                    handler(self, callback)
+                except Exception as e:
+                    logging.error("Callback handler error: %s", e)
+                return
 
-            logging.warning(f"No handler for callback data: {data}")
+            logging.warning("No handler for callback data: %s", data)
             return
 
-        if "message" not in update and "edited_message" not in update:
+        message = update.get("message") or update.get("edited_message")
+        if not message:
             return
 
-        message = update.get("message") or update.get("edited_message")
         text = message.get("text", "")
 
-        if text.startswith("/"):
-            parts = text.split()
+        if text[:1] == "/":
+            # Only the command token is needed to dispatch; args are split
+            # once a handler is known to exist.
+            parts = text.split(None, 1)
             cmd = parts[0].lower()
-            args = parts[1:] if len(parts) > 1 else []
+            rest = parts[1] if len(parts) > 1 else ""
 
             if cmd == "/help" and self.help_enabled:
                 self.send_help(message["chat"]["id"])
                 return
 
             if cmd in self.commands:
+                args = rest.split() if rest else []
                 cmd_ctx = Command(self.bot, update, cmd, args)
                 try:
                     self.commands[cmd]["handler"](cmd_ctx)
                 except Exception as e:
-                    logging.error(f"Command handler error for {cmd}: {e}")
+                    logging.error("Command handler error for %s: %s", cmd, e)
                 return
 
             chat_id = message["chat"]["id"]
@@ -247,23 +312,24 @@ class CommandBot:
             try:
                 self.default_handler(cmd_ctx)
             except Exception as e:
-                logging.error(f"Default handler error: {e}")
+                logging.error("Default handler error: %s", e)
 
     def send_help(self, chat_id):
         """Send auto-generated help message."""
-        text = "*Available Commands:*\n\n"
+        if self._help_cache is None:
+            lines = ["*Available Commands:*", ""]
 
-        for cmd, info in self.commands.items():
-            if cmd == "/help":
-                continue
-            text = text + cmd + " - " + info["help"] + "\n"
+            for cmd, help_text in self._public_commands.items():
+                lines.append(f"{cmd} - {help_text}")
+
+            if self.help_enabled:
+                lines.append("/help - Show this help message")
 
-        if self.help_enabled:
-            text = text + "/help - Show this help message\n"
+            self._help_cache = "\n".join(lines) + "\n"
 
-        self.bot.send_message(chat_id, text, parse_mode="Markdown")
+        self.bot.send_message(chat_id, self._help_cache, parse_mode="Markdown")
 
-    def run(self, timeout=120):
+    def run(self, timeout=120, workers=0, offset_store=None):
         """
         Start the bot and begin polling for updates.
 
@@ -271,18 +337,25 @@ class CommandBot:
 
         Parameters:
             timeout (int): Long polling timeout in seconds
+            workers (int): Number of background handler workers (0 runs
+                           handlers inline; see Bot.poll_updates)
+            offset_store (str or object, optional): Path or store used to
+                           resume from the last handled update after a
+                           restart (see Bot.poll_updates)
         """
         me = self.bot.get_me()
         if me.get("ok"):
             bot_info = me.get("result", {})
-            logging.info(f"Starting bot: @{bot_info.get('username', 'unknown')}")
+            logging.info("Starting bot: @%s", bot_info.get("username", "unknown"))
         else:
             logging.warning("Could not get bot info")
 
         logging.info("Polling for updates. Press Ctrl+C to stop.")
 
         # Wrap bound method to match poll_updates signature: handler(bot, update)
-        self.bot.poll_updates(lambda bot, update: self.handle_update(update), timeout=timeout)
+        self.bot.poll_updates(lambda bot, update: self.handle_update(update), timeout=timeout,
+                              workers=workers, allowed_updates=_HANDLED_UPDATES,
+                              offset_store=offset_store)
 
     # Proxy common methods to underlying bot
     def send_message(self, chat_id, text, **kwargs):
@@ -313,6 +386,14 @@ class CommandBot:
         """Edit message reply markup."""
         return self.bot.edit_message_reply_markup(chat_id, message_id, reply_markup)
 
+    def call_many(self, calls):
+        """Make several independent API calls concurrently."""
+        return self.bot.call_many(calls)
+
+    def send_message_many(self, chat_ids, text, rate=30, **kwargs):
+        """Send a message to many chats, at most rate per second."""
+        return self.bot.send_message_many(chat_ids, text, rate=rate, **kwargs)
+
 
 def New(token, allowed_users=None):
     """
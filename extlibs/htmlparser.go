@@ -2,24 +2,21 @@ package extlibs
 
 import (
 	"context"
-	"html"
-	"regexp"
 	"strconv"
 	"strings"
+	"unicode"
 	"unicode/utf8"
 
 	"github.com/paularlott/scriptling/errors"
 	"github.com/paularlott/scriptling/evaliface"
 	"github.com/paularlott/scriptling/object"
+	"github.com/paularlott/scriptling/util"
 )
 
 func RegisterHTMLParserLibrary(registrar interface{ RegisterLibrary(*object.Library) }) {
 	registrar.RegisterLibrary(HTMLParserLibrary)
 }
 
-// attrRegex is compiled once at package init for parsing HTML tag attributes
-var attrRegex = regexp.MustCompile(`(\w+)(?:=(?:"([^"]*)"|'([^']*)'|([^\s>]*)))?`)
-
 // HTMLParserLibrary provides Python-compatible html.parser functionality
 var HTMLParserLibrary = object.NewLibrary(HTMLParserLibraryName, nil, map[string]object.Object{
 	"HTMLParser": &object.Class{
@@ -276,6 +273,17 @@ func parseHTML(ctx context.Context, instance *object.Instance, data string) obje
 		}
 	}
 
+	// Text is only worth unescaping and boxing if someone will see it: a
+	// subclass overriding handle_data, or charref handlers when
+	// convert_charrefs is off.
+	wantsData := !convertCharrefs || overridden(instance, "handle_data")
+	// Likewise the attribute list of a start tag, which costs a tuple and two
+	// strings per attribute.
+	wantsStartTags := overridden(instance, "handle_starttag") || overridden(instance, "handle_startendtag")
+	// The default handle_startendtag forwards self-closing tags to
+	// handle_endtag, so those still count when only that is overridden.
+	wantsEndTags := overridden(instance, "handle_endtag")
+
 	// Simple HTML parser implementation
 	i := 0
 	for i < len(data) {
@@ -334,26 +342,22 @@ func parseHTML(ctx context.Context, instance *object.Instance, data string) obje
 					// Start tag or self-closing tag
 					end := findTagEnd(data[i:])
 					if end != -1 {
+						// Store the last start tag text
+						instance.SetField("_lasttag", object.NewString(data[i:i+end+1]))
+
 						tagContent := data[i+1 : i+end]
 						selfClosing := strings.HasSuffix(strings.TrimSpace(tagContent), "/")
+						if !wantsStartTags && !(selfClosing && wantsEndTags) {
+							i = i + end + 1
+							continue
+						}
 						if selfClosing {
 							tagContent = strings.TrimSuffix(strings.TrimSpace(tagContent), "/")
 						}
 
 						tag, attrs := parseTag(tagContent)
 						tag = strings.ToLower(tag)
-
-						// Store the last start tag text
-						instance.SetField("_lasttag", object.NewString(data[i:i+end+1]))
-
-						// Convert attrs to list of tuples
-						attrsList := &object.List{Elements: make([]object.Object, len(attrs))}
-						for j, attr := range attrs {
-							attrsList.Elements[j] = &object.Tuple{Elements: []object.Object{
-								object.NewString(attr[0]),
-								object.NewString(attr[1]),
-							}}
-						}
+						attrsList := attrsToList(attrs)
 
 						if selfClosing {
 							callHandler(ctx, instance, "handle_startendtag", object.NewString(tag), attrsList)
@@ -368,7 +372,7 @@ func parseHTML(ctx context.Context, instance *object.Instance, data string) obje
 			i++
 		} else {
 			// Text data
-			end := strings.Index(data[i:], "<")
+			end := strings.IndexByte(data[i:], '<')
 			var textData string
 			if end == -1 {
 				textData = data[i:]
@@ -378,15 +382,15 @@ func parseHTML(ctx context.Context, instance *object.Instance, data string) obje
 				i = i + end
 			}
 
-			if len(textData) > 0 {
+			if len(textData) > 0 && wantsData {
 				// Handle character references
 				if convertCharrefs {
-					textData = html.UnescapeString(textData)
+					textData = util.UnescapeHTML(textData)
 				} else {
 					// Call handle_entityref and handle_charref for each reference
 					textData = processCharRefs(ctx, instance, textData)
 				}
-				if len(strings.TrimSpace(textData)) > 0 || len(textData) > 0 {
+				if len(textData) > 0 {
 					callHandler(ctx, instance, "handle_data", object.NewString(textData))
 				}
 			}
@@ -396,67 +400,153 @@ func parseHTML(ctx context.Context, instance *object.Instance, data string) obje
 	return &object.Null{}
 }
 
+// htmlParserDefaults holds the stock HTMLParser methods. It is filled in by
+// init because parseHTML, reachable from htmlParserMethods itself, reads it.
+var htmlParserDefaults map[string]object.Object
+
+func init() {
+	htmlParserDefaults = htmlParserMethods
+}
+
+// overridden reports whether the instance's class supplies its own version of
+// the named handler, so that calling it has an observable effect.
+func overridden(instance *object.Instance, name string) bool {
+	method, ok := instance.Class.Methods[name]
+	return ok && method != htmlParserDefaults[name]
+}
+
+// attrsToList builds the (name, value) tuple list passed to the start tag
+// handlers. The tuples and their element slices are carved out of one
+// allocation each rather than two per attribute; the strings share memory
+// with the input.
+func attrsToList(attrs [][2]string) *object.List {
+	list := &object.List{Elements: make([]object.Object, len(attrs))}
+	tuples := make([]object.Tuple, len(attrs))
+	elems := make([]object.Object, 2*len(attrs))
+	for j, attr := range attrs {
+		pair := elems[2*j : 2*j+2 : 2*j+2]
+		pair[0] = object.NewString(attr[0])
+		pair[1] = object.NewString(attr[1])
+		tuples[j].Elements = pair
+		list.Elements[j] = &tuples[j]
+	}
+	return list
+}
+
 // findTagEnd finds the end of a tag, handling quoted attributes
 func findTagEnd(data string) int {
-	inQuote := false
-	quoteChar := byte(0)
-	for i := 0; i < len(data); i++ {
-		if !inQuote {
-			if data[i] == '"' || data[i] == '\'' {
-				inQuote = true
-				quoteChar = data[i]
-			} else if data[i] == '>' {
-				return i
-			}
-		} else {
-			if data[i] == quoteChar {
-				inQuote = false
-			}
+	i := 0
+	for {
+		next := strings.IndexAny(data[i:], "\"'>")
+		if next < 0 {
+			return -1
+		}
+		i += next
+		if data[i] == '>' {
+			return i
+		}
+		// Skip the quoted attribute value in one scan for its closing quote
+		end := strings.IndexByte(data[i+1:], data[i])
+		if end < 0 {
+			return -1
 		}
+		i += end + 2
 	}
-	return -1
 }
 
 // parseTag parses a tag and returns the tag name and attributes
 func parseTag(content string) (string, [][2]string) {
 	content = strings.TrimSpace(content)
-	parts := strings.Fields(content)
-	if len(parts) == 0 {
+	if content == "" {
 		return "", nil
 	}
 
-	tagName := parts[0]
-	attrs := [][2]string{}
-
-	// Parse attributes using pre-compiled regex
-	attrPart := content[len(tagName):]
-	matches := attrRegex.FindAllStringSubmatch(attrPart, -1)
+	tagName := content
+	if end := strings.IndexFunc(content, unicode.IsSpace); end >= 0 {
+		tagName = content[:end]
+	}
+	return tagName, parseAttrs(content[len(tagName):])
+}
 
-	for _, match := range matches {
-		name := strings.ToLower(match[1])
+// parseAttrs scans name[=value] pairs out of the attribute part of a tag. It
+// accepts the same input as the pattern
+//
+//	(\w+)(?:=(?:"([^"]*)"|'([^']*)'|([^\s>]*)))?
+//
+// matched repeatedly, without the regex engine: anything that is not part of
+// a name is skipped, a quoted value runs to its closing quote, and a quote
+// with no partner starts an unquoted value.
+func parseAttrs(s string) [][2]string {
+	attrs := [][2]string{}
+	i := 0
+	for i < len(s) {
+		if !isAttrNameByte(s[i]) {
+			i++
+			continue
+		}
+		start := i
+		for i < len(s) && isAttrNameByte(s[i]) {
+			i++
+		}
+		name := strings.ToLower(s[start:i])
 		value := ""
-		if match[2] != "" {
-			value = html.UnescapeString(match[2])
-		} else if match[3] != "" {
-			value = html.UnescapeString(match[3])
-		} else if match[4] != "" {
-			value = html.UnescapeString(match[4])
+		if i < len(s) && s[i] == '=' {
+			value, i = scanAttrValue(s, i+1)
+			value = util.UnescapeHTML(value)
 		}
 		attrs = append(attrs, [2]string{name, value})
 	}
+	return attrs
+}
+
+// scanAttrValue reads the attribute value starting at s[i] and returns it with
+// the index just past it.
+func scanAttrValue(s string, i int) (string, int) {
+	if i < len(s) && (s[i] == '"' || s[i] == '\'') {
+		if end := strings.IndexByte(s[i+1:], s[i]); end >= 0 {
+			return s[i+1 : i+1+end], i + end + 2
+		}
+	}
+	start := i
+	for i < len(s) {
+		switch s[i] {
+		case ' ', '\t', '\n', '\f', '\r', '>':
+			return s[start:i], i
+		}
+		i++
+	}
+	return s[start:], i
+}
 
-	return tagName, attrs
+// isAttrNameByte reports whether b is an ASCII word character.
+func isAttrNameByte(b byte) bool {
+	return b == '_' || '0' <= b && b <= '9' || 'a' <= b && b <= 'z' || 'A' <= b && b <= 'Z'
 }
 
 // processCharRefs processes character references when convert_charrefs is False
 func processCharRefs(ctx context.Context, instance *object.Instance, data string) string {
+	if strings.IndexByte(data, '&') < 0 {
+		return data
+	}
 	result := strings.Builder{}
+	result.Grow(len(data))
 	i := 0
 	for i < len(data) {
-		if data[i] == '&' && i+1 < len(data) {
-			// Find the end of the reference
-			end := strings.Index(data[i:], ";")
-			if end != -1 && end < 10 {
+		// Copy the run of plain text up to the next '&' in one go
+		if data[i] != '&' {
+			next := strings.IndexByte(data[i:], '&')
+			if next < 0 {
+				result.WriteString(data[i:])
+				break
+			}
+			result.WriteString(data[i : i+next])
+			i += next
+		}
+		if i+1 < len(data) {
+			// Find the end of the reference; only short references count, so
+			// there is no need to look past the first few bytes
+			end := strings.IndexByte(data[i:min(i+10, len(data))], ';')
+			if end > 1 {
 				ref := data[i+1 : i+end]
 				if ref[0] == '#' {
 					// Numeric character reference
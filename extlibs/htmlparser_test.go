@@ -0,0 +1,65 @@
+package extlibs
+
+import (
+	"math/rand"
+	"reflect"
+	"regexp"
+	"strings"
+	"testing"
+
+	"github.com/paularlott/scriptling/util"
+)
+
+// attrPattern is the regex parseAttrs replaced; it stays here as the
+// reference the scanner must agree with.
+var attrPattern = regexp.MustCompile(`(\w+)(?:=(?:"([^"]*)"|'([^']*)'|([^\s>]*)))?`)
+
+func regexAttrs(s string) [][2]string {
+	attrs := [][2]string{}
+	for _, m := range attrPattern.FindAllStringSubmatch(s, -1) {
+		attrs = append(attrs, [2]string{strings.ToLower(m[1]), util.UnescapeHTML(m[2] + m[3] + m[4])})
+	}
+	return attrs
+}
+
+func TestParseAttrsMatchesRegex(t *testing.T) {
+	inputs := []string{
+		``,
+		` href="https://example.com" class="link"`,
+		` alt="a > b" title='say "hi"'`,
+		` disabled checked`,
+		` a=b c=d>`,
+		` A="unclosed`,
+		` b='unclosed rest`,
+		` data-x="1" aria_label=ok`,
+		` v=&amp;&lt; w="&quot;q&quot;"`,
+		` x= y`,
+		` é=1 ü="2"`,
+		" t=\"line\nbreak\"\tu=v\rw=\fz",
+	}
+	rng := rand.New(rand.NewSource(1))
+	const alphabet = "ab_9 =\"'>\t\n&;é"
+	for range 2000 {
+		n := rng.Intn(16)
+		var b strings.Builder
+		for range n {
+			b.WriteString(string([]rune(alphabet)[rng.Intn(len([]rune(alphabet)))]))
+		}
+		inputs = append(inputs, b.String())
+	}
+	for _, in := range inputs {
+		if got, want := parseAttrs(in), regexAttrs(in); !reflect.DeepEqual(got, want) {
+			t.Fatalf("parseAttrs(%q) = %q, want %q", in, got, want)
+		}
+	}
+}
+
+func TestParseTagName(t *testing.T) {
+	tag, attrs := parseTag("  img\tsrc=x.png  ")
+	if tag != "img" || len(attrs) != 1 || attrs[0] != [2]string{"src", "x.png"} {
+		t.Errorf("parseTag = %q, %q", tag, attrs)
+	}
+	if tag, attrs := parseTag("   "); tag != "" || attrs != nil {
+		t.Errorf("parseTag(blank) = %q, %q", tag, attrs)
+	}
+}
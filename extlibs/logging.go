@@ -3,16 +3,36 @@ package extlibs
 import (
 	"context"
 	"os"
+	"strings"
+	"sync/atomic"
 
 	"github.com/paularlott/logger"
 	logslog "github.com/paularlott/logger/slog"
 	"github.com/paularlott/scriptling/errors"
+	"github.com/paularlott/scriptling/evaluator"
 	"github.com/paularlott/scriptling/object"
 )
 
+// Python logging levels
+const (
+	levelDebug    = 10
+	levelInfo     = 20
+	levelWarning  = 30
+	levelError    = 40
+	levelCritical = 50
+)
+
 // Logger object wrapper for Python getLogger() functionality
 type loggerWrapper struct {
 	logger.Logger
+	level    atomic.Int64  // set by setLevel; 0 (NOTSET) defers to the handler
+	disabled *atomic.Int64 // shared threshold set by logging.disable()
+}
+
+// enabled reports whether a message at level would be emitted. Checking this
+// before formatting means a filtered message costs no string building.
+func (l *loggerWrapper) enabled(level int64) bool {
+	return level > l.disabled.Load() && level >= l.level.Load()
 }
 
 // Type() returns the logger type
@@ -49,24 +69,40 @@ func (l *loggerWrapper) CoerceFloat() (float64, object.Object) {
 func (l *loggerWrapper) CallMethod(method string, args ...object.Object) object.Object {
 	switch method {
 	case "debug":
-		return l.logAtLevel(args, l.Logger.Debug)
+		return l.logAtLevel(args, levelDebug, l.Logger.Debug)
 	case "info":
-		return l.logAtLevel(args, l.Logger.Info)
+		return l.logAtLevel(args, levelInfo, l.Logger.Info)
 	case "warning":
-		return l.logAtLevel(args, l.Logger.Warn)
+		return l.logAtLevel(args, levelWarning, l.Logger.Warn)
 	case "warn": // Python compatibility
-		return l.logAtLevel(args, l.Logger.Warn)
+		return l.logAtLevel(args, levelWarning, l.Logger.Warn)
 	case "error":
-		return l.logAtLevel(args, l.Logger.Error)
+		return l.logAtLevel(args, levelError, l.Logger.Error)
 	case "critical":
-		return l.logAtLevel(args, l.Logger.Error) // Map critical to error in Go
+		return l.logAtLevel(args, levelCritical, l.Logger.Error) // Map critical to error in Go
+	case "setLevel":
+		level, err := logLevelArg(args)
+		if err != nil {
+			return err
+		}
+		l.level.Store(level)
+		return &object.Null{}
+	case "isEnabledFor":
+		level, err := logLevelArg(args)
+		if err != nil {
+			return err
+		}
+		return object.NewBoolean(l.enabled(level))
 	default:
 		return errors.NewError("logging.Logger has no method '%s'", method)
 	}
 }
 
 // Helper function for logging at different levels
-func (l *loggerWrapper) logAtLevel(args []object.Object, logFunc func(msg string, keysAndValues ...any)) object.Object {
+func (l *loggerWrapper) logAtLevel(args []object.Object, level int64, logFunc func(msg string, keysAndValues ...any)) object.Object {
+	if !l.enabled(level) {
+		return object.NewBoolean(true)
+	}
 	if len(args) == 0 {
 		return errors.NewError("missing log message")
 	}
@@ -76,7 +112,7 @@ func (l *loggerWrapper) logAtLevel(args []object.Object, logFunc func(msg string
 		return errors.ParameterError("msg", err)
 	}
 
-	logFunc(msg)
+	logFunc(formatLogMessage(msg, args[1:]))
 	return object.NewBoolean(true)
 }
 
@@ -108,6 +144,9 @@ func RegisterLoggingLibraryDefault(registrar interface{ RegisterLibrary(*object.
 
 // createLoggingLibrary creates a logging library instance with the given logger
 func createLoggingLibrary(defaultLogger logger.Logger) *object.Library {
+	// Messages at or below this level are dropped by logging.disable().
+	disabled := new(atomic.Int64)
+
 	return object.NewLibrary(LoggingLibraryName,
 		map[string]*object.Builtin{
 			"getLogger": {
@@ -126,7 +165,8 @@ func createLoggingLibrary(defaultLogger logger.Logger) *object.Library {
 					// Create logger with the specified group
 					logInstance := defaultLogger.WithGroup(loggerName)
 					wrapper := &loggerWrapper{
-						Logger: logInstance,
+						Logger:   logInstance,
+						disabled: disabled,
 					}
 
 					// Wrap as Python object
@@ -170,6 +210,18 @@ func createLoggingLibrary(defaultLogger logger.Logger) *object.Library {
 								}
 								return wrapper.CallMethod("critical")
 							}},
+							"setLevel": &object.Builtin{Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+								if len(args) > 0 {
+									return wrapper.CallMethod("setLevel", args[1:]...)
+								}
+								return wrapper.CallMethod("setLevel")
+							}},
+							"isEnabledFor": &object.Builtin{Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+								if len(args) > 0 {
+									return wrapper.CallMethod("isEnabledFor", args[1:]...)
+								}
+								return wrapper.CallMethod("isEnabledFor")
+							}},
 						},
 					}, map[string]object.Object{
 						"_internal": wrapper,
@@ -178,34 +230,68 @@ func createLoggingLibrary(defaultLogger logger.Logger) *object.Library {
 			},
 			"debug": {
 				Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+					if levelDebug <= disabled.Load() {
+						return object.NewBoolean(true)
+					}
 					return logWithLogger(ctx, args, defaultLogger.Debug)
 				},
 			},
 			"info": {
 				Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+					if levelInfo <= disabled.Load() {
+						return object.NewBoolean(true)
+					}
 					return logWithLogger(ctx, args, defaultLogger.Info)
 				},
 			},
 			"warning": {
 				Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+					if levelWarning <= disabled.Load() {
+						return object.NewBoolean(true)
+					}
 					return logWithLogger(ctx, args, defaultLogger.Warn)
 				},
 			},
 			"warn": {
 				Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+					if levelWarning <= disabled.Load() {
+						return object.NewBoolean(true)
+					}
 					return logWithLogger(ctx, args, defaultLogger.Warn)
 				},
 			},
 			"error": {
 				Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+					if levelError <= disabled.Load() {
+						return object.NewBoolean(true)
+					}
 					return logWithLogger(ctx, args, defaultLogger.Error)
 				},
 			},
 			"critical": {
 				Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+					if levelCritical <= disabled.Load() {
+						return object.NewBoolean(true)
+					}
 					return logWithLogger(ctx, args, defaultLogger.Error)
 				},
 			},
+			"disable": {
+				Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+					level := int64(levelCritical)
+					if len(args) > 0 {
+						var err object.Object
+						if level, err = logLevelArg(args); err != nil {
+							return err
+						}
+					}
+					disabled.Store(level)
+					return &object.Null{}
+				},
+				HelpText: `disable(level=CRITICAL) - Drop all messages at or below level
+
+Messages that are dropped are not formatted. Call disable(0) to re-enable.`,
+			},
 		},
 		map[string]object.Object{
 			"DEBUG":    object.NewInteger(10),
@@ -230,6 +316,45 @@ func logWithLogger(ctx context.Context, args []object.Object, logFunc func(msg s
 		return errors.NewError("log message must be a string")
 	}
 
-	logFunc(msg.StringValue())
+	logFunc(formatLogMessage(msg.StringValue(), args[1:]))
 	return object.NewBoolean(true)
 }
+
+// logLevelArg reads the level argument of setLevel, isEnabledFor and disable.
+func logLevelArg(args []object.Object) (int64, object.Object) {
+	if len(args) != 1 {
+		return 0, errors.NewError("expected a level argument")
+	}
+	level, err := args[0].AsInt()
+	if err != nil {
+		return 0, errors.ParameterError("level", err)
+	}
+	return level, nil
+}
+
+// formatLogMessage applies Python logging's %-style arguments to msg. The
+// message is only formatted here, inside the library call, so scripts can pass
+// values through instead of building an f-string at every call site.
+//
+// Like Python's logging, a bad format never raises into the script: the raw
+// message is logged with the arguments appended and a note on what failed.
+func formatLogMessage(msg string, args []object.Object) string {
+	if len(args) == 0 {
+		return msg
+	}
+	result := evaluator.PercentFormat(msg, args)
+	if errObj, ok := result.(*object.Error); ok {
+		var b strings.Builder
+		b.WriteString(msg)
+		for _, arg := range args {
+			b.WriteByte(' ')
+			b.WriteString(evaluator.PercentFormat("%s", []object.Object{arg}).Inspect())
+		}
+		b.WriteString(" (logging error: ")
+		b.WriteString(errObj.Message)
+		b.WriteByte(')')
+		return b.String()
+	}
+	text, _ := result.AsString()
+	return text
+}
@@ -0,0 +1,117 @@
+package extlibs
+
+import (
+	"bytes"
+	"strings"
+	"testing"
+
+	logslog "github.com/paularlott/logger/slog"
+	"github.com/paularlott/scriptling"
+)
+
+func TestLoggingPercentArgs(t *testing.T) {
+	var buf bytes.Buffer
+	p := scriptling.New()
+	RegisterLoggingLibrary(p, logslog.New(logslog.Config{
+		Level:  "info",
+		Format: "console",
+		Writer: &buf,
+	}))
+
+	_, err := p.Eval(`
+import logging
+logging.info("user %s sent %d messages", "alice", 3)
+logging.getLogger("bot").warning("retry in %.1fs", 1.5)
+logging.error("plain message")
+`)
+	if err != nil {
+		t.Fatalf("Script error: %v", err)
+	}
+
+	out := buf.String()
+	for _, want := range []string{"user alice sent 3 messages", "retry in 1.5s", "plain message"} {
+		if !strings.Contains(out, want) {
+			t.Errorf("expected log output to contain %q, got:\n%s", want, out)
+		}
+	}
+}
+
+func TestLoggingLevelFiltering(t *testing.T) {
+	var buf bytes.Buffer
+	p := scriptling.New()
+	RegisterLoggingLibrary(p, logslog.New(logslog.Config{
+		Level:  "debug",
+		Format: "console",
+		Writer: &buf,
+	}))
+
+	result, err := p.Eval(`
+import logging
+log = logging.getLogger("bot")
+log.setLevel(logging.WARNING)
+log.info("hidden info %s", "x")
+log.warning("shown warning")
+enabled = [log.isEnabledFor(logging.INFO), log.isEnabledFor(logging.ERROR)]
+
+logging.disable(logging.WARNING)
+logging.warning("hidden module warning")
+log.warning("hidden logger warning")
+logging.error("shown error")
+enabled.append(log.isEnabledFor(logging.WARNING))
+logging.disable(0)
+logging.info("shown again")
+enabled
+`)
+	if err != nil {
+		t.Fatalf("Script error: %v", err)
+	}
+	if got := result.Inspect(); got != "[False, True, False]" {
+		t.Errorf("isEnabledFor results = %s, want [False, True, False]", got)
+	}
+
+	out := buf.String()
+	for _, want := range []string{"shown warning", "shown error", "shown again"} {
+		if !strings.Contains(out, want) {
+			t.Errorf("expected log output to contain %q, got:\n%s", want, out)
+		}
+	}
+	if strings.Contains(out, "hidden") {
+		t.Errorf("expected filtered messages to be dropped, got:\n%s", out)
+	}
+}
+
+func TestLoggingBadFormatDoesNotRaise(t *testing.T) {
+	var buf bytes.Buffer
+	p := scriptling.New()
+	RegisterLoggingLibrary(p, logslog.New(logslog.Config{
+		Level:  "info",
+		Format: "console",
+		Writer: &buf,
+	}))
+
+	result, err := p.Eval(`
+import logging
+handled = False
+try:
+    raise ValueError("boom")
+except ValueError as e:
+    logging.info("done", 42)
+    logging.error("100% failed: %s", e)
+    logging.getLogger("bot").warning("missing %s %s", "one")
+    handled = True
+handled
+`)
+	if err != nil {
+		t.Fatalf("Script error: %v", err)
+	}
+	if got := result.Inspect(); got != "True" {
+		t.Errorf("handled = %s, want True", got)
+	}
+
+	out := buf.String()
+	for _, want := range []string{"done 42 (logging error:", "100% failed: %s boom (logging error:", "missing %s %s one (logging error:"} {
+		if !strings.Contains(out, want) {
+			t.Errorf("expected log output to contain %q, got:\n%s", want, out)
+		}
+	}
+}
@@ -15,6 +15,7 @@ import (
 
 	"github.com/paularlott/logger"
 	"github.com/paularlott/scriptling/extlibs/messaging/shared"
+	"github.com/paularlott/scriptling/pool"
 )
 
 // discordClient implements shared.ScriptSender and embeds *shared.Bot.
@@ -30,7 +31,7 @@ type discordClient struct {
 func newClient(token string, log logger.Logger) *discordClient {
 	c := &discordClient{
 		token:      token,
-		httpClient: &http.Client{Timeout: 30 * time.Second},
+		httpClient: &http.Client{Transport: pool.GetHTTPClient().Transport, Timeout: 30 * time.Second},
 		log:        log,
 	}
 	c.Bot = shared.NewBot(c)
@@ -13,6 +13,7 @@ import (
 
 	"github.com/paularlott/logger"
 	"github.com/paularlott/scriptling/extlibs/messaging/shared"
+	"github.com/paularlott/scriptling/pool"
 )
 
 // slackClient implements shared.ScriptSender and embeds *shared.Bot.
@@ -29,7 +30,7 @@ func newClient(botToken, appToken string, log logger.Logger) *slackClient {
 	c := &slackClient{
 		botToken:   botToken,
 		appToken:   appToken,
-		httpClient: &http.Client{Timeout: 30 * time.Second},
+		httpClient: &http.Client{Transport: pool.GetHTTPClient().Transport, Timeout: 30 * time.Second},
 		log:        log,
 	}
 	c.Bot = shared.NewBot(c)
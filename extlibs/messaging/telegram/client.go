@@ -16,6 +16,7 @@ import (
 
 	"github.com/paularlott/logger"
 	"github.com/paularlott/scriptling/extlibs/messaging/shared"
+	"github.com/paularlott/scriptling/pool"
 )
 
 const apiBase = "https://api.telegram.org/bot"
@@ -31,7 +32,7 @@ type telegramClient struct {
 func newClient(token string, log logger.Logger) *telegramClient {
 	c := &telegramClient{
 		token:      token,
-		httpClient: &http.Client{Timeout: 60 * time.Second},
+		httpClient: &http.Client{Transport: pool.GetHTTPClient().Transport, Timeout: 60 * time.Second},
 		log:        log,
 	}
 	c.Bot = shared.NewBot(c)
@@ -3,13 +3,16 @@ package extlibs
 import (
 	"context"
 	"encoding/json"
+	stderrors "errors"
 	"fmt"
 	"io"
+	"net"
 	"net/http"
 	"net/url"
 	"strings"
 	"sync"
 	"time"
+	"unsafe"
 
 	"github.com/paularlott/scriptling/conversion"
 	"github.com/paularlott/scriptling/errors"
@@ -33,8 +36,9 @@ var ResponseClass = &object.Class{
 					return err
 				}
 				if instance, ok := args[0].(*object.Instance); ok {
-					if body, err := instance.Field("body").AsString(); err == nil {
-						return conversion.MustParseJSON(body)
+					// Decode straight from the raw body; .text is not needed.
+					if content, ok := instance.Field("content").(*object.Bytes); ok {
+						return conversion.MustParseJSONBytes(content.BytesValue())
 					}
 				}
 				return errors.NewError("json() called on non-Response object")
@@ -65,10 +69,84 @@ var ResponseClass = &object.Class{
 			},
 			HelpText: `raise_for_status() - Raises an exception if the status code indicates an error`,
 		},
+		"text":        &object.Property{Getter: responseTextGetter},
+		"body":        &object.Property{Getter: responseTextGetter}, // deprecated alias of .text
+		"has_body":    &object.Property{Getter: responseFlagGetter(func(i *object.Instance) bool { return responseContentLen(i) > 0 })},
+		"is_empty":    &object.Property{Getter: responseFlagGetter(func(i *object.Instance) bool { return responseContentLen(i) == 0 })},
+		"has_headers": &object.Property{Getter: responseFlagGetter(responseHasHeaders)},
 	},
 }
 
-// createResponseInstance creates a new Response instance
+// responseTextGetter backs the text and body properties. The body is only
+// decoded into a string on first access; the result is then stored as
+// instance fields, which shadow the class properties on later lookups.
+var responseTextGetter = &object.Builtin{
+	Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+		if err := errors.ExactArgs(args, 1); err != nil {
+			return err
+		}
+		instance, ok := args[0].(*object.Instance)
+		if !ok {
+			return errors.NewError("text accessed on non-Response object")
+		}
+		return responseText(instance)
+	},
+}
+
+// responseText returns the decoded response body, decoding and caching it on
+// first use.
+func responseText(instance *object.Instance) object.Object {
+	if text, ok := instance.GetField("text"); ok {
+		return text
+	}
+	var text *object.String
+	if content, ok := instance.Field("content").(*object.Bytes); ok && content.Len() > 0 {
+		// Bytes are immutable, so the text shares the body's memory rather
+		// than copying it; json() and json.loads(resp.text) scan it in place.
+		body := content.BytesValue()
+		text = object.NewString(unsafe.String(&body[0], len(body)))
+	} else {
+		text = object.NewString("")
+	}
+	instance.SetField("text", text)
+	instance.SetField("body", text)
+	return text
+}
+
+// responseContentLen returns the raw body length without decoding it.
+func responseContentLen(instance *object.Instance) int {
+	if content, ok := instance.Field("content").(*object.Bytes); ok {
+		return len(content.BytesValue())
+	}
+	return 0
+}
+
+// responseHasHeaders reports whether the response carried any headers.
+func responseHasHeaders(instance *object.Instance) bool {
+	if headers, ok := instance.Field("headers").(*object.Dict); ok {
+		return len(headers.Pairs) > 0
+	}
+	return false
+}
+
+// responseFlagGetter wraps a cheap boolean check as a property getter.
+func responseFlagGetter(fn func(*object.Instance) bool) *object.Builtin {
+	return &object.Builtin{
+		Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+			if err := errors.ExactArgs(args, 1); err != nil {
+				return err
+			}
+			instance, ok := args[0].(*object.Instance)
+			if !ok {
+				return errors.NewError("property accessed on non-Response object")
+			}
+			return object.NewBoolean(fn(instance))
+		},
+	}
+}
+
+// createResponseInstance creates a new Response instance. It takes ownership of
+// body, which callers pass freshly read or allocated.
 func createResponseInstance(statusCode int, headers map[string]string, body []byte, url string) *object.Instance {
 	// Convert headers to object.Dict
 	headerDict := &object.Dict{Pairs: make(map[string]object.DictPair)}
@@ -76,12 +154,11 @@ func createResponseInstance(statusCode int, headers map[string]string, body []by
 		headerDict.SetByString(k, object.NewString(v))
 	}
 
+	// text and body are decoded lazily from content by the class properties.
 	return object.NewInstanceWithFields(ResponseClass, map[string]object.Object{
 		"status_code": object.NewInteger(int64(statusCode)),
-		"text":        object.NewString(string(body)),
-		"content":     object.NewBytes(body),
+		"content":     object.NewBytesOwned(body),
 		"headers":     headerDict,
-		"body":        object.NewString(string(body)), // deprecated alias of .text
 		"url":         object.NewString(url),
 	})
 }
@@ -89,13 +166,40 @@ func createResponseInstance(statusCode int, headers map[string]string, body []by
 // Exception types for requests library
 var requestExceptionType = object.NewString("RequestException")
 var httpErrorType = object.NewString("HTTPError")
+var connectionErrorType = object.NewString("ConnectionError")
+var timeoutType = object.NewString("Timeout")
+var connectTimeoutType = object.NewString("ConnectTimeout")
+var readTimeoutType = object.NewString("ReadTimeout")
 
 // Create exceptions namespace dict
 var exceptionsNamespace = object.NewStringDict(map[string]object.Object{
 	"RequestException": requestExceptionType,
 	"HTTPError":        httpErrorType,
+	"ConnectionError":  connectionErrorType,
+	"Timeout":          timeoutType,
+	"ConnectTimeout":   connectTimeoutType,
+	"ReadTimeout":      readTimeoutType,
 })
 
+func init() {
+	// Mirror the requests exception hierarchy so `except requests.RequestException:`
+	// also catches timeouts, connection failures and HTTP errors.
+	object.RegisterExceptionParent("HTTPError", "RequestException")
+	object.RegisterExceptionParent("ConnectionError", "RequestException")
+	object.RegisterExceptionParent("Timeout", "RequestException")
+	object.RegisterExceptionParent("ConnectTimeout", "Timeout")
+	object.RegisterExceptionParent("ReadTimeout", "Timeout")
+}
+
+// newRequestError creates an error tagged with one of the requests exception
+// types so that `except requests.<Type>:` matches it.
+func newRequestError(exceptionType, format string, args ...interface{}) *object.Error {
+	return &object.Error{
+		Message:       fmt.Sprintf(format, args...),
+		ExceptionType: exceptionType,
+	}
+}
+
 // parseRequestOptions parses the options dict and returns timeout, headers, params, user, pass
 func parseRequestOptions(options map[string]object.Object) (int, map[string]string, map[string]string, string, string) {
 	timeout := 5
@@ -263,7 +367,103 @@ func extractRequestArgs(kwargs object.Kwargs, args []object.Object, hasData bool
 	return url, data, options, nil
 }
 
+// sendRequest is the shared body of the module-level verb functions and the
+// Session methods. sessionHeaders, when non-nil, are defaults that headers
+// passed to the individual request override.
+func sendRequest(ctx context.Context, method string, kwargs object.Kwargs, args []object.Object, sessionHeaders map[string]string) object.Object {
+	hasData := method == "POST" || method == "PUT" || method == "PATCH"
+	rawURL, data, options, err := extractRequestArgs(kwargs, args, hasData)
+	if err != nil {
+		return err
+	}
+	timeout, headers, params, user, pass := parseRequestOptions(options)
+	if len(sessionHeaders) > 0 {
+		merged := make(map[string]string, len(sessionHeaders)+len(headers))
+		for k, v := range sessionHeaders {
+			merged[http.CanonicalHeaderKey(k)] = v
+		}
+		for k, v := range headers {
+			merged[http.CanonicalHeaderKey(k)] = v
+		}
+		headers = merged
+	}
+	fullURL := buildURLWithParams(rawURL, params)
+	return httpRequestWithContext(ctx, method, fullURL, data, timeout, headers, user, pass)
+}
+
+// sessionMethod builds a Session method that sends a request with the
+// session's default headers.
+func sessionMethod(method string) *object.Builtin {
+	return &object.Builtin{
+		Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+			if err := errors.MinArgs(args, 1); err != nil {
+				return err
+			}
+			instance, ok := args[0].(*object.Instance)
+			if !ok {
+				return errors.NewError("%s() called on non-Session object", strings.ToLower(method))
+			}
+			var sessionHeaders map[string]string
+			if headers, err := instance.Field("headers").AsDict(); err == nil {
+				sessionHeaders = extractHeaders(headers)
+			}
+			return sendRequest(ctx, method, kwargs, args[1:], sessionHeaders)
+		},
+		HelpText: strings.ToLower(method) + `(url, **kwargs) - Send a ` + method + ` request using the session's default headers`,
+	}
+}
+
+// SessionClass mirrors requests.Session: a holder for default headers shared
+// by every request made through it. Connections are pooled process-wide by
+// the shared HTTP client, so a session needs no transport of its own.
+var SessionClass = &object.Class{
+	Name: "Session",
+	Methods: map[string]object.Object{
+		"get":    sessionMethod("GET"),
+		"post":   sessionMethod("POST"),
+		"put":    sessionMethod("PUT"),
+		"delete": sessionMethod("DELETE"),
+		"patch":  sessionMethod("PATCH"),
+		"close": &object.Builtin{
+			Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+				return &object.Null{}
+			},
+			HelpText: `close() - Close the session (connections are owned by the shared pool, so this is a no-op)`,
+		},
+		"__enter__": &object.Builtin{
+			Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+				if err := errors.MinArgs(args, 1); err != nil {
+					return err
+				}
+				return args[0]
+			},
+		},
+		"__exit__": &object.Builtin{
+			Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+				return object.NewBoolean(false)
+			},
+		},
+	},
+}
+
 var RequestsLibrary = object.NewLibrary(RequestsLibraryName, map[string]*object.Builtin{
+	"Session": {
+		Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+			return object.NewInstanceWithFields(SessionClass, map[string]object.Object{
+				"headers": &object.Dict{Pairs: make(map[string]object.DictPair)},
+			})
+		},
+		HelpText: `Session() - Create a session holding default headers
+
+The returned Session has a headers dict and get/post/put/delete/patch
+methods taking the same arguments as the module-level functions. Headers
+passed to an individual request override the session defaults.
+
+Example:
+  session = requests.Session()
+  session.headers["Authorization"] = "Bearer " + token
+  resp = session.get("https://api.example.com/items")`,
+	},
 	// Exceptions namespace - returns dict with exception types
 	"exceptions": {
 		Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
@@ -272,14 +472,7 @@ var RequestsLibrary = object.NewLibrary(RequestsLibraryName, map[string]*object.
 	},
 	"get": {
 		Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
-			rawURL, _, options, err := extractRequestArgs(kwargs, args, false)
-			if err != nil {
-				return err
-			}
-			timeout, headers, params, user, pass := parseRequestOptions(options)
-			// Build URL with query params
-			fullURL := buildURLWithParams(rawURL, params)
-			return httpRequestWithContext(ctx, "GET", fullURL, "", timeout, headers, user, pass)
+			return sendRequest(ctx, "GET", kwargs, args, nil)
 		},
 		HelpText: `get(url, **kwargs) - Send a GET request
 
@@ -298,14 +491,7 @@ Returns:
 	},
 	"post": {
 		Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
-			url, data, options, err := extractRequestArgs(kwargs, args, true)
-			if err != nil {
-				return err
-			}
-			timeout, headers, params, user, pass := parseRequestOptions(options)
-			// POST can also have query params
-			fullURL := buildURLWithParams(url, params)
-			return httpRequestWithContext(ctx, "POST", fullURL, data, timeout, headers, user, pass)
+			return sendRequest(ctx, "POST", kwargs, args, nil)
 		},
 		HelpText: `post(url, data=None, json=None, **kwargs) - Send a POST request
 
@@ -327,13 +513,7 @@ Returns:
 	},
 	"put": {
 		Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
-			url, data, options, err := extractRequestArgs(kwargs, args, true)
-			if err != nil {
-				return err
-			}
-			timeout, headers, params, user, pass := parseRequestOptions(options)
-			fullURL := buildURLWithParams(url, params)
-			return httpRequestWithContext(ctx, "PUT", fullURL, data, timeout, headers, user, pass)
+			return sendRequest(ctx, "PUT", kwargs, args, nil)
 		},
 		HelpText: `put(url, data=None, json=None, **kwargs) - Send a PUT request
 
@@ -355,13 +535,7 @@ Returns:
 	},
 	"delete": {
 		Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
-			rawURL, _, options, err := extractRequestArgs(kwargs, args, false)
-			if err != nil {
-				return err
-			}
-			timeout, headers, params, user, pass := parseRequestOptions(options)
-			fullURL := buildURLWithParams(rawURL, params)
-			return httpRequestWithContext(ctx, "DELETE", fullURL, "", timeout, headers, user, pass)
+			return sendRequest(ctx, "DELETE", kwargs, args, nil)
 		},
 		HelpText: `delete(url, **kwargs) - Send a DELETE request
 
@@ -379,13 +553,7 @@ Returns:
 	},
 	"patch": {
 		Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
-			url, data, options, err := extractRequestArgs(kwargs, args, true)
-			if err != nil {
-				return err
-			}
-			timeout, headers, params, user, pass := parseRequestOptions(options)
-			fullURL := buildURLWithParams(url, params)
-			return httpRequestWithContext(ctx, "PATCH", fullURL, data, timeout, headers, user, pass)
+			return sendRequest(ctx, "PATCH", kwargs, args, nil)
 		},
 		HelpText: `patch(url, data=None, json=None, **kwargs) - Send a PATCH request
 
@@ -426,6 +594,11 @@ Returns:
 				maxParallel = 1
 			}
 
+			totalTimeout, ttErr := kwargs.GetFloat("total_timeout", 0)
+			if ttErr != nil {
+				return ttErr
+			}
+
 			results := make([]object.Object, len(requestList))
 			sem := make(chan struct{}, maxParallel)
 			var wg sync.WaitGroup
@@ -434,6 +607,11 @@ Returns:
 			// their context so the blocking HTTP call inside executeRequest does
 			// not try to release an interpreter lock the worker doesn't hold.
 			workerCtx := context.WithValue(ctx, "scriptling-env", (*object.Environment)(nil))
+			if totalTimeout > 0 {
+				var cancel context.CancelFunc
+				workerCtx, cancel = context.WithTimeout(workerCtx, time.Duration(totalTimeout*float64(time.Second)))
+				defer cancel()
+			}
 
 			// Release this goroutine's interpreter lock while the parallel batch
 			// runs, so other script goroutines can proceed meanwhile.
@@ -448,7 +626,14 @@ Returns:
 					wg.Add(1)
 					go func(idx int, rd map[string]object.Object) {
 						defer wg.Done()
-						sem <- struct{}{}
+						// Requests still queued when the batch deadline passes
+						// fail straight away instead of waiting for a slot.
+						select {
+						case sem <- struct{}{}:
+						case <-workerCtx.Done():
+							results[idx] = createResponseInstance(0, nil, []byte("parallel batch timed out"), "")
+							return
+						}
 						defer func() { <-sem }()
 
 						results[idx] = executeParallelRequest(workerCtx, rd)
@@ -475,6 +660,8 @@ Parameters:
     - auth (list/tuple, optional): [username, password] for basic auth
     - timeout (int, optional): Timeout in seconds (default: 30)
   max_parallel (int): Maximum concurrent requests (default: 4)
+  total_timeout (float, optional): Deadline in seconds for the whole batch.
+        Requests not finished by then fail like any other request.
 
 Returns:
   list: List of Response objects in the same order as input requests.
@@ -493,6 +680,10 @@ Example:
 	// Exception types as constants (for except clause matching)
 	"RequestException": requestExceptionType,
 	"HTTPError":        httpErrorType,
+	"ConnectionError":  connectionErrorType,
+	"Timeout":          timeoutType,
+	"ConnectTimeout":   connectTimeoutType,
+	"ReadTimeout":      readTimeoutType,
 	"Response":         ResponseClass,
 }, "HTTP requests library")
 
@@ -539,19 +730,34 @@ func httpRequestWithContext(parentCtx context.Context, method, url, body string,
 		req.SetBasicAuth(user, pass)
 	}
 
+	// Use the shared pool's transport (keep-alive and HTTP/2, so concurrent
+	// calls to one host are multiplexed) but not its client: the pool client's
+	// fixed Timeout would cap every request at the pool default, cutting off
+	// long polls that asked for more. The deadline is carried by ctx instead.
+	client := &http.Client{Transport: pool.GetHTTPClient().Transport}
+
 	var resp *http.Response
-	object.RunBlocking(ctx, func() { resp, err = pool.GetHTTPClient().Do(req) })
+	object.RunBlocking(ctx, func() { resp, err = client.Do(req) })
 	if err != nil {
 		if ctx.Err() == context.DeadlineExceeded {
-			return errors.NewError("http timeout after %d seconds", timeoutSecs)
+			// A deadline hit while dialling never reached the server.
+			exceptionType := "ReadTimeout"
+			var opErr *net.OpError
+			if stderrors.As(err, &opErr) && opErr.Op == "dial" {
+				exceptionType = "ConnectTimeout"
+			}
+			return newRequestError(exceptionType, "http timeout after %d seconds", timeoutSecs)
 		}
-		return errors.NewError("http error: %s", err.Error())
+		return newRequestError("ConnectionError", "http error: %s", err.Error())
 	}
 	defer resp.Body.Close()
 
 	respBody, err := io.ReadAll(resp.Body)
 	if err != nil {
-		return errors.NewError("http read error: %s", err.Error())
+		if ctx.Err() == context.DeadlineExceeded {
+			return newRequestError("ReadTimeout", "http timeout after %d seconds", timeoutSecs)
+		}
+		return newRequestError("ConnectionError", "http read error: %s", err.Error())
 	}
 
 	respHeaders := make(map[string]string)
@@ -639,5 +845,11 @@ func executeParallelRequest(ctx context.Context, spec map[string]object.Object)
 		}
 	}
 
-	return httpRequestWithContext(ctx, method, urlStr, body, timeout, headers, user, pass)
+	// Report transport failures the same way as the other per-request errors
+	// above, so one bad request cannot turn the batch into an exception.
+	result := httpRequestWithContext(ctx, method, urlStr, body, timeout, headers, user, pass)
+	if errObj, ok := result.(*object.Error); ok {
+		return createResponseInstance(0, nil, []byte(errObj.Message), urlStr)
+	}
+	return result
 }
@@ -587,6 +587,58 @@ len(results)
 	}
 }
 
+func TestParallelTotalTimeout(t *testing.T) {
+	release := make(chan struct{})
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.URL.Path == "/slow" {
+			select {
+			case <-release:
+			case <-r.Context().Done():
+			}
+		}
+		w.WriteHeader(200)
+		w.Write([]byte(`{"ok":true}`))
+	}))
+	defer srv.Close()
+	defer close(release)
+
+	p := scriptling.New()
+	stdlib.RegisterAll(p)
+	RegisterRequestsLibrary(p)
+
+	// In the second batch one slow request holds the only slot, so the other
+	// is still queued when the deadline passes.
+	script := `
+import requests
+
+slow = {"method": "GET", "url": "` + srv.URL + `/slow"}
+fast = {"method": "GET", "url": "` + srv.URL + `/fast"}
+results = requests.parallel([fast, slow, fast], max_parallel=3, total_timeout=0.3)
+results = results + requests.parallel([slow, slow], max_parallel=1, total_timeout=0.3)
+[r.status_code for r in results]
+`
+
+	start := time.Now()
+	result, err := p.Eval(script)
+	if err != nil {
+		t.Fatalf("Script error: %v", err)
+	}
+	if elapsed := time.Since(start); elapsed > 5*time.Second {
+		t.Errorf("parallel took %v, want it cut off by total_timeout", elapsed)
+	}
+
+	list, ok := result.(*object.List)
+	if !ok || len(list.Elements) != 5 {
+		t.Fatalf("expected 5 status codes, got %v", result)
+	}
+	want := []int64{200, 0, 200, 0, 0}
+	for i, el := range list.Elements {
+		if code, _ := el.AsInt(); code != want[i] {
+			t.Errorf("result %d: status %d, want %d", i, code, want[i])
+		}
+	}
+}
+
 func TestParallelEchoServer(t *testing.T) {
 	// Integration test using external echo server on port 9000.
 	// Skip if the server is not running.
@@ -629,3 +681,130 @@ ok
 		t.Errorf("Expected 6 successful responses, got %d", count)
 	}
 }
+
+func TestResponseLazyText(t *testing.T) {
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.URL.Path == "/empty" {
+			w.WriteHeader(204)
+			return
+		}
+		w.WriteHeader(200)
+		w.Write([]byte(`{"status":"ok"}`))
+	}))
+	defer srv.Close()
+
+	p := scriptling.New()
+	stdlib.RegisterAll(p)
+	RegisterRequestsLibrary(p)
+
+	script := `
+import requests
+
+r = requests.get("` + srv.URL + `", timeout=5)
+empty = requests.get("` + srv.URL + `/empty", timeout=5)
+[r.has_body, r.is_empty, r.has_headers, r.text, r.body, r.json()["status"], getattr(r, "text"),
+ empty.has_body, empty.is_empty, empty.text]
+`
+
+	result, err := p.Eval(script)
+	if err != nil {
+		t.Fatalf("Script error: %v", err)
+	}
+
+	list, ok := result.(*object.List)
+	if !ok {
+		t.Fatalf("expected list, got %T", result)
+	}
+	got := make([]string, len(list.Elements))
+	for i, el := range list.Elements {
+		got[i] = el.Inspect()
+	}
+	want := []string{"True", "False", "True", `{"status":"ok"}`, `{"status":"ok"}`, "ok", `{"status":"ok"}`, "False", "True", ""}
+	if len(got) != len(want) {
+		t.Fatalf("expected %d results, got %d: %v", len(want), len(got), got)
+	}
+	for i := range want {
+		if got[i] != want[i] {
+			t.Errorf("result %d: expected %q, got %q", i, want[i], got[i])
+		}
+	}
+}
+
+func TestRequestsSessionHeaders(t *testing.T) {
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.WriteHeader(200)
+		w.Write([]byte(r.Header.Get("X-Token") + "|" + r.Header.Get("X-Mode") + "|" + r.Method))
+	}))
+	defer srv.Close()
+
+	p := scriptling.New()
+	stdlib.RegisterAll(p)
+	RegisterRequestsLibrary(p)
+
+	script := `
+import requests
+
+session = requests.Session()
+session.headers["X-Token"] = "abc"
+session.headers["X-Mode"] = "default"
+a = session.get("` + srv.URL + `", timeout=5).text
+b = session.post("` + srv.URL + `", json={"k": 1}, headers={"x-mode": "override"}, timeout=5).text
+session.close()
+a + "," + b
+`
+
+	result, err := p.Eval(script)
+	if err != nil {
+		t.Fatalf("Script error: %v", err)
+	}
+	got, _ := result.AsString()
+	if want := "abc|default|GET,abc|override|POST"; got != want {
+		t.Errorf("expected %q, got %q", want, got)
+	}
+}
+
+func TestRequestsTypedExceptions(t *testing.T) {
+	slow := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		time.Sleep(1500 * time.Millisecond)
+		w.WriteHeader(200)
+	}))
+	defer slow.Close()
+
+	closed := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {}))
+	closedURL := closed.URL
+	closed.Close()
+
+	p := scriptling.New()
+	stdlib.RegisterAll(p)
+	RegisterRequestsLibrary(p)
+
+	script := `
+import requests
+
+caught = []
+try:
+    requests.get("` + slow.URL + `", timeout=1)
+except requests.ReadTimeout:
+    caught.append("read")
+try:
+    requests.get("` + slow.URL + `", timeout=1)
+except requests.RequestException:
+    caught.append("base")
+try:
+    requests.get("` + closedURL + `", timeout=1)
+except requests.Timeout:
+    caught.append("wrong")
+except requests.ConnectionError:
+    caught.append("conn")
+",".join(caught)
+`
+
+	result, err := p.Eval(script)
+	if err != nil {
+		t.Fatalf("Script error: %v", err)
+	}
+	got, _ := result.AsString()
+	if want := "read,base,conn"; got != want {
+		t.Errorf("expected %q, got %q", want, got)
+	}
+}
@@ -83,6 +83,46 @@ func (q *RuntimeQueue) put(ctx context.Context, item object.Object) error {
 	}
 }
 
+// putMany appends items in order, taking the lock once for as many items as
+// fit rather than once per item. On a bounded queue it blocks for space like
+// put, so the batch may be delivered across several wake-ups.
+func (q *RuntimeQueue) putMany(ctx context.Context, items []object.Object) error {
+	for len(items) > 0 {
+		q.mu.Lock()
+		if q.closed {
+			q.mu.Unlock()
+			return fmt.Errorf("queue is closed")
+		}
+		n := len(items)
+		if q.maxsize > 0 {
+			n = min(n, q.maxsize-len(q.items))
+		}
+		if n > 0 {
+			q.items = append(q.items, items[:n]...)
+			items = items[n:]
+			q.signalGet()
+		}
+		q.mu.Unlock()
+		if len(items) == 0 {
+			return nil
+		}
+
+		var canceled bool
+		object.RunBlocking(ctx, func() {
+			select {
+			case <-ctx.Done():
+				canceled = true
+			case <-q.putCh:
+				// Space may be available, retry
+			}
+		})
+		if canceled {
+			return ctx.Err()
+		}
+	}
+	return nil
+}
+
 func (q *RuntimeQueue) get(ctx context.Context) (object.Object, error) {
 	for {
 		q.mu.Lock()
@@ -90,10 +130,17 @@ func (q *RuntimeQueue) get(ctx context.Context) (object.Object, error) {
 			item := q.items[0]
 			q.items = q.items[1:]
 			q.signalPut()
+			// getCh holds a single wake-up, so a batch from putMany wakes one
+			// consumer; pass it on while items remain for the others.
+			if len(q.items) > 0 {
+				q.signalGet()
+			}
 			q.mu.Unlock()
 			return item, nil
 		}
 		if q.closed {
+			// Likewise pass on close's wake-up to any other waiting consumer.
+			q.signalGet()
 			q.mu.Unlock()
 			return nil, fmt.Errorf("queue is closed")
 		}
@@ -296,6 +343,27 @@ Example:
 						},
 						HelpText: "put(item) - Add item to queue (blocks if full, respects context timeout)",
 					},
+					"put_many": &object.Builtin{
+						Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+							if err := errors.ExactArgs(args, 1); err != nil {
+								return err
+							}
+							var items []object.Object
+							switch v := args[0].(type) {
+							case *object.List:
+								items = v.Elements
+							case *object.Tuple:
+								items = v.Elements
+							default:
+								return errors.NewTypeError("list or tuple", args[0].Type().String())
+							}
+							if err := queue.putMany(ctx, items); err != nil {
+								return errors.NewError("queue error: %v", err)
+							}
+							return &object.Null{}
+						},
+						HelpText: "put_many(items) - Add each item of a list or tuple to the queue in order (blocks while full, respects context timeout)",
+					},
 					"get": &object.Builtin{
 						Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
 							item, err := queue.get(ctx)
@@ -333,8 +401,7 @@ Example:
     queue = runtime.sync.Queue("jobs", maxsize=100)
 
     def producer():
-        for i in range(10):
-            queue.put(i)
+        queue.put_many(list(range(10)))
 
     def consumer():
         for i in range(10):
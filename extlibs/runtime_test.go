@@ -541,6 +541,90 @@ s2 = queue.size()
 	}
 }
 
+func TestRuntimeSyncQueuePutMany(t *testing.T) {
+	ResetRuntime()
+	p := scriptling.New()
+	RegisterRuntimeLibraryAll(p, nil)
+
+	script := `
+import scriptling.runtime as runtime
+
+queue = runtime.sync.Queue("test_put_many", maxsize=10)
+queue.put(0)
+queue.put_many([1, 2, 3])
+queue.put_many((4, 5))
+s = queue.size()
+[s, queue.get(), queue.get(), queue.get(), queue.get(), queue.get(), queue.get()]
+`
+
+	result, err := p.Eval(script)
+	if err != nil {
+		t.Fatalf("Script error: %v", err)
+	}
+
+	list, ok := result.(*object.List)
+	if !ok {
+		t.Fatalf("Expected list, got %T", result)
+	}
+	for i, want := range []int64{6, 0, 1, 2, 3, 4, 5} {
+		if got, _ := list.Elements[i].AsInt(); got != want {
+			t.Errorf("element %d: expected %d, got %d", i, want, got)
+		}
+	}
+}
+
+func TestRuntimeQueuePutManyWaitsForSpace(t *testing.T) {
+	q := newRuntimeQueue(2)
+	done := make(chan error, 1)
+	go func() {
+		done <- q.putMany(context.Background(), []object.Object{
+			object.NewInteger(1), object.NewInteger(2), object.NewInteger(3),
+		})
+	}()
+
+	for i := int64(1); i <= 3; i++ {
+		item, err := q.get(context.Background())
+		if err != nil {
+			t.Fatalf("get: %v", err)
+		}
+		if got, _ := item.AsInt(); got != i {
+			t.Errorf("expected %d, got %d", i, got)
+		}
+	}
+	if err := <-done; err != nil {
+		t.Fatalf("putMany: %v", err)
+	}
+}
+
+func TestRuntimeQueuePutManyWakesEveryConsumer(t *testing.T) {
+	q := newRuntimeQueue(0)
+	got := make(chan object.Object, 2)
+	for range 2 {
+		go func() {
+			item, err := q.get(context.Background())
+			if err != nil {
+				t.Errorf("get: %v", err)
+			}
+			got <- item
+		}()
+	}
+	// Let both consumers block on the empty queue before the batch arrives.
+	time.Sleep(50 * time.Millisecond)
+
+	if err := q.putMany(context.Background(), []object.Object{
+		object.NewInteger(1), object.NewInteger(2),
+	}); err != nil {
+		t.Fatalf("putMany: %v", err)
+	}
+	for i := 0; i < 2; i++ {
+		select {
+		case <-got:
+		case <-time.After(2 * time.Second):
+			t.Fatalf("consumer %d was not woken with items queued (size=%d)", i+1, q.size())
+		}
+	}
+}
+
 func TestRuntimeSyncAtomicDefaultDelta(t *testing.T) {
 	ResetRuntime()
 	p := scriptling.New()
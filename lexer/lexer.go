@@ -545,7 +545,22 @@ func (l *Lexer) readNumber() (string, bool) {
 }
 
 func (l *Lexer) readString(quote byte) string {
-	// l.ch is opening quote
+	// l.ch is opening quote. Most literals ("a", "name") contain no escapes:
+	// their value is then exactly the source bytes, so return a substring of
+	// the input (as identifiers do) instead of copying it byte by byte.
+	start := l.position + 1
+	for i := start; i < len(l.input); i++ {
+		c := l.input[i]
+		if c == quote {
+			l.readPosition = i + 1
+			l.readChar() // consume closing quote
+			return l.input[start:i]
+		}
+		if c == '\\' || c == 0 {
+			break
+		}
+	}
+
 	l.readChar() // move to first content char
 	var result strings.Builder
 	for l.ch != quote && l.ch != 0 {
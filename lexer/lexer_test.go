@@ -109,6 +109,25 @@ func TestStrings(t *testing.T) {
 	}
 }
 
+func TestStringEscapesAndPlainLiterals(t *testing.T) {
+	input := `"plain" 'a\tb' "say \"hi\"" "" 'x' "tail\\"`
+	expected := []string{"plain", "a\tb", `say "hi"`, "", "x", `tail\`}
+
+	l := New(input)
+	for i, want := range expected {
+		tok := l.NextToken()
+		if tok.Type != token.STRING {
+			t.Fatalf("tests[%d] - tokentype wrong. expected=%q, got=%q", i, token.STRING, tok.Type)
+		}
+		if tok.Literal != want {
+			t.Fatalf("tests[%d] - literal wrong. expected=%q, got=%q", i, want, tok.Literal)
+		}
+	}
+	if tok := l.NextToken(); tok.Type != token.EOF {
+		t.Fatalf("expected EOF, got %q (%q)", tok.Type, tok.Literal)
+	}
+}
+
 func TestNumbers(t *testing.T) {
 	input := `42 3.14 0 100.5`
 
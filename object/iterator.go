@@ -1,11 +1,18 @@
 package object
 
+import "math"
+
 // Iterator represents a Python-style iterator
 type Iterator struct {
 	next     func() (Object, bool) // Returns (value, hasNext)
 	consumed bool                  // Track if iterator has been exhausted
+	lenHint  func() int            // Values left, for iterators that know it
 }
 
+// maxLenHintPrealloc caps how many slots a consumer preallocates from a
+// LenHint, so a huge range that fails early does not reserve gigabytes.
+const maxLenHintPrealloc = 1 << 24
+
 // IterableToSlice converts any iterable object (List, Tuple, String, Iterator, Set) to a slice of Objects.
 // Returns (elements, ok) where ok is true if the conversion succeeded.
 // For strings, each character becomes a String object.
@@ -30,7 +37,7 @@ func IterableToSlice(obj Object) ([]Object, bool) {
 		}
 		return elements, true
 	case *Iterator:
-		elements := make([]Object, 0)
+		elements := make([]Object, 0, iter.PreallocHint())
 		for {
 			val, hasNext := iter.Next()
 			if !hasNext {
@@ -119,6 +126,28 @@ func (it *Iterator) Next() (Object, bool) {
 	return val, hasNext
 }
 
+// LenHint returns how many values are left in the iterator, or -1 if that is
+// not known in advance.
+func (it *Iterator) LenHint() int {
+	if it.consumed {
+		return 0
+	}
+	if it.lenHint == nil {
+		return -1
+	}
+	return it.lenHint()
+}
+
+// PreallocHint returns a capacity to reserve for collecting the iterator's
+// remaining values: LenHint when known, capped, and 0 otherwise.
+func (it *Iterator) PreallocHint() int {
+	n := it.LenHint()
+	if n < 0 {
+		return 0
+	}
+	return min(n, maxLenHintPrealloc)
+}
+
 // NewIterator creates an iterator with a custom next function
 // This allows creating iterators that can call functions with proper context
 func NewIterator(nextFn func() (Object, bool)) *Iterator {
@@ -127,6 +156,24 @@ func NewIterator(nextFn func() (Object, bool)) *Iterator {
 	}
 }
 
+// NewSliceIterator creates an iterator over elements, which it takes ownership
+// of. Unlike a NewIterator closure it reports its remaining length, so
+// collecting it with list() sizes the result exactly.
+func NewSliceIterator(elements []Object) *Iterator {
+	index := 0
+	return &Iterator{
+		next: func() (Object, bool) {
+			if index >= len(elements) {
+				return nil, false
+			}
+			val := elements[index]
+			index++
+			return val, true
+		},
+		lenHint: func() int { return len(elements) - index },
+	}
+}
+
 // RangeIterator creates an iterator for range(start, stop, step)
 func NewRangeIterator(start, stop, step int64) *Iterator {
 	current := start
@@ -147,7 +194,27 @@ func NewRangeIterator(start, stop, step int64) *Iterator {
 			current += step
 			return val, true
 		},
+		lenHint: func() int { return RangeLen(current, stop, step) },
+	}
+}
+
+// RangeLen returns the number of values range(start, stop, step) yields,
+// saturating at the largest int.
+func RangeLen(start, stop, step int64) int {
+	var span, stride uint64
+	switch {
+	case step > 0 && start < stop:
+		span, stride = uint64(stop)-uint64(start), uint64(step)
+	case step < 0 && start > stop:
+		span, stride = uint64(start)-uint64(stop), -uint64(step)
+	default:
+		return 0
+	}
+	n := (span-1)/stride + 1
+	if n > uint64(math.MaxInt) {
+		return math.MaxInt
 	}
+	return int(n)
 }
 
 // ZipIterator creates an iterator that zips multiple iterables together
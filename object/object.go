@@ -7,6 +7,7 @@ import (
 	"encoding/hex"
 	"fmt"
 	"io"
+	"maps"
 	"math"
 	"os"
 	"reflect"
@@ -167,6 +168,30 @@ const (
 	ExceptionTypeGeneric           = "" // Default for legacy compatibility
 )
 
+// exceptionParents maps an exception type name to the name of its base type so
+// that `except Base:` also catches subclasses, e.g. requests.ReadTimeout is
+// caught by `except requests.Timeout:` and `except requests.RequestException:`.
+var (
+	exceptionParentsMu sync.RWMutex
+	exceptionParents   = map[string]string{}
+)
+
+// RegisterExceptionParent records that exception type child derives from parent.
+// Libraries call it from init to describe their exception hierarchy.
+func RegisterExceptionParent(child, parent string) {
+	exceptionParentsMu.Lock()
+	exceptionParents[child] = parent
+	exceptionParentsMu.Unlock()
+}
+
+// ExceptionParent returns the registered base type of name, or "" if none.
+func ExceptionParent(name string) string {
+	exceptionParentsMu.RLock()
+	parent := exceptionParents[name]
+	exceptionParentsMu.RUnlock()
+	return parent
+}
+
 // Small integer cache for common values (-5 to 10000)
 
 // Break and Continue singletons (like NULL, TRUE, FALSE)
@@ -183,6 +208,7 @@ func init() {
 	// Initialize the small integer dict-key cache ("n:0".."n:N").
 	for i := range smallDictKeys {
 		smallDictKeys[i] = "n:" + strconv.Itoa(i)
+		smallIntStrings[i].value = smallDictKeys[i][2:]
 	}
 }
 
@@ -207,6 +233,29 @@ func intDictKey(v int64) string {
 	return string(b)
 }
 
+// smallIntStrings caches the String form of small non-negative integers, which
+// str() produces constantly for counters and status codes. The text shares its
+// backing bytes with smallDictKeys.
+var smallIntStrings [smallDictKeyMax]String
+
+// intText returns the decimal text of v without allocating for small
+// non-negative values; strconv only avoids the allocation below 100.
+func intText(v int64) string {
+	if v >= 0 && v < smallDictKeyMax {
+		return smallIntStrings[v].value
+	}
+	return strconv.FormatInt(v, 10)
+}
+
+// NewIntegerString returns the decimal String for v, cached for small
+// non-negative values.
+func NewIntegerString(v int64) *String {
+	if v >= 0 && v < smallDictKeyMax {
+		return &smallIntStrings[v]
+	}
+	return &String{value: strconv.FormatInt(v, 10)}
+}
+
 // NewInteger returns a cached integer for small values, or a new Integer for larger values
 func NewInteger(val int64) *Integer {
 	if val >= smallIntMin && val <= smallIntMax {
@@ -357,7 +406,7 @@ type Integer struct {
 func (i *Integer) IntValue() int64 { return i.value }
 
 func (i *Integer) Type() ObjectType { return INTEGER_OBJ }
-func (i *Integer) Inspect() string  { return strconv.FormatInt(i.value, 10) }
+func (i *Integer) Inspect() string  { return intText(i.value) }
 
 func (i *Integer) AsString() (string, Object)          { return "", errMustBeString }
 func (i *Integer) AsInt() (int64, Object)              { return i.value, nil }
@@ -490,6 +539,16 @@ func NewBytes(b []byte) *Bytes {
 	return &Bytes{value: cp}
 }
 
+// NewBytesOwned returns a Bytes object that takes ownership of b without
+// copying it. Use it for freshly allocated buffers, such as a body read from
+// the network; the caller must not modify b afterwards.
+func NewBytesOwned(b []byte) *Bytes {
+	if b == nil {
+		b = []byte{}
+	}
+	return &Bytes{value: b}
+}
+
 // NewBytesFromString returns a Bytes object whose contents are the UTF-8
 // encoding of s. This is the equivalent of Python's str.encode("utf-8").
 func NewBytesFromString(s string) *Bytes {
@@ -689,6 +748,17 @@ type Function struct {
 	LocalSlotNames   []string
 	ParamSlotIndexes []int
 	ReuseCallEnv     bool
+	// FieldInits is set for an __init__ whose body only copies parameters into
+	// fields of self. Constructing an instance can then fill the fields
+	// directly instead of running the body in a new frame. Nil otherwise.
+	FieldInits []FieldInit
+}
+
+// FieldInit is one `self.<Field> = <parameter>` statement of a trivial
+// __init__. Param indexes the call arguments, not counting self.
+type FieldInit struct {
+	Field string
+	Param int
 }
 
 func (f *Function) Type() ObjectType { return FUNCTION_OBJ }
@@ -716,6 +786,14 @@ type LambdaFunction struct {
 	LocalSlots       map[string]int
 	LocalSlotNames   []string
 	ParamSlotIndexes []int
+	ReuseCallEnv     bool
+}
+
+// IsPositionalOnly reports whether a call with nargs positional arguments and
+// no keywords can bind every parameter straight into its slot.
+func (lf *LambdaFunction) IsPositionalOnly(nargs int) bool {
+	return nargs == len(lf.Parameters) && nargs == len(lf.ParamSlotIndexes) &&
+		lf.Variadic == nil && lf.Kwargs == nil && lf.KeywordOnlyStart == 0 && len(lf.DefaultValues) == 0
 }
 
 func (lf *LambdaFunction) Type() ObjectType { return LAMBDA_OBJ }
@@ -914,8 +992,8 @@ type Environment struct {
 	callPoolSlots              uint8
 	outer                      *Environment
 	root                       *Environment
-	globals                    map[string]bool
-	nonlocals                  map[string]bool
+	globals                    []string // names declared global in this scope
+	nonlocals                  []string // names declared nonlocal in this scope
 	importedBindings           map[string]bool
 	output                     io.Writer
 	input                      io.Reader
@@ -1210,12 +1288,8 @@ func ReleaseCallEnvironment(env *Environment) {
 	if env.store != nil {
 		clear(env.store)
 	}
-	if env.globals != nil {
-		clear(env.globals)
-	}
-	if env.nonlocals != nil {
-		clear(env.nonlocals)
-	}
+	env.globals = env.globals[:0]
+	env.nonlocals = env.nonlocals[:0]
 	if env.importedBindings != nil {
 		clear(env.importedBindings)
 	}
@@ -1399,6 +1473,79 @@ func (e *Environment) GetAtLocation(hops, slotIdx int, name string) (Object, boo
 	return nil, false
 }
 
+// OuterLocation reports where name lives when it is bound in an enclosing
+// scope rather than this one: hops outer links up, at slot slotIdx. The result
+// is valid both for reads (Get) and for global/nonlocal writes (Set), so ok is
+// false whenever the two could disagree or the location could move: the name is
+// declared in this scope, is held in a store map, is declared global here but
+// bound below the root, or is not bound at all.
+func (e *Environment) OuterLocation(name string) (hops, slotIdx int, ok bool) {
+	for env := e; env != nil; env = env.outer {
+		if idx, found := env.slotIndex[name]; found {
+			if hops == 0 || idx < 0 || idx >= len(env.slots) || (env != e.root && e.IsGlobal(name)) {
+				return 0, -1, false
+			}
+			return hops, idx, true
+		}
+		if _, found := env.store[name]; found {
+			return 0, -1, false
+		}
+		hops++
+	}
+	return 0, -1, false
+}
+
+// GetAtOuterLocation reads the value at a location previously returned by
+// OuterLocation. Unlike GetAtLocation it also checks the store maps of the
+// scopes it skips, which are the only place a nearer binding can appear after
+// the location was cached. Returns false if the cache is stale.
+func (e *Environment) GetAtOuterLocation(hops, slotIdx int, name string) (Object, bool) {
+	env := e.outerAt(hops, name)
+	if env == nil {
+		return nil, false
+	}
+	if slotIdx >= 0 && slotIdx < len(env.slots) && slotIdx < len(env.slotNames) && env.slotNames[slotIdx] == name {
+		if v := env.slots[slotIdx]; v != nil {
+			return v, true
+		}
+	}
+	return nil, false
+}
+
+// SetAtOuterLocation stores val at a location previously returned by
+// OuterLocation, with the same staleness checks as GetAtOuterLocation. Returns
+// false if the cache is stale, falling through to the full Set path.
+func (e *Environment) SetAtOuterLocation(hops, slotIdx int, name string, val Object) bool {
+	env := e.outerAt(hops, name)
+	if env == nil {
+		return false
+	}
+	if slotIdx >= 0 && slotIdx < len(env.slots) && slotIdx < len(env.slotNames) && env.slotNames[slotIdx] == name {
+		env.slots[slotIdx] = val
+		env.clearImportedBinding(name)
+		return true
+	}
+	return false
+}
+
+// outerAt walks hops outer links, returning nil if the chain is too short or a
+// skipped scope has since bound name in its store map.
+func (e *Environment) outerAt(hops int, name string) *Environment {
+	env := e
+	for i := 0; i < hops; i++ {
+		if env == nil {
+			return nil
+		}
+		if len(env.store) != 0 {
+			if _, shadowed := env.store[name]; shadowed {
+				return nil
+			}
+		}
+		env = env.outer
+	}
+	return env
+}
+
 // GetSlotByIndex returns the value at the given slot index.
 // Returns (value, true) if the slot has a value, (nil, false) otherwise.
 func (e *Environment) GetSlotByIndex(idx int) (Object, bool) {
@@ -1492,11 +1639,11 @@ func (e *Environment) clearImportedBinding(name string) {
 
 func (e *Environment) Set(name string, val Object) Object {
 	// Check if this variable is marked as global
-	if e.globals != nil && e.globals[name] {
+	if len(e.globals) != 0 && containsName(e.globals, name) {
 		return e.SetGlobal(name, val)
 	}
 	// Check if this variable is marked as nonlocal
-	if e.nonlocals != nil && e.nonlocals[name] {
+	if len(e.nonlocals) != 0 && containsName(e.nonlocals, name) {
 		if e.SetInParent(name, val) {
 			return val
 		}
@@ -1566,18 +1713,30 @@ func (e *Environment) SetInParent(name string, val Object) bool {
 
 // MarkGlobal marks a variable name as global in this scope
 func (e *Environment) MarkGlobal(name string) {
-	if e.globals == nil {
-		e.globals = make(map[string]bool, 2)
+	if !containsName(e.globals, name) {
+		e.globals = append(e.globals, name)
 	}
-	e.globals[name] = true
 }
 
 // MarkNonlocal marks a variable name as nonlocal in this scope
 func (e *Environment) MarkNonlocal(name string) {
-	if e.nonlocals == nil {
-		e.nonlocals = make(map[string]bool, 2)
+	if !containsName(e.nonlocals, name) {
+		e.nonlocals = append(e.nonlocals, name)
 	}
-	e.nonlocals[name] = true
+}
+
+// containsName reports whether name is in names. A scope declares only a
+// handful of global or nonlocal names, and they are checked on every
+// assignment, so a linear scan beats hashing; the slices also keep their
+// backing arrays when a pooled call frame is reused, so re-running a global
+// statement does not allocate.
+func containsName(names []string, name string) bool {
+	for _, n := range names {
+		if n == name {
+			return true
+		}
+	}
+	return false
 }
 
 // MarkImportedBinding marks a local binding as coming from an import.
@@ -1595,12 +1754,12 @@ func (e *Environment) IsImportedBinding(name string) bool {
 
 // IsGlobal checks if a variable is marked as global
 func (e *Environment) IsGlobal(name string) bool {
-	return e.globals != nil && e.globals[name]
+	return containsName(e.globals, name)
 }
 
 // IsNonlocal checks if a variable is marked as nonlocal
 func (e *Environment) IsNonlocal(name string) bool {
-	return e.nonlocals != nil && e.nonlocals[name]
+	return containsName(e.nonlocals, name)
 }
 
 // EnableOutputCapture enables output capture for this environment
@@ -1977,6 +2136,16 @@ func (d *Dict) SetByString(name string, value Object) {
 	d.Pairs[DictStringKey(name)] = DictPair{Key: &String{value: name}, Value: value}
 }
 
+// Copy returns a shallow copy of the dict. The pairs map is cloned wholesale
+// rather than re-inserted entry by entry.
+func (d *Dict) Copy() *Dict {
+	pairs := maps.Clone(d.Pairs)
+	if pairs == nil {
+		pairs = make(map[string]DictPair)
+	}
+	return &Dict{Pairs: pairs}
+}
+
 // HasByString checks if a string key exists in the dict.
 func (d *Dict) HasByString(name string) bool {
 	_, ok := d.Pairs[DictStringKey(name)]
@@ -2140,8 +2309,10 @@ func (c *Class) InvalidateLookupCache() {
 
 // inlineFieldCap is how many fields an Instance stores inline before spilling to
 // the overflow map. Most instances have only a handful of fields, so this keeps
-// the common case allocation-free (no map allocated at all).
-const inlineFieldCap = 4
+// the common case allocation-free (no map allocated at all). Eight covers the
+// typical record-style class (a context object with a few derived fields);
+// Scriptling has no __slots__, so this is the only per-instance layout knob.
+const inlineFieldCap = 8
 
 type Instance struct {
 	Class *Class
@@ -2216,6 +2387,25 @@ func (i *Instance) GetField(name string) (Object, bool) {
 	return nil, false
 }
 
+// GetFieldHint is GetField for call sites that remember where a field was last
+// found. hint is an inline slot index to try first (-1 for none); the returned
+// slot is where the field was found, or -1 if it is not stored inline.
+func (i *Instance) GetFieldHint(name string, hint int) (Object, int, bool) {
+	if hint >= 0 && hint < i.inlineLen && i.inlineKeys[hint] == name {
+		return i.inlineVals[hint], hint, true
+	}
+	for n := 0; n < i.inlineLen; n++ {
+		if i.inlineKeys[n] == name {
+			return i.inlineVals[n], n, true
+		}
+	}
+	if i.overflow != nil {
+		v, ok := i.overflow[name]
+		return v, -1, ok
+	}
+	return nil, -1, false
+}
+
 // Field returns the value of the named field, or nil if it is not set. It is a
 // convenience for callers that immediately type-assert or coerce a field known
 // to exist; use GetField when you need to distinguish "absent" from "nil".
@@ -2339,6 +2529,19 @@ func (i *Instance) GetBoundMethod(name string, method Object) *BoundMethod {
 	return bound
 }
 
+// Clone returns a new instance of the same class holding the same field values
+// (a shallow copy). The inline field arrays are copied as a block; the bound
+// method cache and NativeData are not carried over.
+func (i *Instance) Clone() *Instance {
+	return &Instance{
+		Class:      i.Class,
+		inlineKeys: i.inlineKeys,
+		inlineVals: i.inlineVals,
+		inlineLen:  i.inlineLen,
+		overflow:   maps.Clone(i.overflow),
+	}
+}
+
 func (i *Instance) InvalidateBoundMethod(name string) {
 	if i.boundMethodCache == nil {
 		return
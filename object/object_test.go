@@ -2,6 +2,9 @@ package object
 
 import (
 	"context"
+	"fmt"
+	"math"
+	"strconv"
 	"testing"
 
 	"github.com/paularlott/scriptling/ast"
@@ -893,6 +896,59 @@ func TestRangeIteratorDescending(t *testing.T) {
 	}
 }
 
+func TestRangeIteratorLenHint(t *testing.T) {
+	tests := []struct {
+		start, stop, step int64
+		want              int
+	}{
+		{0, 5, 1, 5},
+		{0, 10, 3, 4},
+		{10, 0, -3, 4},
+		{5, 5, 1, 0},
+		{5, 0, 1, 0},
+		{0, 5, -1, 0},
+		{math.MinInt64, math.MaxInt64, math.MaxInt64, 3},
+	}
+	for _, tt := range tests {
+		it := NewRangeIterator(tt.start, tt.stop, tt.step)
+		if got := it.LenHint(); got != tt.want {
+			t.Errorf("range(%d, %d, %d).LenHint() = %d, want %d", tt.start, tt.stop, tt.step, got, tt.want)
+		}
+	}
+
+	it := NewRangeIterator(0, 3, 1)
+	it.Next()
+	if got := it.LenHint(); got != 2 {
+		t.Errorf("LenHint after one Next() = %d, want 2", got)
+	}
+	it.Next()
+	it.Next()
+	it.Next()
+	if got := it.LenHint(); got != 0 {
+		t.Errorf("LenHint when exhausted = %d, want 0", got)
+	}
+	if got := NewIterator(func() (Object, bool) { return nil, false }).LenHint(); got != -1 {
+		t.Errorf("LenHint of a plain iterator = %d, want -1", got)
+	}
+}
+
+func TestSliceIteratorLenHint(t *testing.T) {
+	it := NewSliceIterator([]Object{NewInteger(1), NewInteger(2)})
+	if got := it.LenHint(); got != 2 {
+		t.Errorf("LenHint = %d, want 2", got)
+	}
+	if v, ok := it.Next(); !ok || v.(*Integer).IntValue() != 1 {
+		t.Fatalf("first Next() = %v, %v", v, ok)
+	}
+	if got := it.LenHint(); got != 1 {
+		t.Errorf("LenHint after one Next() = %d, want 1", got)
+	}
+	it.Next()
+	if _, ok := it.Next(); ok || it.LenHint() != 0 {
+		t.Errorf("exhausted iterator: ok=%v LenHint=%d", ok, it.LenHint())
+	}
+}
+
 func TestZipIterator(t *testing.T) {
 	list1 := &List{Elements: []Object{
 		NewInteger(1),
@@ -1601,3 +1657,91 @@ func TestGetFloatMatrix(t *testing.T) {
 		t.Fatal("expected ok=false for List")
 	}
 }
+
+func TestInstanceFieldsSpillPastInlineCap(t *testing.T) {
+	instance := NewInstance(&Class{Name: "Wide", Methods: map[string]Object{}})
+	n := inlineFieldCap + 3
+	for i := 0; i < n; i++ {
+		instance.SetField(fmt.Sprintf("f%d", i), NewInteger(int64(i)))
+	}
+	if instance.FieldCount() != n {
+		t.Fatalf("expected %d fields, got %d", n, instance.FieldCount())
+	}
+	for i := 0; i < n; i++ {
+		v, ok := instance.GetField(fmt.Sprintf("f%d", i))
+		if !ok || v.(*Integer).IntValue() != int64(i) {
+			t.Errorf("field f%d: got %v, %v", i, v, ok)
+		}
+	}
+
+	instance.DeleteField("f0")
+	instance.SetField(fmt.Sprintf("f%d", n-1), NewInteger(-1))
+	if instance.HasField("f0") {
+		t.Error("f0 should have been deleted")
+	}
+	if v := instance.Field(fmt.Sprintf("f%d", n-1)); v.(*Integer).IntValue() != -1 {
+		t.Errorf("expected overwritten spilled field to be -1, got %v", v)
+	}
+	if instance.FieldCount() != n-1 {
+		t.Errorf("expected %d fields after delete, got %d", n-1, instance.FieldCount())
+	}
+}
+
+func TestNewBytesOwnedKeepsBuffer(t *testing.T) {
+	buf := []byte("payload")
+	owned := NewBytesOwned(buf)
+	if &owned.BytesValue()[0] != &buf[0] {
+		t.Error("NewBytesOwned should not copy its buffer")
+	}
+	if copied := NewBytes(buf); &copied.BytesValue()[0] == &buf[0] {
+		t.Error("NewBytes should copy its buffer")
+	}
+	if empty := NewBytesOwned(nil); empty.BytesValue() == nil || empty.Len() != 0 {
+		t.Errorf("NewBytesOwned(nil) = %#v, want empty non-nil bytes", empty.BytesValue())
+	}
+}
+
+func TestIntegerInspectMatchesFormatInt(t *testing.T) {
+	for _, v := range []int64{0, 9, 99, 100, 404, smallDictKeyMax - 1, smallDictKeyMax, -1, -100, 1 << 40} {
+		if got, want := NewInteger(v).Inspect(), strconv.FormatInt(v, 10); got != want {
+			t.Errorf("Inspect(%d) = %q, want %q", v, got, want)
+		}
+	}
+}
+
+func TestShallowCopiesAreIndependent(t *testing.T) {
+	instance := NewInstance(&Class{Name: "Wide", Methods: map[string]Object{}})
+	for i := 0; i < inlineFieldCap+2; i++ {
+		instance.SetField(fmt.Sprintf("f%d", i), NewInteger(int64(i)))
+	}
+	clone := instance.Clone()
+	clone.SetField("f0", NewInteger(-1))
+	clone.SetField(fmt.Sprintf("f%d", inlineFieldCap), NewInteger(-1))
+	if v := instance.Field("f0"); v.(*Integer).IntValue() != 0 {
+		t.Errorf("inline field changed on original: %v", v)
+	}
+	if v := instance.Field(fmt.Sprintf("f%d", inlineFieldCap)); v.(*Integer).IntValue() != int64(inlineFieldCap) {
+		t.Errorf("overflow field changed on original: %v", v)
+	}
+	if clone.FieldCount() != instance.FieldCount() {
+		t.Errorf("clone has %d fields, want %d", clone.FieldCount(), instance.FieldCount())
+	}
+
+	dict := NewStringDict(map[string]Object{"a": NewInteger(1)})
+	dictCopy := dict.Copy()
+	dictCopy.SetByString("b", NewInteger(2))
+	if len(dict.Pairs) != 1 || len(dictCopy.Pairs) != 2 {
+		t.Errorf("dict copy not independent: %d / %d pairs", len(dict.Pairs), len(dictCopy.Pairs))
+	}
+	if empty := (&Dict{}).Copy(); empty.Pairs == nil {
+		t.Error("copy of a nil-map dict should have a usable map")
+	}
+
+	set := NewSet()
+	set.add(NewInteger(1))
+	setCopy := set.Copy()
+	setCopy.add(NewInteger(2))
+	if len(set.Elements) != 1 || len(setCopy.Elements) != 2 {
+		t.Errorf("set copy not independent: %d / %d elements", len(set.Elements), len(setCopy.Elements))
+	}
+}
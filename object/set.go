@@ -2,6 +2,7 @@ package object
 
 import (
 	"bytes"
+	"maps"
 	"sort"
 	"strings"
 )
@@ -146,11 +147,11 @@ func (s *Set) IsSuperset(other *Set) bool {
 
 // Copy returns a shallow copy of the set
 func (s *Set) Copy() *Set {
-	result := NewSet()
-	for key, e := range s.Elements {
-		result.AddKeyed(key, e)
+	elements := maps.Clone(s.Elements)
+	if elements == nil {
+		elements = make(map[string]Object)
 	}
-	return result
+	return &Set{Elements: elements}
 }
 
 // CreateIterator returns an iterator for the set
@@ -1495,6 +1495,7 @@ func (p *Parser) parseForStatement() *ast.ForStatement {
 	}
 
 	stmt.Body = p.parseBlockStatement()
+	stmt.AppendTarget = ast.LoopAppendTarget(stmt.Body)
 
 	if p.peekTokenIs(token.ELSE) {
 		p.nextToken()
@@ -1634,6 +1635,14 @@ func (p *Parser) parseLambda() ast.Expression {
 
 	lambda := &ast.Lambda{}
 
+	// Track nested lambdas in the body: a closure created there captures this
+	// lambda's call env, so it must not be returned to the pool.
+	p.nestedFuncStack = append(p.nestedFuncStack, false)
+	defer func() {
+		lambda.HasNestedFunc = p.nestedFuncStack[len(p.nestedFuncStack)-1]
+		p.nestedFuncStack = p.nestedFuncStack[:len(p.nestedFuncStack)-1]
+	}()
+
 	if !p.peekTokenIs(token.COLON) {
 		params, defaults, variadic, kwargs, keywordOnlyStart := p.parseLambdaParameters()
 		lambda.Parameters = params
@@ -1748,42 +1757,48 @@ func (p *Parser) parseDictLiteral() ast.Expression {
 			return dict
 		}
 
-		first := p.parseExpression(LOWEST)
+		if p.curTokenIs(token.POW) {
+			// Dict unpacking: {**other, ...}. A nil key marks the entry.
+			p.nextToken()
+			dict.Pairs = append(dict.Pairs, ast.DictPairLiteral{Value: p.parseExpression(LOWEST)})
+		} else {
+			first := p.parseExpression(LOWEST)
 
-		// Peek past whitespace to determine dict vs set
-		p.skipWhitespace()
-		if p.peekTokenIs(token.FOR) {
-			// Set comprehension: {expr for var in iterable}
-			return p.parseSetComprehension(tok, first)
-		}
+			// Peek past whitespace to determine dict vs set
+			p.skipWhitespace()
+			if p.peekTokenIs(token.FOR) {
+				// Set comprehension: {expr for var in iterable}
+				return p.parseSetComprehension(tok, first)
+			}
 
-		if p.peekTokenIs(token.COMMA) || p.peekTokenIs(token.RBRACE) {
-			// Set literal: {expr, expr, ...} or {expr}
-			return p.parseSetLiteralFrom(tok, first)
-		}
+			if p.peekTokenIs(token.COMMA) || p.peekTokenIs(token.RBRACE) {
+				// Set literal: {expr, expr, ...} or {expr}
+				return p.parseSetLiteralFrom(tok, first)
+			}
 
-		p.skipWhitespace()
-		if !p.expectPeek(token.COLON) {
-			return nil
-		}
+			p.skipWhitespace()
+			if !p.expectPeek(token.COLON) {
+				return nil
+			}
 
-		p.nextToken()
-		// Skip whitespace after colon
-		for p.curTokenIs(token.NEWLINE) || p.curTokenIs(token.INDENT) || p.curTokenIs(token.DEDENT) {
 			p.nextToken()
-		}
+			// Skip whitespace after colon
+			for p.curTokenIs(token.NEWLINE) || p.curTokenIs(token.INDENT) || p.curTokenIs(token.DEDENT) {
+				p.nextToken()
+			}
 
-		value := p.parseExpression(LOWEST)
+			value := p.parseExpression(LOWEST)
 
-		// Check for dict comprehension: {k: v for ...}
-		if p.peekTokenIs(token.FOR) {
-			return p.parseDictComprehension(tok, first, value)
-		}
+			// Check for dict comprehension: {k: v for ...}
+			if p.peekTokenIs(token.FOR) {
+				return p.parseDictComprehension(tok, first, value)
+			}
 
-		dict.Pairs = append(dict.Pairs, ast.DictPairLiteral{
-			Key:   first,
-			Value: value,
-		})
+			dict.Pairs = append(dict.Pairs, ast.DictPairLiteral{
+				Key:   first,
+				Value: value,
+			})
+		}
 
 		p.skipWhitespace()
 		if !p.peekTokenIs(token.COMMA) {
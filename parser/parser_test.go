@@ -481,6 +481,35 @@ func TestDictLiteral(t *testing.T) {
 	}
 }
 
+func TestDictLiteralUnpacking(t *testing.T) {
+	input := `{"a": 1, **other, "b": 2}`
+
+	l := lexer.New(input)
+	p := New(l)
+	program := p.ParseProgram()
+	checkParserErrors(t, p)
+
+	stmt, ok := program.Statements[0].(*ast.ExpressionStatement)
+	if !ok {
+		t.Fatalf("program.Statements[0] is not ast.ExpressionStatement")
+	}
+
+	dict, ok := stmt.Expression.(*ast.DictLiteral)
+	if !ok {
+		t.Fatalf("stmt.Expression is not ast.DictLiteral. got=%T", stmt.Expression)
+	}
+
+	if len(dict.Pairs) != 3 {
+		t.Fatalf("dict.Pairs length not 3. got=%d", len(dict.Pairs))
+	}
+	if dict.Pairs[1].Key != nil {
+		t.Errorf("unpacked entry should have a nil key. got=%T", dict.Pairs[1].Key)
+	}
+	if ident, ok := dict.Pairs[1].Value.(*ast.Identifier); !ok || ident.Value() != "other" {
+		t.Errorf("unpacked entry value is not identifier 'other'. got=%T", dict.Pairs[1].Value)
+	}
+}
+
 func TestWhileStatement(t *testing.T) {
 	input := `while True:
     pass`
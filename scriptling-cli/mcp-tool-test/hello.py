@@ -4,12 +4,9 @@ import scriptling.mcp.tool as tool
 name = tool.get_string("name", "World")
 times = tool.get_int("times", 1)
 
-# Generate greeting
-greetings = []
-for i in range(times):
-    greetings.append(f"Hello, {name}!")
-
-result = "\n".join(greetings)
+# Generate greeting once; it doesn't vary between repetitions
+greeting = f"Hello, {name}!"
+result = "\n".join([greeting] * times)
 
 # Return result
 tool.return_string(result)
@@ -462,17 +462,32 @@ func parseProgramCached(input string) (*ast.Program, error) {
 		return program, nil
 	}
 
-	program, err := parseProgramUncached(input)
-	if err != nil {
-		return nil, err
+	// Interpreters started together (pools, background tasks, parallel test
+	// runs) tend to miss on the same script at the same moment; let one of
+	// them parse it and hand the result to the rest.
+	call, leader := beginParse(key)
+	if !leader {
+		<-call.done
+		return call.program, call.err
+	}
+	defer endParse(key, call)
+	// A previous leader may have finished between our miss and beginParse.
+	if _, program, ok := GetKey(input); ok {
+		call.program = program
+		return program, nil
+	}
+
+	call.program, call.err = parseProgramUncached(input)
+	if call.err != nil {
+		return nil, call.err
 	}
 
 	if key != (cacheKey{}) {
-		SetWithKey(key, input, program)
+		SetWithKey(key, input, call.program)
 	} else {
-		Set(input, program)
+		Set(input, call.program)
 	}
-	return program, nil
+	return call.program, nil
 }
 
 func parseProgramUncached(input string) (*ast.Program, error) {
@@ -3,6 +3,7 @@ package stdlib
 import (
 	"context"
 	"encoding/base64"
+	"unsafe"
 
 	"github.com/paularlott/scriptling/errors"
 	"github.com/paularlott/scriptling/object"
@@ -15,12 +16,16 @@ var Base64Library = object.NewLibrary(Base64LibraryName, map[string]*object.Buil
 				return err
 			}
 			// Accept Bytes (preferred) or String (encoded as UTF-8) as input.
-			data, errObj := coerceToBytes(args[0])
-			if errObj != nil {
-				return errObj
+			var data []byte
+			if str, ok := args[0].(*object.String); ok {
+				data = stringBytes(str.StringValue())
+			} else {
+				var errObj object.Object
+				if data, errObj = coerceToBytes(args[0]); errObj != nil {
+					return errObj
+				}
 			}
-			encoded := base64.StdEncoding.EncodeToString(data)
-			return object.NewString(encoded)
+			return object.NewString(base64Encode(data))
 		},
 		HelpText: `b64encode(s) - Encode bytes-like object to Base64
 
@@ -32,19 +37,42 @@ representation as a string.`,
 			if err := errors.ExactArgs(args, 1); err != nil {
 				return err
 			}
-			str, err := args[0].AsString()
-			if err != nil {
-				return err
+			var src []byte
+			switch arg := args[0].(type) {
+			case *object.String:
+				src = stringBytes(arg.StringValue())
+			case *object.Bytes:
+				src = arg.BytesValue()
+			default:
+				return errors.NewTypeError("STRING or BYTES", args[0].Type().String())
 			}
-			decoded, decodeErr := base64.StdEncoding.DecodeString(str)
+			decoded := make([]byte, base64.StdEncoding.DecodedLen(len(src)))
+			n, decodeErr := base64.StdEncoding.Decode(decoded, src)
 			if decodeErr != nil {
 				return errors.NewError("base64 decode error: %s", decodeErr.Error())
 			}
-			return object.NewBytes(decoded)
+			return object.NewBytes(decoded[:n])
 		},
-		HelpText: `b64decode(s) - Decode a Base64 encoded string
+		HelpText: `b64decode(s) - Decode a Base64 encoded string or bytes value
 
 Returns the decoded bytes as a Bytes value. Use .decode() on the result to
 obtain a string when the underlying data is text.`,
 	},
 }, nil, "Base64 encoding and decoding library")
+
+// stringBytes returns a read-only view of the bytes of s. The encoder and
+// decoder only read their input, so this avoids copying the whole payload.
+func stringBytes(s string) []byte {
+	return unsafe.Slice(unsafe.StringData(s), len(s))
+}
+
+// base64Encode encodes data into a freshly allocated buffer and hands that
+// buffer to the result string directly; EncodeToString would copy it again.
+func base64Encode(data []byte) string {
+	if len(data) == 0 {
+		return ""
+	}
+	buf := make([]byte, base64.StdEncoding.EncodedLen(len(data)))
+	base64.StdEncoding.Encode(buf, data)
+	return unsafe.String(&buf[0], len(buf))
+}
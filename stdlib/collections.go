@@ -2,9 +2,11 @@ package stdlib
 
 import (
 	"context"
+	"slices"
 	"sort"
 	"strconv"
 	"strings"
+	"unicode/utf8"
 
 	"github.com/paularlott/scriptling/errors"
 	"github.com/paularlott/scriptling/object"
@@ -29,30 +31,15 @@ var CounterClass = &object.Class{
 					return err
 				}
 
-				// Helper to increment counter for a key
-				countKey := func(key string) {
-					if countObj, exists := counter.GetField(key); exists {
-						if count, ok := countObj.(*object.Integer); ok {
-							counter.SetField(key, object.NewInteger(count.IntValue()+1))
-						}
-					} else {
-						counter.SetField(key, object.NewInteger(1))
-					}
-				}
-
 				// Process the iterable argument
 				switch arg := args[1].(type) {
 				case *object.List:
-					for _, elem := range arg.Elements {
-						countKey(elem.Inspect())
-					}
+					countElements(counter, arg.Elements)
 				case *object.Tuple:
-					for _, elem := range arg.Elements {
-						countKey(elem.Inspect())
-					}
+					countElements(counter, arg.Elements)
 				case *object.String:
-					for _, ch := range arg.StringValue() {
-						countKey(string(ch))
+					if !countASCII(counter, arg.StringValue()) {
+						countRunes(counter, arg.StringValue())
 					}
 				case *object.Dict:
 					// Copy existing dict - convert to counter fields
@@ -272,6 +259,77 @@ func createCounterInstance() *object.Instance {
 	return object.NewInstanceWithFields(CounterClass, make(map[string]object.Object))
 }
 
+// addCount adds n to the count stored on counter for key. A field that holds
+// something other than an integer is left alone.
+func addCount(counter *object.Instance, key string, n int64) {
+	if existing, ok := counter.GetField(key); ok {
+		if count, ok := existing.(*object.Integer); ok {
+			counter.SetField(key, object.NewInteger(count.IntValue()+n))
+		}
+		return
+	}
+	counter.SetField(key, object.NewInteger(n))
+}
+
+// setCounts adds locally gathered tallies to counter in first-seen order, so
+// each distinct key is boxed and stored once rather than once per occurrence.
+func setCounts(counter *object.Instance, order []string, counts map[string]int64) {
+	for _, key := range order {
+		addCount(counter, key, counts[key])
+	}
+}
+
+// countElements tallies elements by their Inspect() key into counter.
+func countElements(counter *object.Instance, elements []object.Object) {
+	counts := make(map[string]int64)
+	var order []string
+	for _, elem := range elements {
+		key := elem.Inspect()
+		if counts[key] == 0 {
+			order = append(order, key)
+		}
+		counts[key]++
+	}
+	setCounts(counter, order, counts)
+}
+
+// countASCII tallies the characters of an all-ASCII string into counter using
+// a flat histogram indexed by byte, so there is no hashing per character. It
+// reports false, leaving counter untouched, as soon as it meets a non-ASCII
+// byte.
+func countASCII(counter *object.Instance, s string) bool {
+	var hist [utf8.RuneSelf]int64
+	var order []byte
+	for i := 0; i < len(s); i++ {
+		c := s[i]
+		if c >= utf8.RuneSelf {
+			return false
+		}
+		if hist[c] == 0 {
+			order = append(order, c)
+		}
+		hist[c]++
+	}
+	for _, c := range order {
+		addCount(counter, string(c), hist[c])
+	}
+	return true
+}
+
+// countRunes tallies the characters of any string into counter.
+func countRunes(counter *object.Instance, s string) {
+	counts := make(map[string]int64)
+	var order []string
+	for _, ch := range s {
+		key := string(ch)
+		if counts[key] == 0 {
+			order = append(order, key)
+		}
+		counts[key]++
+	}
+	setCounts(counter, order, counts)
+}
+
 // CollectionsLibrary provides Python-like collections functions
 var CollectionsLibrary = object.NewLibrary(CollectionsLibraryName, map[string]*object.Builtin{
 	"Counter": {
@@ -288,37 +346,12 @@ var CollectionsLibrary = object.NewLibrary(CollectionsLibraryName, map[string]*o
 
 			switch arg := args[0].(type) {
 			case *object.List:
-				for _, elem := range arg.Elements {
-					key := elem.Inspect()
-					if countObj, exists := counter.GetField(key); exists {
-						if count, ok := countObj.(*object.Integer); ok {
-							counter.SetField(key, object.NewInteger(count.IntValue()+1))
-						}
-					} else {
-						counter.SetField(key, object.NewInteger(1))
-					}
-				}
+				countElements(counter, arg.Elements)
 			case *object.Tuple:
-				for _, elem := range arg.Elements {
-					key := elem.Inspect()
-					if countObj, exists := counter.GetField(key); exists {
-						if count, ok := countObj.(*object.Integer); ok {
-							counter.SetField(key, object.NewInteger(count.IntValue()+1))
-						}
-					} else {
-						counter.SetField(key, object.NewInteger(1))
-					}
-				}
+				countElements(counter, arg.Elements)
 			case *object.String:
-				for _, ch := range arg.StringValue() {
-					key := string(ch)
-					if countObj, exists := counter.GetField(key); exists {
-						if count, ok := countObj.(*object.Integer); ok {
-							counter.SetField(key, object.NewInteger(count.IntValue()+1))
-						}
-					} else {
-						counter.SetField(key, object.NewInteger(1))
-					}
+				if !countASCII(counter, arg.StringValue()) {
+					countRunes(counter, arg.StringValue())
 				}
 			case *object.Dict:
 				// Copy existing dict - convert to counter fields
@@ -521,10 +554,11 @@ Example:
 			if !ok {
 				return errors.NewTypeError("LIST (deque)", args[0].Type().String())
 			}
-			newElements := make([]object.Object, len(deque.Elements)+1)
-			newElements[0] = args[1]
-			copy(newElements[1:], deque.Elements)
-			deque.Elements = newElements
+			// Shift in place, like list.insert(0, x): append's amortised growth
+			// means repeated appendleft calls don't reallocate every time.
+			deque.Elements = append(deque.Elements, nil)
+			copy(deque.Elements[1:], deque.Elements)
+			deque.Elements[0] = args[1]
 			return &object.Null{}
 		},
 		HelpText: `deque_appendleft(deque, elem) - Add element to left side
@@ -549,6 +583,9 @@ Example:
 				return errors.NewError("popleft from empty deque")
 			}
 			elem := deque.Elements[0]
+			// Clear the vacated slot so the backing array doesn't keep the
+			// popped element alive
+			deque.Elements[0] = nil
 			deque.Elements = deque.Elements[1:]
 			return elem
 		},
@@ -623,12 +660,11 @@ Example:
 				return &object.Null{}
 			}
 
-			// Rotate right by steps
-			newElements := make([]object.Object, len(deque.Elements))
-			splitPoint := len(deque.Elements) - steps
-			copy(newElements, deque.Elements[splitPoint:])
-			copy(newElements[steps:], deque.Elements[:splitPoint])
-			deque.Elements = newElements
+			// Rotate right by steps in place: reversing the whole slice and then
+			// each side of the split point needs no second buffer
+			slices.Reverse(deque.Elements)
+			slices.Reverse(deque.Elements[:steps])
+			slices.Reverse(deque.Elements[steps:])
 			return &object.Null{}
 		},
 		HelpText: `deque_rotate(deque, n) - Rotate deque n steps
@@ -49,8 +49,12 @@ var FunctoolsLibrary = object.NewLibrary(FunctoolsLibraryName, map[string]*objec
 				return errors.NewError("evaluator not available in context")
 			}
 
+			// One argument buffer serves every step: callees copy anything
+			// they keep (varargs), so it is safe to refill between calls.
+			callArgs := make([]object.Object, 2)
 			for i := startIdx; i < len(list.Elements); i++ {
-				result := eval.CallFunction(ctx, fn, []object.Object{accumulator, list.Elements[i]}, nil)
+				callArgs[0], callArgs[1] = accumulator, list.Elements[i]
+				result := eval.CallFunction(ctx, fn, callArgs, nil)
 				if result == nil {
 					return errors.NewError("reduce function returned nil")
 				}
@@ -172,8 +176,13 @@ func reduceWithBuiltin(ctx context.Context, builtin *object.Builtin, args []obje
 		startIdx = 1
 	}
 
+	// Reuse one argument buffer and kwargs value across steps rather than
+	// building a fresh variadic slice per call.
+	callArgs := make([]object.Object, 2)
+	noKwargs := object.NewKwargs(nil)
 	for i := startIdx; i < len(list.Elements); i++ {
-		result := builtin.Fn(ctx, object.NewKwargs(nil), accumulator, list.Elements[i])
+		callArgs[0], callArgs[1] = accumulator, list.Elements[i]
+		result := builtin.Fn(ctx, noKwargs, callArgs...)
 		if result == nil {
 			return errors.NewError("reduce function returned nil")
 		}
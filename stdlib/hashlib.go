@@ -5,6 +5,7 @@ import (
 	"crypto/md5"
 	"crypto/sha1"
 	"crypto/sha256"
+	"encoding"
 	"encoding/hex"
 	"hash"
 
@@ -12,12 +13,22 @@ import (
 	"github.com/paularlott/scriptling/object"
 )
 
-// hashState is the native state held by a Hash instance. It accumulates the
-// input data and remembers the algorithm so that digest/hexdigest can be
-// computed on demand (and copy() yields a true independent copy).
+// hashState is the native state held by a Hash instance: a running Go hash of
+// the input so far (crypto/sha256 and friends use the CPU's SHA instructions
+// where available). Data is hashed as it arrives rather than buffered, so
+// update() does not grow memory and digest() does not rehash everything.
 type hashState struct {
-	data []byte
-	alg  string
+	h   hash.Hash
+	alg string
+}
+
+// clone returns an independent copy of the running hash, for copy(). The
+// standard library hashes all implement BinaryMarshaler/BinaryUnmarshaler.
+func (s *hashState) clone() *hashState {
+	h := hashConstructor(s.alg)()
+	snapshot, _ := s.h.(encoding.BinaryMarshaler).MarshalBinary()
+	h.(encoding.BinaryUnmarshaler).UnmarshalBinary(snapshot)
+	return &hashState{h: h, alg: s.alg}
 }
 
 // hashConstructor returns the Go constructor for the given algorithm name, or
@@ -103,7 +114,7 @@ var HashClass = &object.Class{
 				if errObj != nil {
 					return errObj
 				}
-				state.data = append(state.data, b...)
+				state.h.Write(b)
 				return &object.Null{}
 			},
 			HelpText: `update(data) - Feed data into the hash
@@ -131,9 +142,8 @@ Example:
 				if !ok {
 					return errors.NewError("invalid hash object")
 				}
-				h := hashConstructor(state.alg)()
-				h.Write(state.data)
-				return object.NewBytes(h.Sum(nil))
+				// Sum appends to nil without changing the running state.
+				return object.NewBytes(state.h.Sum(nil))
 			},
 			HelpText: `digest() - Return the raw hash as a Bytes value
 
@@ -153,9 +163,8 @@ Use hexdigest() for a lowercase-hex string representation.`,
 				if !ok {
 					return errors.NewError("invalid hash object")
 				}
-				h := hashConstructor(state.alg)()
-				h.Write(state.data)
-				return object.NewString(hex.EncodeToString(h.Sum(nil)))
+				var sum [sha256.Size]byte
+				return object.NewString(hex.EncodeToString(state.h.Sum(sum[:0])))
 			},
 			HelpText: `hexdigest() - Return the hash as a hexadecimal string
 
@@ -180,15 +189,13 @@ Example:
 				if !ok {
 					return errors.NewError("invalid hash object")
 				}
-				newData := make([]byte, len(state.data))
-				copy(newData, state.data)
 				// Build from inst.Class (a parameter) rather than the HashClass
 				// package var to avoid a package initialization cycle.
 				return object.NewInstanceWithData(inst.Class, map[string]object.Object{
 					"name":        object.NewString(state.alg),
 					"digest_size": object.NewInteger(int64(hashDigestSize(state.alg))),
 					"block_size":  object.NewInteger(int64(hashBlockSize(state.alg))),
-				}, &hashState{data: newData, alg: state.alg})
+				}, state.clone())
 			},
 			HelpText: `copy() - Return a copy of the hash object
 
@@ -200,11 +207,13 @@ Updates to one object do not affect the other.`,
 
 // newHashInstance builds a Hash instance wrapping the given algorithm and data.
 func newHashInstance(alg string, data []byte) *object.Instance {
+	h := hashConstructor(alg)()
+	h.Write(data)
 	return object.NewInstanceWithData(HashClass, map[string]object.Object{
 		"name":        object.NewString(alg),
 		"digest_size": object.NewInteger(int64(hashDigestSize(alg))),
 		"block_size":  object.NewInteger(int64(hashBlockSize(alg))),
-	}, &hashState{data: data, alg: alg})
+	}, &hashState{h: h, alg: alg})
 }
 
 // makeHashBuiltin builds a hashlib constructor builtin for the given algorithm.
@@ -7,8 +7,12 @@ import (
 
 	"github.com/paularlott/scriptling/errors"
 	"github.com/paularlott/scriptling/object"
+	"github.com/paularlott/scriptling/util"
 )
 
+// htmlEscapedChars are the characters html.EscapeString replaces.
+const htmlEscapedChars = `&'<>"`
+
 var HTMLLibrary = object.NewLibrary(HTMLLibraryName, map[string]*object.Builtin{
 	"escape": {
 		Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
@@ -19,7 +23,13 @@ var HTMLLibrary = object.NewLibrary(HTMLLibraryName, map[string]*object.Builtin{
 			if !ok {
 				return errors.NewTypeError("STRING", args[0].Type().String())
 			}
-			return object.NewString(html.EscapeString(str.StringValue()))
+			// Most text has nothing to escape; hand back the receiver rather
+			// than boxing a copy of it.
+			s := str.StringValue()
+			if strings.IndexAny(s, htmlEscapedChars) < 0 {
+				return str
+			}
+			return object.NewString(html.EscapeString(s))
 		},
 		HelpText: `escape(s) - Escape HTML special characters
 
@@ -44,11 +54,14 @@ Example:
 			if !ok {
 				return errors.NewTypeError("STRING", args[0].Type().String())
 			}
-			// html.UnescapeString handles standard HTML entities
-			result := html.UnescapeString(str.StringValue())
-			// Also handle numeric entities that Python handles
-			result = unescapeNumericEntities(result)
-			return object.NewString(result)
+			// Without an '&' there is nothing to decode, so hand back the
+			// receiver rather than a copy. UnescapeHTML decodes named and
+			// numeric (&#60;, &#x3c;) references in a single pass.
+			s := str.StringValue()
+			if strings.IndexByte(s, '&') < 0 {
+				return str
+			}
+			return object.NewString(util.UnescapeHTML(s))
 		},
 		HelpText: `unescape(s) - Unescape HTML entities
 
@@ -67,31 +80,3 @@ Example:
   print(text)  # "<script>"`,
 	},
 }, nil, "HTML escaping and unescaping library")
-
-// unescapeNumericEntities handles numeric character references
-// Go's html.UnescapeString already handles most cases, but we add
-// extra handling for completeness
-func unescapeNumericEntities(s string) string {
-	// Go's html.UnescapeString should handle most numeric entities
-	// This is a fallback for any edge cases
-	result := strings.Builder{}
-	i := 0
-	for i < len(s) {
-		if s[i] == '&' && i+2 < len(s) && s[i+1] == '#' {
-			// Find the end of the entity
-			end := i + 2
-			for end < len(s) && end < i+10 && s[end] != ';' {
-				end++
-			}
-			if end < len(s) && s[end] == ';' {
-				// Already handled by html.UnescapeString, just pass through
-				result.WriteString(s[i : end+1])
-				i = end + 1
-				continue
-			}
-		}
-		result.WriteByte(s[i])
-		i++
-	}
-	return result.String()
-}
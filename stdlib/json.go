@@ -13,11 +13,16 @@ func jsonLoads(ctx context.Context, kwargs object.Kwargs, args ...object.Object)
 	if len(args) != 1 {
 		return errors.NewError("wrong number of arguments. got=%d, want=1", len(args))
 	}
-	if args[0].Type() != object.STRING_OBJ {
-		return errors.NewError("argument to loads/parse must be STRING")
+	switch arg := args[0].(type) {
+	case *object.String:
+		return conversion.MustParseJSON(arg.StringValue())
+	case *object.Bytes:
+		// Like Python, accept raw bytes (e.g. response.content) and decode them
+		// directly rather than via an intermediate string.
+		return conversion.MustParseJSONBytes(arg.BytesValue())
+	default:
+		return errors.NewError("argument to loads/parse must be STRING or BYTES")
 	}
-	str, _ := args[0].AsString()
-	return conversion.MustParseJSON(str)
 }
 
 func jsonDumps(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
@@ -49,7 +54,7 @@ var JSONLibrary = object.NewLibrary(JSONLibraryName, map[string]*object.Builtin{
 		Fn: jsonLoads,
 		HelpText: `loads(json_string) - Parse JSON string
 
-Parses a JSON string and returns the corresponding Scriptling object.`,
+Parses a JSON string or bytes and returns the corresponding Scriptling object.`,
 	},
 	"dumps": {
 		Fn: jsonDumps,
@@ -9,6 +9,24 @@ import (
 	"github.com/paularlott/scriptling/object"
 )
 
+// distPoint returns the coordinates of a point passed to dist as objects. A 1D
+// FloatArray paired with a list or tuple is boxed here; two FloatArrays never
+// reach this path.
+func distPoint(obj object.Object) ([]object.Object, object.Object) {
+	switch p := obj.(type) {
+	case *object.List:
+		return p.Elements, nil
+	case *object.Tuple:
+		return p.Elements, nil
+	case *object.FloatArray:
+		if p.Is2D() {
+			return nil, errors.NewError("dist: expected 1D array, got 2D")
+		}
+		return p.ToList().Elements, nil
+	}
+	return nil, errors.NewTypeError("LIST", obj.Type().String())
+}
+
 // gcd calculates the greatest common divisor using Euclidean algorithm
 func gcd(a, b int64) int64 {
 	for b != 0 {
@@ -137,6 +155,27 @@ func twoFloatFunc(f func(float64, float64) float64) func(context.Context, object
 	}
 }
 
+// powFloat is math.Pow with a fast path for small non-negative integer
+// exponents, the common case in scripts (pow(x, 2), pow(1+rate, 10)). It
+// multiplies in the same order as math.Pow's own integer loop, so while the
+// result stays finite and normal it is bit-for-bit identical; anything else
+// (overflow, underflow, zero, NaN) is left to math.Pow.
+func powFloat(x, y float64) float64 {
+	if y >= 0 && y <= 64 && y == float64(int(y)) {
+		r, b := 1.0, x
+		for n := int(y); n != 0; n >>= 1 {
+			if n&1 == 1 {
+				r *= b
+			}
+			b *= b
+		}
+		if a := math.Abs(r); a >= 0x1p-1022 && a <= math.MaxFloat64 {
+			return r
+		}
+	}
+	return math.Pow(x, y)
+}
+
 // oneIntOrFloatFunc creates a math function that takes one int-or-float and returns an integer or boolean.
 // intFn is called for integers, floatFn for floats; both receive the value and return an object.Object.
 func oneIntOrFloatFunc(intFn func(*object.Integer) object.Object, floatFn func(*object.Float) object.Object) func(context.Context, object.Kwargs, ...object.Object) object.Object {
@@ -164,7 +203,7 @@ x must be a non-negative number (integer or float).
 Returns a float.`,
 	},
 	"pow": {
-		Fn: twoFloatFunc(math.Pow),
+		Fn: twoFloatFunc(powFloat),
 		HelpText: `pow(base, exp) - Return base raised to the power exp
 
 base and exp can be integers or floats.
@@ -853,26 +892,41 @@ Returns an integer for all-integer inputs, float otherwise.`,
 			if err := errors.ExactArgs(args, 2); err != nil {
 				return err
 			}
-			pList, ok := args[0].(*object.List)
-			if !ok {
-				return errors.NewTypeError("LIST", args[0].Type().String())
+			// Two 1D FloatArrays are already contiguous float64s; measure them
+			// directly instead of unboxing element by element.
+			if pa, ok := args[0].(*object.FloatArray); ok && !pa.Is2D() {
+				if qa, ok := args[1].(*object.FloatArray); ok && !qa.Is2D() {
+					if len(pa.Data) != len(qa.Data) {
+						return errors.NewError("dist: points must have the same dimension")
+					}
+					var sum float64
+					for i, p := range pa.Data {
+						d := p - qa.Data[i]
+						sum += d * d
+					}
+					return object.NewFloat(math.Sqrt(sum))
+				}
 			}
-			qList, ok := args[1].(*object.List)
-			if !ok {
-				return errors.NewTypeError("LIST", args[1].Type().String())
+			pElems, errObj := distPoint(args[0])
+			if errObj != nil {
+				return errObj
+			}
+			qElems, errObj := distPoint(args[1])
+			if errObj != nil {
+				return errObj
 			}
-			if len(pList.Elements) != len(qList.Elements) {
+			if len(pElems) != len(qElems) {
 				return errors.NewError("dist: points must have the same dimension")
 			}
 			var sum float64
-			for i := 0; i < len(pList.Elements); i++ {
-				p, err := pList.Elements[i].AsFloat()
+			for i := 0; i < len(pElems); i++ {
+				p, err := pElems[i].AsFloat()
 				if err != nil {
-					return errors.NewTypeError("INTEGER or FLOAT", pList.Elements[i].Type().String())
+					return errors.NewTypeError("INTEGER or FLOAT", pElems[i].Type().String())
 				}
-				q, err := qList.Elements[i].AsFloat()
+				q, err := qElems[i].AsFloat()
 				if err != nil {
-					return errors.NewTypeError("INTEGER or FLOAT", qList.Elements[i].Type().String())
+					return errors.NewTypeError("INTEGER or FLOAT", qElems[i].Type().String())
 				}
 				d := p - q
 				sum += d * d
@@ -881,7 +935,7 @@ Returns an integer for all-integer inputs, float otherwise.`,
 		},
 		HelpText: `dist(p, q) - Return the Euclidean distance between two points
 
-p and q must be lists of numbers with the same length.`,
+p and q must be lists, tuples or 1D FloatArrays of numbers with the same length.`,
 	},
 	"array": {
 		Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
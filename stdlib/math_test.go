@@ -36,6 +36,21 @@ func TestMathPow(t *testing.T) {
 	}
 }
 
+func TestMathPowIntegerExponentMatchesLibm(t *testing.T) {
+	bases := []float64{0, -0.0, 1.05, -2, 3.7, 1e-5, 123456.789, 1e300, 1e-300, math.Inf(1), math.NaN()}
+	for _, x := range bases {
+		for y := 0.0; y <= 64; y++ {
+			got, want := powFloat(x, y), math.Pow(x, y)
+			if got != want && !(math.IsNaN(got) && math.IsNaN(want)) {
+				t.Errorf("powFloat(%v, %v) = %v, want %v", x, y, got, want)
+			}
+		}
+	}
+	if got := powFloat(2, 0.5); got != math.Sqrt2 {
+		t.Errorf("powFloat(2, 0.5) = %v, want %v", got, math.Sqrt2)
+	}
+}
+
 func TestMathFabs(t *testing.T) {
 	lib := MathLibrary
 	fabs := lib.Functions()["fabs"]
@@ -885,6 +900,30 @@ func TestMathDist(t *testing.T) {
 	if _, ok := result.(*object.Error); !ok {
 		t.Errorf("dist with different dimensions should return error")
 	}
+
+	// Tuples and 1D FloatArrays, alone or mixed with lists
+	points := []struct {
+		name string
+		p, q object.Object
+	}{
+		{"tuples", &object.Tuple{Elements: []object.Object{object.NewInteger(0), object.NewInteger(0)}},
+			&object.Tuple{Elements: []object.Object{object.NewInteger(3), object.NewInteger(4)}}},
+		{"float arrays", object.NewFloatArray1D([]float64{1, 1}), object.NewFloatArray1D([]float64{4, 5})},
+		{"array and list", object.NewFloatArray1D([]float64{0, 0}),
+			&object.List{Elements: []object.Object{object.NewFloat(3.0), object.NewFloat(4.0)}}},
+	}
+	for _, tt := range points {
+		result = fn.Fn(context.Background(), object.NewKwargs(nil), tt.p, tt.q)
+		if f, ok := result.(*object.Float); !ok || f.FloatValue() != 5.0 {
+			t.Errorf("dist %s = %v, want 5.0", tt.name, result)
+		}
+	}
+
+	result = fn.Fn(context.Background(), object.NewKwargs(nil),
+		object.NewFloatArray1D([]float64{1}), object.NewFloatArray1D([]float64{1, 2}))
+	if _, ok := result.(*object.Error); !ok {
+		t.Errorf("dist with different FloatArray dimensions should return error")
+	}
 }
 
 func TestMathTau(t *testing.T) {
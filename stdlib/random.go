@@ -12,6 +12,10 @@ import (
 
 var rng *rand.Rand
 
+// maxRandomBatch caps k for randints() and randoms() so a script cannot ask
+// for a list too large to allocate.
+const maxRandomBatch = 1 << 24
+
 func init() {
 	rng = rand.New(rand.NewSource(time.Now().UnixNano()))
 }
@@ -45,6 +49,24 @@ func sampleGamma(alpha float64) float64 {
 }
 
 // gaussianRandom returns a random number from Gaussian distribution
+// randInSpan returns lo plus a uniform value in [0, span). A span of 0 stands
+// for the full 2^64 range, which wraps when computed as hi-lo+1.
+func randInSpan(lo int64, span uint64) int64 {
+	if span == 0 {
+		return int64(rng.Uint64())
+	}
+	if span <= math.MaxInt64 {
+		return lo + rng.Int63n(int64(span))
+	}
+	// Wider than Int63n can take: reject draws outside the span, which
+	// happens less than half the time.
+	v := rng.Uint64()
+	for v >= span {
+		v = rng.Uint64()
+	}
+	return int64(uint64(lo) + v)
+}
+
 func gaussianRandom(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
 	if err := errors.ExactArgs(args, 2); err != nil {
 		return err
@@ -135,6 +157,69 @@ Returns a random integer N such that min <= N <= max.`,
 		HelpText: `random() - Return random float
 
 Returns a random float in the range [0.0, 1.0).`,
+	},
+	"randints": {
+		Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+			if err := errors.ExactArgs(args, 3); err != nil {
+				return err
+			}
+			min, ok := args[0].(*object.Integer)
+			if !ok {
+				return errors.NewTypeError("INTEGER", args[0].Type().String())
+			}
+			max, ok := args[1].(*object.Integer)
+			if !ok {
+				return errors.NewTypeError("INTEGER", args[1].Type().String())
+			}
+			k, ok := args[2].(*object.Integer)
+			if !ok {
+				return errors.NewTypeError("INTEGER", args[2].Type().String())
+			}
+			lo, hi, n := min.IntValue(), max.IntValue(), k.IntValue()
+			if lo > hi {
+				return errors.NewError("randints() min must be <= max")
+			}
+			if n < 0 {
+				return errors.NewError("randints() k must be non-negative")
+			}
+			if n > maxRandomBatch {
+				return errors.NewError("randints() k must be at most %d", maxRandomBatch)
+			}
+			span := uint64(hi) - uint64(lo) + 1
+			result := make([]object.Object, n)
+			for i := range result {
+				result[i] = object.NewInteger(randInSpan(lo, span))
+			}
+			return &object.List{Elements: result}
+		},
+		HelpText: `randints(min, max, k) - Return a list of k random integers
+
+Each element is drawn as randint(min, max) would, in a single call.`,
+	},
+	"randoms": {
+		Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
+			if err := errors.ExactArgs(args, 1); err != nil {
+				return err
+			}
+			k, ok := args[0].(*object.Integer)
+			if !ok {
+				return errors.NewTypeError("INTEGER", args[0].Type().String())
+			}
+			if k.IntValue() < 0 {
+				return errors.NewError("randoms() k must be non-negative")
+			}
+			if k.IntValue() > maxRandomBatch {
+				return errors.NewError("randoms() k must be at most %d", maxRandomBatch)
+			}
+			result := make([]object.Object, k.IntValue())
+			for i := range result {
+				result[i] = object.NewFloat(rng.Float64())
+			}
+			return &object.List{Elements: result}
+		},
+		HelpText: `randoms(k) - Return a list of k random floats
+
+Each element is in the range [0.0, 1.0), as returned by random().`,
 	},
 	"choice": {
 		Fn: func(ctx context.Context, kwargs object.Kwargs, args ...object.Object) object.Object {
@@ -75,6 +75,70 @@ func TestRandomRandom(t *testing.T) {
 	}
 }
 
+func TestRandomRandintsAndRandoms(t *testing.T) {
+	ctx := context.Background()
+	kwargs := object.NewKwargs(nil)
+
+	result := randomFn("randints").Fn(ctx, kwargs, object.NewInteger(1), object.NewInteger(49), object.NewInteger(6))
+	list, ok := result.(*object.List)
+	if !ok || len(list.Elements) != 6 {
+		t.Fatalf("randints(1, 49, 6) = %v, want list of 6", result)
+	}
+	for _, el := range list.Elements {
+		if n := el.(*object.Integer).IntValue(); n < 1 || n > 49 {
+			t.Errorf("randints(1, 49, 6) element %d out of range", n)
+		}
+	}
+
+	result = randomFn("randoms").Fn(ctx, kwargs, object.NewInteger(5))
+	list, ok = result.(*object.List)
+	if !ok || len(list.Elements) != 5 {
+		t.Fatalf("randoms(5) = %v, want list of 5", result)
+	}
+	for _, el := range list.Elements {
+		if f := el.(*object.Float).FloatValue(); f < 0.0 || f >= 1.0 {
+			t.Errorf("randoms(5) element %v out of [0,1)", f)
+		}
+	}
+
+	if result := randomFn("randints").Fn(ctx, kwargs, object.NewInteger(10), object.NewInteger(1), object.NewInteger(3)); !object.IsError(result) {
+		t.Errorf("randints(10, 1, 3) should return error, got %T", result)
+	}
+	if result := randomFn("randoms").Fn(ctx, kwargs, object.NewInteger(-1)); !object.IsError(result) {
+		t.Errorf("randoms(-1) should return error, got %T", result)
+	}
+	if result := randomFn("randints").Fn(ctx, kwargs, object.NewInteger(1), object.NewInteger(2), object.NewInteger(math.MaxInt64)); !object.IsError(result) {
+		t.Errorf("randints(1, 2, MaxInt64) should return error, got %T", result)
+	}
+	if result := randomFn("randoms").Fn(ctx, kwargs, object.NewInteger(math.MaxInt64)); !object.IsError(result) {
+		t.Errorf("randoms(MaxInt64) should return error, got %T", result)
+	}
+}
+
+func TestRandomRandintsWideRange(t *testing.T) {
+	ctx := context.Background()
+	kwargs := object.NewKwargs(nil)
+
+	ranges := [][2]int64{
+		{math.MinInt64, math.MaxInt64},
+		{math.MinInt64, 0},
+		{-1, math.MaxInt64},
+		{math.MaxInt64 - 1, math.MaxInt64},
+	}
+	for _, r := range ranges {
+		result := randomFn("randints").Fn(ctx, kwargs, object.NewInteger(r[0]), object.NewInteger(r[1]), object.NewInteger(100))
+		list, ok := result.(*object.List)
+		if !ok || len(list.Elements) != 100 {
+			t.Fatalf("randints(%d, %d, 100) = %v, want list of 100", r[0], r[1], result)
+		}
+		for _, el := range list.Elements {
+			if n := el.(*object.Integer).IntValue(); n < r[0] || n > r[1] {
+				t.Errorf("randints(%d, %d, 100) element %d out of range", r[0], r[1], n)
+			}
+		}
+	}
+}
+
 func TestRandomChoiceList(t *testing.T) {
 	fn := randomFn("choice")
 	ctx := context.Background()
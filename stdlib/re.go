@@ -7,6 +7,7 @@ import (
 	"regexp"
 	"strings"
 	"sync"
+	"sync/atomic"
 	"time"
 
 	"github.com/paularlott/scriptling/errors"
@@ -37,14 +38,14 @@ var RegexClass = &object.Class{
 				pattern := regex.Field("pattern").(*object.String).StringValue()
 				text, _ := args[1].AsString()
 
-				re, err := GetCompiledRegex(pattern)
+				re, err := getAnchoredRegex(pattern, false)
 				if err != nil {
 					return errors.NewError("regex compile error: %s", err.Error())
 				}
 
-				// Check if pattern matches at the beginning of text
+				// Only a match at the beginning of text counts
 				match := re.FindStringSubmatchIndex(text)
-				if match == nil || match[0] != 0 {
+				if match == nil {
 					return &object.Null{}
 				}
 
@@ -163,16 +164,7 @@ If there are no capturing groups, returns a list of strings for the full matches
 				allMatches := re.FindAllStringSubmatchIndex(text, -1)
 				elements := make([]object.Object, len(allMatches))
 				for i, match := range allMatches {
-					// Build groups from submatch indices
-					groups := make([]string, 0)
-					for j := 0; j < len(match); j += 2 {
-						if match[j] >= 0 && match[j+1] >= 0 {
-							groups = append(groups, text[match[j]:match[j+1]])
-						} else {
-							groups = append(groups, "")
-						}
-					}
-					elements[i] = createMatchInstance(groups, match[0], match[1])
+					elements[i] = createMatchInstance(groupsFromIndices(text, match), match[0], match[1])
 				}
 				return &object.List{Elements: elements}
 			},
@@ -321,7 +313,7 @@ type regexEntry struct {
 	pattern  string
 	regex    *regexp.Regexp
 	element  *list.Element
-	lastUsed time.Time
+	lastUsed atomic.Int64 // UnixNano; written on hits under the read lock
 }
 
 type regexCache struct {
@@ -372,16 +364,44 @@ func groupsFromIndices(text string, match []int) []string {
 	return groups
 }
 
-// GetCompiledRegex retrieves a compiled regex from cache or compiles and caches it
+// getAnchoredRegex returns pattern compiled so that it can only match at the
+// start of the text, and with full set only as the whole text. Searching with
+// the unanchored form and then discarding a match found further along scans
+// the rest of a long string for nothing; the anchored form gives up at the
+// first position. It also lets fullmatch find a full-length match that is not
+// the leftmost-first one, as Python does for re.fullmatch("a|ab", "ab").
+// Compile errors are reported against the caller's pattern.
+func getAnchoredRegex(pattern string, full bool) (*regexp.Regexp, error) {
+	anchored := `\A(?:` + pattern + `)`
+	if full {
+		anchored += `\z`
+	}
+	re, err := GetCompiledRegex(anchored)
+	if err != nil {
+		if _, perr := GetCompiledRegex(pattern); perr != nil {
+			err = perr
+		}
+		return nil, err
+	}
+	return re, nil
+}
+
+// GetCompiledRegex retrieves a compiled regex from cache or compiles and caches it.
+// A hit stays under the read lock unless the entry has to move to the front of
+// the LRU list, so a pattern used repeatedly in a loop (or by a compiled Regex
+// object) never takes the exclusive lock.
 func GetCompiledRegex(pattern string) (*regexp.Regexp, error) {
 	globalRegexCache.mu.RLock()
 	if entry, ok := globalRegexCache.entries[pattern]; ok {
-		// Move to front (most recently used)
+		atFront := globalRegexCache.lru.Front() == entry.element
 		globalRegexCache.mu.RUnlock()
-		globalRegexCache.mu.Lock()
-		globalRegexCache.lru.MoveToFront(entry.element)
-		entry.lastUsed = time.Now()
-		globalRegexCache.mu.Unlock()
+		entry.lastUsed.Store(time.Now().UnixNano())
+		if !atFront {
+			// Move to front (most recently used)
+			globalRegexCache.mu.Lock()
+			globalRegexCache.lru.MoveToFront(entry.element)
+			globalRegexCache.mu.Unlock()
+		}
 		return entry.regex, nil
 	}
 	globalRegexCache.mu.RUnlock()
@@ -400,7 +420,6 @@ func GetCompiledRegex(pattern string) (*regexp.Regexp, error) {
 		return entry.regex, nil
 	}
 
-	// Evict old entries if cache is full
 	// Evict old entries if cache is full
 	for len(globalRegexCache.entries) >= globalRegexCache.maxSize {
 		if !globalRegexCache.evictOldest() {
@@ -410,10 +429,10 @@ func GetCompiledRegex(pattern string) (*regexp.Regexp, error) {
 
 	// Add new entry at front
 	entry := &regexEntry{
-		pattern:  pattern,
-		regex:    re,
-		lastUsed: time.Now(),
+		pattern: pattern,
+		regex:   re,
 	}
+	entry.lastUsed.Store(time.Now().UnixNano())
 	elem := globalRegexCache.lru.PushFront(entry)
 	entry.element = elem
 	globalRegexCache.entries[pattern] = entry
@@ -430,7 +449,7 @@ func (c *regexCache) evictOldest() bool {
 	entry := elem.Value.(*regexEntry)
 
 	// Check if entry is recent (used within last 3 seconds)
-	if time.Since(entry.lastUsed) < 3*time.Second {
+	if time.Since(time.Unix(0, entry.lastUsed.Load())) < 3*time.Second {
 		return false // Don't evict recent entries
 	}
 
@@ -469,28 +488,18 @@ var ReLibrary = object.NewLibrary(ReLibraryName, map[string]*object.Builtin{
 			}
 			pattern = applyFlags(pattern, flags)
 
-			re, err := GetCompiledRegex(pattern)
+			re, err := getAnchoredRegex(pattern, false)
 			if err != nil {
 				return errors.NewError("regex compile error: %s", err.Error())
 			}
 
-			// Check if pattern matches at the beginning of text
+			// Only a match at the beginning of text counts
 			match := re.FindStringSubmatchIndex(text)
-			if match == nil || match[0] != 0 {
+			if match == nil {
 				return &object.Null{}
 			}
 
-			// Build groups from submatch indices
-			groups := make([]string, 0)
-			for i := 0; i < len(match); i += 2 {
-				if match[i] >= 0 && match[i+1] >= 0 {
-					groups = append(groups, text[match[i]:match[i+1]])
-				} else {
-					groups = append(groups, "")
-				}
-			}
-
-			return createMatchInstance(groups, match[0], match[1])
+			return createMatchInstance(groupsFromIndices(text, match), match[0], match[1])
 		},
 		HelpText: `match(pattern, string, flags=0) - Match pattern at start of string
 
@@ -536,17 +545,7 @@ Flags:
 				return &object.Null{}
 			}
 
-			// Build groups from submatch indices
-			groups := make([]string, 0)
-			for i := 0; i < len(match); i += 2 {
-				if match[i] >= 0 && match[i+1] >= 0 {
-					groups = append(groups, text[match[i]:match[i+1]])
-				} else {
-					groups = append(groups, "")
-				}
-			}
-
-			return createMatchInstance(groups, match[0], match[1])
+			return createMatchInstance(groupsFromIndices(text, match), match[0], match[1])
 		},
 		HelpText: `search(pattern, string, flags=0) - Search for pattern anywhere in string
 
@@ -919,28 +918,18 @@ Returns a string with all special regex characters escaped.`,
 			}
 			pattern = applyFlags(pattern, flags)
 
-			re, err := GetCompiledRegex(pattern)
+			re, err := getAnchoredRegex(pattern, true)
 			if err != nil {
 				return errors.NewError("regex compile error: %s", err.Error())
 			}
 
-			// Check if the entire string matches
+			// Only a match spanning the entire string counts
 			match := re.FindStringSubmatchIndex(text)
-			if match == nil || match[0] != 0 || match[1] != len(text) {
+			if match == nil {
 				return &object.Null{}
 			}
 
-			// Build groups from submatch indices (same as match/search)
-			groups := make([]string, 0)
-			for i := 0; i < len(match); i += 2 {
-				if match[i] >= 0 && match[i+1] >= 0 {
-					groups = append(groups, text[match[i]:match[i+1]])
-				} else {
-					groups = append(groups, "")
-				}
-			}
-
-			return createMatchInstance(groups, match[0], match[1])
+			return createMatchInstance(groupsFromIndices(text, match), match[0], match[1])
 		},
 		HelpText: `fullmatch(pattern, string, flags=0) - Match entire string
 
@@ -2,6 +2,7 @@ package stdlib
 
 import (
 	"context"
+	"strings"
 	"testing"
 
 	"github.com/paularlott/scriptling/object"
@@ -335,6 +336,37 @@ func TestRegexFullmatch(t *testing.T) {
 	} else {
 		t.Errorf("fullmatch('(\\\\d+)-(\\\\d+)', '123-456') should return Match, got %T", result)
 	}
+
+	// The full-length alternative wins even though "a" is the leftmost-first match
+	result = fullmatch.Fn(context.Background(), object.NewKwargs(nil), object.NewString("a|ab"), object.NewString("ab"))
+	if match, ok := result.(*object.Instance); !ok || match.Field("end").(*object.Integer).IntValue() != 2 {
+		t.Errorf("fullmatch('a|ab', 'ab') should match the whole string, got %v", result)
+	}
+}
+
+func TestRegexMatchAnchoredAtStart(t *testing.T) {
+	match := ReLibrary.Functions()["match"]
+	text := object.NewString(strings.Repeat("x", 1000) + "123")
+	result := match.Fn(context.Background(), object.NewKwargs(nil), object.NewString("[0-9]+"), text)
+	if _, ok := result.(*object.Null); !ok {
+		t.Errorf("match() past the start returned %T, want Null", result)
+	}
+
+	regex := ReLibrary.Functions()["compile"].Fn(context.Background(), object.NewKwargs(nil), object.NewString("(x+)1"))
+	method := RegexClass.Methods["match"].(*object.Builtin)
+	result = method.Fn(context.Background(), object.NewKwargs(nil), regex, text)
+	m, ok := result.(*object.Instance)
+	if !ok {
+		t.Fatalf("Regex.match() returned %T, want Match instance", result)
+	}
+	if end := m.Field("end").(*object.Integer).IntValue(); end != 1001 {
+		t.Errorf("Regex.match() end = %d, want 1001", end)
+	}
+
+	result = match.Fn(context.Background(), object.NewKwargs(nil), object.NewString("[0-9"), text)
+	if err, ok := result.(*object.Error); !ok || strings.Contains(err.Message, `\A`) {
+		t.Errorf("match() with invalid pattern should report the caller's pattern, got %v", result)
+	}
 }
 
 func TestRegexConstants(t *testing.T) {
@@ -367,3 +399,26 @@ func TestRegexConstants(t *testing.T) {
 		}
 	}
 }
+
+func TestGetCompiledRegexCacheHit(t *testing.T) {
+	first, err := GetCompiledRegex(`cache-hit-[a-z]+`)
+	if err != nil {
+		t.Fatalf("compile: %v", err)
+	}
+	// Push another pattern in front so the next hit has to move the entry
+	if _, err := GetCompiledRegex(`cache-hit-other`); err != nil {
+		t.Fatalf("compile: %v", err)
+	}
+	for i := 0; i < 3; i++ {
+		again, err := GetCompiledRegex(`cache-hit-[a-z]+`)
+		if err != nil {
+			t.Fatalf("cached lookup: %v", err)
+		}
+		if again != first {
+			t.Fatalf("lookup %d returned a recompiled regex", i)
+		}
+	}
+	if _, err := GetCompiledRegex(`(`); err == nil {
+		t.Error("expected an error for an invalid pattern")
+	}
+}
@@ -259,6 +259,39 @@ func TestHashlibLibrary(t *testing.T) {
 	}
 }
 
+func TestHashlibUpdateAndCopy(t *testing.T) {
+	ctx := context.Background()
+	call := func(inst *object.Instance, method string, args ...object.Object) object.Object {
+		fn := HashClass.Methods[method].(*object.Builtin)
+		return fn.Fn(ctx, object.NewKwargs(nil), append([]object.Object{inst}, args...)...)
+	}
+	hexOf := func(inst *object.Instance) string {
+		s, _ := call(inst, "hexdigest").AsString()
+		return s
+	}
+
+	h := HashlibLibrary.Functions()["sha256"].Fn(ctx, object.NewKwargs(nil), object.NewString("foo")).(*object.Instance)
+	call(h, "update", object.NewString("bar"))
+	const foobar = "c3ab8ff13720e8ad9047dd39466b3c8974e592c2fa383d4a3960714caef0c4f2"
+	if got := hexOf(h); got != foobar {
+		t.Errorf("sha256 foo+bar = %s, want %s", got, foobar)
+	}
+	// Taking a digest must not disturb the running state
+	if got := hexOf(h); got != foobar {
+		t.Errorf("second hexdigest = %s, want %s", got, foobar)
+	}
+
+	c := call(h, "copy").(*object.Instance)
+	call(c, "update", object.NewString("baz"))
+	if got := hexOf(h); got != foobar {
+		t.Errorf("original changed after updating copy: %s", got)
+	}
+	const foobarbaz = "97df3588b5a3f24babc3851b372f0ba71a9dcdded43b14b9d06961bfc1707d9d"
+	if got := hexOf(c); got != foobarbaz {
+		t.Errorf("copy sha256 foo+bar+baz = %s, want %s", got, foobarbaz)
+	}
+}
+
 func TestHmacLibrary(t *testing.T) {
 	ctx := context.Background()
 
@@ -320,3 +353,82 @@ func TestHmacLibrary(t *testing.T) {
 		t.Errorf("hmac.new with unknown algorithm should error, got %v", r.Type())
 	}
 }
+
+func TestJSONLoadsBytes(t *testing.T) {
+	loads := JSONLibrary.Functions()["loads"].Fn
+	result := loads(context.Background(), object.NewKwargs(nil), object.NewBytes([]byte(`{"ok": true, "result": [1, 2]}`)))
+	dict, ok := result.(*object.Dict)
+	if !ok {
+		t.Fatalf("loads(bytes) returned %T (%v), want dict", result, result)
+	}
+	pair, ok := dict.GetByString("result")
+	if !ok {
+		t.Fatal("loads(bytes) result missing key \"result\"")
+	}
+	if list, ok := pair.Value.(*object.List); !ok || len(list.Elements) != 2 {
+		t.Errorf("loads(bytes)[\"result\"] = %v, want two-element list", pair.Value)
+	}
+
+	if result := loads(context.Background(), object.NewKwargs(nil), object.NewInteger(1)); !object.IsError(result) {
+		t.Errorf("loads(int) = %v, want error", result)
+	}
+}
+
+func TestJSONLoadsValues(t *testing.T) {
+	loads := JSONLibrary.Functions()["loads"].Fn
+	input := `{"s": "a\"bé", "u": "héllo", "i": -42, "big": 12345678901234567890, "f": 2.5e3, "huge": 1e400, "n": null, "b": [true, false]}`
+	result := loads(context.Background(), object.NewKwargs(nil), object.NewString(input))
+	dict, ok := result.(*object.Dict)
+	if !ok {
+		t.Fatalf("loads returned %T (%v), want dict", result, result)
+	}
+
+	expected := map[string]string{
+		"s":    `a"bé`,
+		"u":    "héllo",
+		"i":    "-42",
+		"big":  "1.2345678901234567e+19",
+		"f":    "2500",
+		"huge": "1e400",
+		"n":    "None",
+		"b":    "[true, false]",
+	}
+	for key, want := range expected {
+		pair, ok := dict.GetByString(key)
+		if !ok {
+			t.Errorf("loads result missing key %q", key)
+			continue
+		}
+		if got := pair.Value.Inspect(); got != want {
+			t.Errorf("loads[%q] = %s, want %s", key, got, want)
+		}
+	}
+
+	for _, bad := range []string{`{"a": 1,}`, `[1 2]`, `01`, `"\x01"`} {
+		if result := loads(context.Background(), object.NewKwargs(nil), object.NewString(bad)); !object.IsError(result) {
+			t.Errorf("loads(%q) = %v, want error", bad, result)
+		}
+	}
+}
+
+func TestHTMLEscapeRoundTrip(t *testing.T) {
+	ctx := context.Background()
+	escape := HTMLLibrary.Functions()["escape"].Fn
+	unescape := HTMLLibrary.Functions()["unescape"].Fn
+
+	plain := object.NewString("nothing to see here")
+	if got := escape(ctx, object.NewKwargs(nil), plain); got != plain {
+		t.Errorf("escape() of plain text should return its argument, got %v", got)
+	}
+
+	src := `<script>alert('xss') & "more"</script>`
+	escaped := escape(ctx, object.NewKwargs(nil), object.NewString(src)).(*object.String)
+	want := "&lt;script&gt;alert(&#39;xss&#39;) &amp; &#34;more&#34;&lt;/script&gt;"
+	if escaped.StringValue() != want {
+		t.Errorf("escape() = %q, want %q", escaped.StringValue(), want)
+	}
+	back := unescape(ctx, object.NewKwargs(nil), escaped).(*object.String)
+	if back.StringValue() != src {
+		t.Errorf("unescape(escape(s)) = %q, want %q", back.StringValue(), src)
+	}
+}
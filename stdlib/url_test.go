@@ -25,6 +25,30 @@ func TestURLLibrary(t *testing.T) {
 		}
 	})
 
+	t.Run("quote reserved and non-ascii", func(t *testing.T) {
+		quote := lib.Functions()["quote"]
+		tests := []struct {
+			in, safe, want string
+		}{
+			{"plain-text_1.0~", "", "plain-text_1.0~"},
+			{"a/b?c#d", "", "a%2Fb%3Fc%23d"},
+			{"a/b?c", "/", "a/b%3Fc"},
+			{"k=v&x+y:z@$", "", "k=v&x+y:z@$"},
+			{"café 日", "", "caf%C3%A9%20%E6%97%A5"},
+			{"café", "é", "café"},
+		}
+		for _, tt := range tests {
+			args := []object.Object{object.NewString(tt.in)}
+			if tt.safe != "" {
+				args = append(args, object.NewString(tt.safe))
+			}
+			result := quote.Fn(context.Background(), object.NewKwargs(nil), args...)
+			if str, ok := result.(*object.String); !ok || str.StringValue() != tt.want {
+				t.Errorf("quote(%q, %q) = %v, want %q", tt.in, tt.safe, result, tt.want)
+			}
+		}
+	})
+
 	t.Run("unquote basic", func(t *testing.T) {
 		unquote := lib.Functions()["unquote"]
 		result := unquote.Fn(context.Background(), object.NewKwargs(nil), object.NewString("hello%20world"))
@@ -246,6 +270,21 @@ func TestURLLibrary(t *testing.T) {
 		}
 	})
 
+	t.Run("urlencode escaping and order", func(t *testing.T) {
+		urlencode := lib.Functions()["urlencode"]
+		pairs := &object.List{Elements: []object.Object{
+			&object.Tuple{Elements: []object.Object{object.NewString("b"), object.NewString("x y")}},
+			&object.Tuple{Elements: []object.Object{object.NewString("a"), object.NewString("1&2=3")}},
+			&object.Tuple{Elements: []object.Object{object.NewString("b"), object.NewString("é/~")}},
+		}}
+		result := urlencode.Fn(context.Background(), object.NewKwargs(nil), pairs)
+
+		want := "a=1%262%3D3&b=x+y&b=%C3%A9%2F~"
+		if str, ok := result.(*object.String); !ok || str.StringValue() != want {
+			t.Errorf("urlencode = %v, want %q", result, want)
+		}
+	})
+
 	t.Run("urlencode with list values", func(t *testing.T) {
 		urlencode := lib.Functions()["urlencode"]
 		dict := object.NewStringDict(map[string]object.Object{
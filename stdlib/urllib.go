@@ -3,7 +3,9 @@ package stdlib
 import (
 	"context"
 	"net/url"
+	"sort"
 	"strings"
+	"unicode/utf8"
 
 	"github.com/paularlott/scriptling/errors"
 	"github.com/paularlott/scriptling/object"
@@ -504,10 +506,10 @@ Parses a URL query string and returns a list of (key, value) tuples.`,
 				return err
 			}
 
-			values := make(url.Values)
-
+			var pairs []queryPair
 			switch arg := args[0].(type) {
 			case *object.Dict:
+				pairs = make([]queryPair, 0, len(arg.Pairs))
 				for _, pair := range arg.Pairs {
 					keyStr, keyErr := pair.Key.AsString()
 					if keyErr != nil {
@@ -515,24 +517,22 @@ Parses a URL query string and returns a list of (key, value) tuples.`,
 					}
 					switch val := pair.Value.(type) {
 					case *object.String:
-						values[keyStr] = []string{val.StringValue()}
+						pairs = append(pairs, queryPair{keyStr, val.StringValue()})
 					case *object.List:
-						strVals := make([]string, len(val.Elements))
-						for i, elem := range val.Elements {
-							if str, err := elem.AsString(); err == nil {
-								strVals[i] = str
-							}
+						for _, elem := range val.Elements {
+							str, _ := elem.AsString()
+							pairs = append(pairs, queryPair{keyStr, str})
 						}
-						values[keyStr] = strVals
 					}
 				}
 			case *object.List:
 				// List of (key, value) tuples
+				pairs = make([]queryPair, 0, len(arg.Elements))
 				for _, elem := range arg.Elements {
 					if tuple, ok := elem.(*object.Tuple); ok && len(tuple.Elements) == 2 {
 						if key, err := tuple.Elements[0].AsString(); err == nil {
 							if val, err := tuple.Elements[1].AsString(); err == nil {
-								values.Add(key, val)
+								pairs = append(pairs, queryPair{key, val})
 							}
 						}
 					}
@@ -541,7 +541,7 @@ Parses a URL query string and returns a list of (key, value) tuples.`,
 				return errors.NewTypeError("DICT or LIST", args[0].Type().String())
 			}
 
-			return object.NewString(values.Encode())
+			return object.NewString(encodeQuery(pairs))
 		},
 		HelpText: `urlencode(query, doseq=False) - Encode dictionary as query string
 
@@ -552,18 +552,89 @@ Encodes a dictionary or list of tuples into a URL query string.`,
 // URLLibrary is the parent urllib module - registered so `import urllib` works
 var URLLibLibrary = object.NewLibrary(URLLibLibraryName, nil, nil, "URL handling modules")
 
-// urlQuote encodes a string for URL, with optional safe characters
+// queryPair is one key=value item of a query string being encoded.
+type queryPair struct {
+	key, value string
+}
+
+// encodeQuery builds a query string from pairs in a single buffer. The output
+// matches url.Values.Encode — keys sorted, values of a key in their original
+// order — without building the intermediate map and per-key slices.
+func encodeQuery(pairs []queryPair) string {
+	sort.SliceStable(pairs, func(i, j int) bool { return pairs[i].key < pairs[j].key })
+
+	size := 0
+	for _, p := range pairs {
+		size += len(p.key) + len(p.value) + 2
+	}
+	buf := make([]byte, 0, size)
+	for i, p := range pairs {
+		if i > 0 {
+			buf = append(buf, '&')
+		}
+		buf = appendQueryEscape(buf, p.key)
+		buf = append(buf, '=')
+		buf = appendQueryEscape(buf, p.value)
+	}
+	return string(buf)
+}
+
+// appendQueryEscape appends s escaped exactly as url.QueryEscape would.
+func appendQueryEscape(buf []byte, s string) []byte {
+	const hex = "0123456789ABCDEF"
+	for i := 0; i < len(s); i++ {
+		c := s[i]
+		switch {
+		case 'a' <= c && c <= 'z', 'A' <= c && c <= 'Z', '0' <= c && c <= '9',
+			c == '-', c == '_', c == '.', c == '~':
+			buf = append(buf, c)
+		case c == ' ':
+			buf = append(buf, '+')
+		default:
+			buf = append(buf, '%', hex[c>>4], hex[c&15])
+		}
+	}
+	return buf
+}
+
+// urlQuote encodes a string for URL, with optional safe characters. The
+// output is what escaping each rune with url.PathEscape gives, built in one
+// buffer; a string with nothing to encode is returned as-is.
 func urlQuote(s string, safe string) string {
-	var result strings.Builder
-	for _, c := range s {
-		if (c >= 'A' && c <= 'Z') || (c >= 'a' && c <= 'z') || (c >= '0' && c <= '9') ||
-			c == '-' || c == '_' || c == '.' || c == '~' || strings.ContainsRune(safe, c) {
-			result.WriteRune(c)
-		} else if c == ' ' {
-			result.WriteString("%20")
-		} else {
-			result.WriteString(url.PathEscape(string(c)))
+	i := 0
+	for i < len(s) && s[i] < utf8.RuneSelf && quoteKeepsByte(s[i], safe) {
+		i++
+	}
+	if i == len(s) {
+		return s
+	}
+
+	const hex = "0123456789ABCDEF"
+	buf := make([]byte, i, len(s)+16)
+	copy(buf, s[:i])
+	for _, c := range s[i:] {
+		switch {
+		case c < utf8.RuneSelf && quoteKeepsByte(byte(c), safe):
+			buf = append(buf, byte(c))
+		case c == ' ':
+			buf = append(buf, "%20"...)
+		case c == '$', c == '&', c == '+', c == ':', c == '=', c == '@':
+			// Reserved characters url.PathEscape leaves alone
+			buf = append(buf, byte(c))
+		case c >= utf8.RuneSelf && strings.ContainsRune(safe, c):
+			buf = utf8.AppendRune(buf, c)
+		default:
+			var enc [utf8.UTFMax]byte
+			for _, b := range enc[:utf8.EncodeRune(enc[:], c)] {
+				buf = append(buf, '%', hex[b>>4], hex[b&15])
+			}
 		}
 	}
-	return result.String()
+	return string(buf)
+}
+
+// quoteKeepsByte reports whether urlQuote copies the ASCII byte c unencoded.
+func quoteKeepsByte(c byte, safe string) bool {
+	return (c >= 'A' && c <= 'Z') || (c >= 'a' && c <= 'z') || (c >= '0' && c <= '9') ||
+		c == '-' || c == '_' || c == '.' || c == '~' || strings.IndexByte(safe, c) >= 0
 }
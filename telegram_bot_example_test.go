@@ -0,0 +1,138 @@
+package scriptling_test
+
+import (
+	"testing"
+
+	"github.com/paularlott/scriptling"
+	"github.com/paularlott/scriptling/extlibs"
+	"github.com/paularlott/scriptling/libloader"
+	"github.com/paularlott/scriptling/stdlib"
+)
+
+// newTelegramExample returns an interpreter that can import the telegram
+// package shipped in examples/telegram-bot.
+func newTelegramExample(t *testing.T) *scriptling.Scriptling {
+	t.Helper()
+	p := scriptling.New()
+	stdlib.RegisterAll(p)
+	extlibs.RegisterRequestsLibrary(p)
+	extlibs.RegisterLoggingLibraryDefault(p)
+	p.SetLibraryLoader(libloader.NewFilesystem("examples/telegram-bot"))
+	return p
+}
+
+func TestTelegramBotCallbackLongestPrefixWins(t *testing.T) {
+	p := newTelegramExample(t)
+
+	script := `
+import telegram.bot
+
+hits = []
+
+def on_menu(bot, query):
+    hits.append("menu_")
+
+def on_menu_sub(bot, query):
+    hits.append("menu_sub_")
+
+def on_opt(bot, query):
+    hits.append("opt_")
+
+def dispatch(b, data):
+    b.handle_update({"callback_query": {"data": data}})
+
+# The shorter prefix is registered first, so it is already indexed on its
+# token when the longer prefix arrives.
+b = telegram.bot.New("token")
+b.callback("menu_", on_menu)
+b.callback("menu_sub_", on_menu_sub)
+b.callback("opt_", on_opt)
+dispatch(b, "menu_sub_x")
+dispatch(b, "menu_x")
+dispatch(b, "opt_1")
+dispatch(b, "other")
+
+# Registration order must not matter.
+b = telegram.bot.New("token")
+b.callback("menu_sub_", on_menu_sub)
+b.callback("menu_", on_menu)
+dispatch(b, "menu_sub_y")
+dispatch(b, "menu_y")
+
+result = ",".join(hits)
+`
+	if _, err := p.Eval(script); err != nil {
+		t.Fatalf("Eval failed: %v", err)
+	}
+
+	got, objErr := p.GetVarAsString("result")
+	if objErr != nil {
+		t.Fatalf("result is not a string: %v", objErr)
+	}
+	want := "menu_sub_,menu_,opt_,menu_sub_,menu_"
+	if got != want {
+		t.Errorf("dispatch order = %q, want %q", got, want)
+	}
+}
+
+func TestTelegramBotCommandSplitsOnAnyWhitespace(t *testing.T) {
+	p := newTelegramExample(t)
+
+	script := `
+import telegram.bot
+
+seen = []
+
+def on_echo(cmd):
+    seen.append(cmd.command + ":" + "|".join(cmd.args))
+
+b = telegram.bot.New("token")
+b.command("/echo", on_echo)
+for text in ["/echo\targ", "/echo  a  b", "/ECHO\nx y", "/echo"]:
+    b.handle_update({"message": {"text": text, "chat": {"id": 1}}})
+
+result = ",".join(seen)
+`
+	if _, err := p.Eval(script); err != nil {
+		t.Fatalf("Eval failed: %v", err)
+	}
+
+	got, objErr := p.GetVarAsString("result")
+	if objErr != nil {
+		t.Fatalf("result is not a string: %v", objErr)
+	}
+	want := "/echo:arg,/echo:a|b,/echo:x|y,/echo:"
+	if got != want {
+		t.Errorf("parsed commands = %q, want %q", got, want)
+	}
+}
+
+func TestTelegramSendMessageManyRejectsBadRate(t *testing.T) {
+	p := newTelegramExample(t)
+
+	script := `
+import telegram
+
+bot = telegram.Bot("token")
+errors = []
+for rate in [0, -1]:
+    try:
+        bot.send_message_many([1, 2], "hi", rate=rate)
+    except ValueError as e:
+        errors.append(str(e))
+
+result = "|".join(errors)
+`
+	if _, err := p.Eval(script); err != nil {
+		t.Fatalf("Eval failed: %v", err)
+	}
+
+	got, objErr := p.GetVarAsString("result")
+	if objErr != nil {
+		t.Fatalf("result is not a string: %v", objErr)
+	}
+	want := "rate must be at least 1, got 0|rate must be at least 1, got -1"
+	if got != want {
+		t.Errorf("errors = %q, want %q", got, want)
+	}
+}
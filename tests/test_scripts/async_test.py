@@ -29,13 +29,18 @@ def worker_multi(idx, x, y):
     runtime.sync.Atomic(f"multi_{idx}").set(x + y)
     runtime.sync.WaitGroup("bg_wg2").done()
 
+# Bind the handles used inside the loops once, rather than resolving
+# runtime.sync.* and runtime.background on every iteration
+atomic = runtime.sync.Atomic
+background = runtime.background
+wg2 = runtime.sync.WaitGroup("bg_wg2")
 for i in range(5):
-    runtime.sync.Atomic(f"multi_{i}", initial=0)
-    runtime.sync.WaitGroup("bg_wg2").add(1)
-    runtime.background(f"worker_multi_{i}", "worker_multi", i, i, i+1)
+    atomic(f"multi_{i}", initial=0)
+    wg2.add(1)
+    background(f"worker_multi_{i}", "worker_multi", i, i, i+1)
 
-runtime.sync.WaitGroup("bg_wg2").wait()
-results = [runtime.sync.Atomic(f"multi_{i}").get() for i in range(5)]
+wg2.wait()
+results = [atomic(f"multi_{i}").get() for i in range(5)]
 print(f"Multiple async results: {results}")
 assert results == [1, 3, 5, 7, 9], f"Multiple async failed, got {results}"
 
@@ -52,11 +57,12 @@ def increment():
     runtime.sync.Atomic("test_counter").add(1)
     runtime.sync.WaitGroup("bg_wg3").done()
 
+wg3 = runtime.sync.WaitGroup("bg_wg3")
 for i in range(10):
-    runtime.sync.WaitGroup("bg_wg3").add(1)
-    runtime.background(f"increment_{i}", "increment")
+    wg3.add(1)
+    background(f"increment_{i}", "increment")
 
-runtime.sync.WaitGroup("bg_wg3").wait()
+wg3.wait()
 final_count = counter.get()
 print(f"Final counter after 10 increments: {final_count}")
 assert final_count == 10, f"Atomic counter failed, got {final_count}"
@@ -94,9 +100,10 @@ def worker_wg(id):
     runtime.sync.Atomic("wg_counter").add(1)
     runtime.sync.WaitGroup("test_wg").done()
 
+wg_add = wg.add
 for i in range(5):
-    wg.add(1)
-    runtime.background(f"worker_wg_{i}", "worker_wg", i)
+    wg_add(1)
+    background(f"worker_wg_{i}", "worker_wg", i)
 
 wg.wait()
 print(f"WaitGroup completed, counter: {wg_counter.get()}")
@@ -110,23 +117,16 @@ runtime.sync.WaitGroup("queue_wg")
 
 def queue_consumer():
     import scriptling.runtime as runtime
-    q = runtime.sync.Queue("test_queue")
+    get = runtime.sync.Queue("test_queue").get
     total = 0
-    total = total + q.get()
-    total = total + q.get()
-    total = total + q.get()
-    total = total + q.get()
-    total = total + q.get()
+    for i in range(5):
+        total = total + get()
     runtime.sync.Atomic("queue_total").set(total)
     runtime.sync.WaitGroup("queue_wg").done()
 
 runtime.sync.WaitGroup("queue_wg").add(1)
 runtime.background("consumer1", "queue_consumer")
-queue.put(10)
-queue.put(20)
-queue.put(30)
-queue.put(40)
-queue.put(50)
+queue.put_many([10, 20, 30, 40, 50])
 runtime.sync.WaitGroup("queue_wg").wait()
 
 total = runtime.sync.Atomic("queue_total").get()
@@ -9,3 +9,10 @@ assert encoded == "SGVsbG8sIFdvcmxkIQ=="
 decoded = base64.b64decode(encoded)
 assert decoded.decode() == "Hello, World!"
 assert decoded == bytes("Hello, World!")
+
+# Decoding also accepts the encoded form as bytes
+assert base64.b64decode(bytes(encoded)) == decoded
+
+# Empty input round-trips
+assert base64.b64encode("") == ""
+assert base64.b64decode("") == bytes("")
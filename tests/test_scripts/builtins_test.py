@@ -1,23 +1,17 @@
 # Test builtin functions
 
 # Test hex(), bin(), oct() builtins
-assert hex(255) == "0xff"
-assert hex(16) == "0x10"
-assert hex(0) == "0x0"
-assert hex(-255) == "-0xff"
-assert hex(1000) == "0x3e8"
-
-assert bin(10) == "0b1010"
-assert bin(255) == "0b11111111"
-assert bin(0) == "0b0"
-assert bin(-10) == "-0b1010"
-assert bin(1) == "0b1"
-
-assert oct(8) == "0o10"
-assert oct(64) == "0o100"
-assert oct(0) == "0o0"
-assert oct(-8) == "-0o10"
-assert oct(255) == "0o377"
+RADIX_CASES = [
+    (hex, 255, "0xff"), (hex, 16, "0x10"), (hex, 0, "0x0"),
+    (hex, -255, "-0xff"), (hex, 1000, "0x3e8"),
+    (bin, 10, "0b1010"), (bin, 255, "0b11111111"), (bin, 0, "0b0"),
+    (bin, -10, "-0b1010"), (bin, 1, "0b1"),
+    (oct, 8, "0o10"), (oct, 64, "0o100"), (oct, 0, "0o0"),
+    (oct, -8, "-0o10"), (oct, 255, "0o377"),
+]
+for fn, value, expected in RADIX_CASES:
+    result = fn(value)
+    assert result == expected, f"{value} -> {result}, want {expected}"
 
 # Test enumerate
 items = ["a", "b", "c"]
@@ -117,35 +111,22 @@ id2 = id(x)
 assert type(id1) == "INTEGER"
 
 # Test format
-result = format(42)
-assert result == "42"
-
-result = format(42, "d")
-assert result == "42"
-
-result = format(255, "x")
-assert result == "ff"
-
-result = format(255, "X")
-assert result == "FF"
-
-result = format(8, "b")
-assert result == "1000"
-
-result = format(3.14159, ".2f")
-assert result == "3.14"
-
-result = format(0.5, "%")
-assert result == "50.00%"
-
-result = format("hello", ">10")
-assert result == "     hello"
-
-result = format("hello", "<10")
-assert result == "hello     "
-
-result = format("hello", "^11")
-assert result == "   hello   "
+assert format(42) == "42"
+
+FORMAT_CASES = [
+    (42, "d", "42"),
+    (255, "x", "ff"),
+    (255, "X", "FF"),
+    (8, "b", "1000"),
+    (3.14159, ".2f", "3.14"),
+    (0.5, "%", "50.00%"),
+    ("hello", ">10", "     hello"),
+    ("hello", "<10", "hello     "),
+    ("hello", "^11", "   hello   "),
+]
+for value, spec, expected in FORMAT_CASES:
+    result = format(value, spec)
+    assert result == expected, f"format({value}, {spec}) -> {result}"
 
 # Test hasattr, getattr, setattr with dict
 d = {"name": "Alice", "age": 30}
@@ -1,68 +1,55 @@
-def is_leap_year(year):
-    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
-
-def days_in_month(year, month):
-    days = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-    if month == 2 and is_leap_year(year):
-        return 29
-    return days[month - 1]
-
-import datetime
-import time
+MONTH_NAMES = ("", "January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December")
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+# Per-month offsets for Sakamoto's day-of-week algorithm
+WEEKDAY_OFFSETS = (0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4)
 
 def is_leap_year(year):
     return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
 
 def days_in_month(year, month):
-    days = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
     if month == 2 and is_leap_year(year):
         return 29
-    return days[month - 1]
+    return DAYS_IN_MONTH[month - 1]
 
 def generate_calendar(year, month):
-    month_names = ["", "January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"]
-    month_name = month_names[month] + " " + str(year)
-    header = month_name
+    header = MONTH_NAMES[month] + " " + str(year)
     days_header = "Mo Tu We Th Fr Sa Su"
 
     calendar_lines = [header, "", days_header, ""]
 
-    if month < 10:
-        month_str = "0" + str(month)
-    else:
-        month_str = str(month)
-    first_of_month = str(year) + "-" + month_str + "-01"
-    first_timestamp = datetime.datetime.strptime(first_of_month, "%Y-%m-%d")
-    first_time_tuple = time.localtime(first_timestamp)
-    start_weekday = (first_time_tuple[6] + 6) % 7
+    # Weekday of the 1st (Sakamoto: Sunday=0), shifted so Monday=0
+    y = year
+    if month < 3:
+        y -= 1
+    sunday_based = (y + y // 4 - y // 100 + y // 400 + WEEKDAY_OFFSETS[month - 1] + 1) % 7
+    start_weekday = (sunday_based + 6) % 7
 
     day = 1
     num_days = days_in_month(year, month)
 
-    week_line = ""
+    # Right-aligned day cells, built once and indexed instead of
+    # concatenated per cell
+    cells = [f"{d:2d} " for d in range(num_days + 1)]
+    blank = "   "
+
+    week_parts = []
     for i in range(7):
         if i < start_weekday:
-            week_line += "   "
+            week_parts.append(blank)
         else:
-            if day < 10:
-                week_line += " " + str(day) + " "
-            else:
-                week_line += str(day) + " "
+            week_parts.append(cells[day])
             day += 1
-    calendar_lines.append(week_line.rstrip())
+    calendar_lines.append("".join(week_parts).rstrip())
 
     while day <= num_days:
-        week_line = ""
+        week_parts = []
         for i in range(7):
             if day <= num_days:
-                if day < 10:
-                    week_line += " " + str(day) + " "
-                else:
-                    week_line += str(day) + " "
+                week_parts.append(cells[day])
                 day += 1
             else:
-                week_line += "   "
-        calendar_lines.append(week_line.rstrip())
+                week_parts.append(blank)
+        calendar_lines.append("".join(week_parts).rstrip())
 
     return "\n".join(calendar_lines)
 
@@ -79,4 +66,8 @@ calendar = generate_calendar(year, month)
 print(calendar)
 print("\nCalendar generated successfully!")
 
-assert True
\ No newline at end of file
+# February 2026 starts on a Sunday
+lines = calendar.split("\n")
+assert lines[0] == "February 2026"
+assert lines[4] == " " * 19 + "1"
+assert lines[5] == " 2  3  4  5  6  7  8"
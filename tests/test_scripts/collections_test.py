@@ -14,6 +14,16 @@ assert c["h"] == 1
 assert c["e"] == 1
 assert c["o"] == 1
 
+c = collections.Counter("mississippi")
+assert c["s"] == 4 and c["i"] == 4 and c["p"] == 2 and c["m"] == 1
+assert c.most_common(1)[0][1] == 4
+
+c = collections.Counter("héllo wörld")
+assert c["l"] == 3
+assert c["é"] == 1
+assert c["ö"] == 1
+assert c[" "] == 1
+
 # Test most_common
 c = collections.Counter([1, 1, 2, 3, 3, 3])
 mc = collections.most_common(c, 2)
@@ -67,6 +77,19 @@ collections.deque_rotate(d, -1)
 assert d[0] == 2
 assert d[3] == 1
 
+d = collections.deque([1, 2, 3, 4, 5])
+collections.deque_rotate(d, 7)
+assert d == [4, 5, 1, 2, 3]
+
+# Repeated appendleft/popleft keep order
+d = collections.deque([])
+for i in range(5):
+    collections.deque_appendleft(d, i)
+assert d == [4, 3, 2, 1, 0]
+assert collections.deque_popleft(d) == 4
+collections.deque_appendleft(d, 9)
+assert d == [9, 3, 2, 1, 0]
+
 # Test namedtuple
 Point = collections.namedtuple("Point", ["x", "y"])
 p = Point(1, 2)
@@ -19,6 +19,19 @@ else:
     grade = "F"
 assert grade == "C"
 
+# The same ladder at each boundary, and with a non-integer score
+grades = []
+for score in [100, 90, 89, 80, 79.5, 70, 69, -1]:
+    if score >= 90:
+        grades.append("A")
+    elif score >= 80:
+        grades.append("B")
+    elif score >= 70:
+        grades.append("C")
+    else:
+        grades.append("F")
+assert grades == ["A", "A", "B", "B", "C", "C", "F", "F"]
+
 # Nested if
 msg = ""
 a = 10
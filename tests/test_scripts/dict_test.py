@@ -21,6 +21,13 @@ d1.update(d2)
 assert d1["b"] == 20
 assert d1["c"] == 3
 
+# Updating an empty dict copies, it does not alias
+empty = {}
+empty.update(d2)
+empty["c"] = 30
+assert empty == {"b": 20, "c": 30}
+assert d2 == {"b": 20, "c": 3}
+
 d = {"a": 1, "b": 2}
 d.clear()
 assert len(d.keys()) == 0
@@ -53,6 +60,13 @@ assert "a" in d
 assert "b" in d
 assert "c" in d
 
+d = {}.fromkeys("héllo", 1)
+assert d == {"h": 1, "é": 1, "l": 1, "o": 1}
+
+# dict() from pairs and keywords together
+d = dict([("a", 1), ("b", 2)], c=3)
+assert d == {"a": 1, "b": 2, "c": 3}
+
 d = {"a": {"b": {"c": 1}}, "x": [1, 2, {"y": 3}]}
 assert d["a"]["b"]["c"] == 1
 assert d["x"][2]["y"] == 3
\ No newline at end of file
@@ -35,4 +35,13 @@ assert empty == []
 all_pass = list(filter(lambda x: True, [1, 2, 3]))
 assert all_pass == [1, 2, 3]
 
+# Predicate sees every element in order
+seen = []
+def record(x):
+    seen.append(x)
+    return x % 3 == 0
+
+assert list(filter(record, range(7))) == [0, 3, 6]
+assert seen == [0, 1, 2, 3, 4, 5, 6]
+
 print("All filter() tests passed!")
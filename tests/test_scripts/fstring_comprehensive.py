@@ -73,4 +73,19 @@ large_num = 12345
 large_format = f"{large_num:02d}"
 assert large_format == "12345"  # width smaller than number
 
+neg = -5
+assert f"{neg:04d}" == "-005"
+big_neg = -12345
+assert f"{big_neg:03d}" == "-12345"
+flag = True
+assert f"{flag:03d}" == "001"
+off = False
+assert f"{flag:x}" == "1"
+assert f"{off:.2f}" == "0.00"
+assert f"{flag:>3}" == "  1"
+
+# Specs are parsed once per literal, so repeated evaluation must stay correct
+stamps = [f"{h:02d}:{m:02d}" for h, m in [(9, 5), (23, 59), (0, 0)]]
+assert stamps == ["09:05", "23:59", "00:00"]
+
 True
\ No newline at end of file
@@ -55,3 +55,13 @@ def concat(a, b):
 
 result = functools.reduce(concat, ["a", "b", "c"])
 assert result == "abc"
+
+# Each step gets its own arguments, even when the reducer keeps them
+def gather(acc, *items):
+    return acc + [items]
+
+result = functools.reduce(gather, [1, 2, 3], [])
+assert result == [[1], [2], [3]]
+
+# Builtin reducer
+assert functools.reduce(max, [3, 8, 2]) == 8
@@ -15,6 +15,8 @@ assert html.unescape("&quot;") == '"'
 assert html.unescape("&#34;") == '"'
 assert html.unescape("&#x27;") == "'"
 assert html.unescape("&#39;") == "'"
+assert html.unescape("&#60;b&#x3e; &amp;&amp; plain") == "<b> && plain"
+assert html.unescape("no entities here") == "no entities here"
 
 # Test roundtrip
 assert html.unescape(html.escape("<script>")) == "<script>"
@@ -67,6 +69,62 @@ assert len(parser2.attrs[0][1]) == 2
 assert parser2.attrs[0][1][0] == ("href", "https://example.com")
 assert parser2.attrs[0][1][1] == ("class", "link")
 
+# '>' and the other quote character inside a quoted value do not end the tag
+quoted = AttrParser()
+quoted.feed('<img alt="a > b" title=\'say "hi"\'><br id=">">')
+assert quoted.attrs[0] == ("img", [("alt", "a > b"), ("title", 'say "hi"')])
+assert quoted.attrs[1] == ("br", [("id", ">")])
+
+
+# Test 2b: Character references reported to handlers instead of converted
+class RefParser(HTMLParser):
+    def __init__(self):
+        self.convert_charrefs = False
+        self.refs = []
+        self.data = []
+
+    def handle_entityref(self, name):
+        self.refs.append(("entity", name))
+
+    def handle_charref(self, name):
+        self.refs.append(("char", name))
+
+    def handle_data(self, data):
+        self.data.append(data)
+
+parser3 = RefParser()
+parser3.feed("<p>x &; a &amp; b &#62; c</p>")
+assert parser3.refs == [("entity", "amp"), ("char", "62")]
+assert "".join(parser3.data) == "x &; a  b  c"
+
+# Plain text with no handle_data override is skipped without error
+class EndOnly(HTMLParser):
+    def __init__(self):
+        self.ends = []
+
+    def handle_endtag(self, tag):
+        self.ends.append(tag)
+
+parser4 = EndOnly()
+parser4.feed("<div>" + "lorem ipsum &amp; dolor " * 50 + "</div>")
+assert parser4.ends == ["div"]
+
+# Start tags nobody handles still update get_starttag_text()
+parser4.feed('<a href="x" class="y">link</a>')
+assert parser4.ends == ["div", "a"]
+assert parser4.get_starttag_text() == '<a href="x" class="y">'
+
+# Self-closing tags still reach handle_endtag via the default handle_startendtag
+parser4.feed('<br/><img src="x" />')
+assert parser4.ends == ["div", "a", "br", "img"]
+
+# Every attribute tuple is independent
+many = AttrParser()
+many.feed('<p a="1" b="2" c="3">')
+assert many.attrs[0] == ("p", [("a", "1"), ("b", "2"), ("c", "3")])
+assert many.attrs[0][1][1][0] == "b"
+assert len(many.attrs[0][1][2]) == 2
+
 
 # Test 3: Various import combinations to prevent state pollution
 import html.parser as hp1
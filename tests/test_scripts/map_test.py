@@ -35,4 +35,10 @@ assert list(result) == [2, 3, 4]
 empty = list(map(lambda x: x, []))
 assert empty == []
 
+# Each call gets its own arguments, even when the function keeps them
+def gather(*items):
+    return items
+
+assert list(map(gather, [1, 2], [3, 4])) == [[1, 3], [2, 4]]
+
 print("All map() tests passed!")
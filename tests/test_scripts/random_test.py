@@ -44,6 +44,14 @@ for i in range(10):
     n = random.randint(1, 10)
     assert n >= 1 and n <= 10
 
+# Test batched randints / randoms
+lottery = random.randints(1, 49, 6)
+assert len(lottery) == 6
+for n in lottery:
+    assert n >= 1 and n <= 49
+for f in random.randoms(5):
+    assert f >= 0.0 and f < 1.0
+
 # Test uniform range
 for i in range(10):
     f = random.uniform(0.0, 1.0)
@@ -140,6 +140,14 @@ assert len(lines) == 2 and lines[0] == 'hello' and lines[1] == 'world'
 single_lines = "single".splitlines()
 assert len(single_lines) == 1 and single_lines[0] == 'single'
 
+# Test split(None, maxsplit) - whitespace runs, remainder keeps its inner spacing
+assert "/cmd\targ  x".split(None, 1) == ["/cmd", "arg  x"]
+assert "  a  b  c  ".split(None, 1) == ["a", "b  c  "]
+assert "  a  b  c  ".split(None) == ["a", "b", "c"]
+assert "a b".split(None, 0) == ["a b"]
+assert "/cmd".split(None, 1) == ["/cmd"]
+assert "   ".split(None, 1) == []
+
 # Test swapcase()
 assert "Hello World".swapcase() == "hELLO wORLD"
 assert "UPPER".swapcase() == "upper"
@@ -0,0 +1,53 @@
+package util
+
+import (
+	"html"
+	"strings"
+)
+
+// UnescapeHTML decodes HTML character references like html.UnescapeString.
+//
+// The five references that make up nearly all real-world escaping (&amp;,
+// &lt;, &gt;, &quot; and &#39;) are decoded inline without touching the full
+// entity table. Any other reference hands the whole string to
+// html.UnescapeString, so the result is always identical to it.
+func UnescapeHTML(s string) string {
+	i := strings.IndexByte(s, '&')
+	if i < 0 {
+		return s
+	}
+	original := s
+	var b strings.Builder
+	b.Grow(len(s))
+	for i >= 0 {
+		b.WriteString(s[:i])
+		s = s[i:]
+		n, c := commonEntity(s)
+		if n == 0 {
+			return html.UnescapeString(original)
+		}
+		b.WriteByte(c)
+		s = s[n:]
+		i = strings.IndexByte(s, '&')
+	}
+	b.WriteString(s)
+	return b.String()
+}
+
+// commonEntity reports the length and decoded byte of a common reference at
+// the start of s, or 0 if s starts with any other reference.
+func commonEntity(s string) (int, byte) {
+	switch {
+	case strings.HasPrefix(s, "&amp;"):
+		return 5, '&'
+	case strings.HasPrefix(s, "&lt;"):
+		return 4, '<'
+	case strings.HasPrefix(s, "&gt;"):
+		return 4, '>'
+	case strings.HasPrefix(s, "&quot;"):
+		return 6, '"'
+	case strings.HasPrefix(s, "&#39;"):
+		return 5, '\''
+	}
+	return 0, 0
+}
@@ -0,0 +1,28 @@
+package util
+
+import (
+	"html"
+	"testing"
+)
+
+func TestUnescapeHTMLMatchesStandardLibrary(t *testing.T) {
+	inputs := []string{
+		"",
+		"plain text",
+		"&lt;script&gt;alert(&#39;xss&#39;)&lt;/script&gt;",
+		"Tom &amp; Jerry say &quot;hi&quot;",
+		"&amp;lt; stays escaped once",
+		"trailing &",
+		"&amp",
+		"&ltx &gt",
+		"&copy; 2024 &mdash; &#x3c;&#60;",
+		"&lt;&eacute;&gt;",
+		"&#39",
+		"&unknown; &amp;",
+	}
+	for _, in := range inputs {
+		if got, want := UnescapeHTML(in), html.UnescapeString(in); got != want {
+			t.Errorf("UnescapeHTML(%q) = %q, want %q", in, got, want)
+		}
+	}
+}